@@ -0,0 +1,54 @@
+import argparse
+import pathlib
+import sys
+
+from .suite import (
+    BASELINE,
+    DEFAULT_MIN_TIME,
+    DEFAULT_THRESHOLD,
+    compare,
+    load_baseline,
+    run,
+    save_baseline,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("names", nargs="*", help="cases to run, all by default")
+    parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--baseline", default=str(BASELINE))
+    parser.add_argument("--save", action="store_true", help="store results as baseline")
+    args = parser.parse_args()
+
+    results = run(names=args.names, min_time=args.min_time)
+    baseline = load_baseline(path=pathlib.Path(args.baseline))
+    regressions = compare(results=results, baseline=baseline, threshold=args.threshold)
+
+    print(
+        f"{'case':<28}{'items/sec':>14}{'usec/call':>12}{'peak KiB':>10}{'vs base':>10}"
+    )
+    for name, result in results.items():
+        before = baseline.get(name, {}).get("usec_per_call")
+        ratio = f"{result['usec_per_call'] / before:.2f}x" if before else "-"
+        mark = " !" if name in regressions else ""
+        print(
+            f"{name:<28}{result['items_per_sec']:>14.0f}"
+            f"{result['usec_per_call']:>12.1f}{result['peak_kib']:>10.1f}"
+            f"{ratio:>10}{mark}"
+        )
+
+    if args.save:
+        save_baseline(results=results, path=pathlib.Path(args.baseline))
+        return 0
+
+    for name, ratios in regressions.items():
+        details = ", ".join(f"{key} {ratio:.2f}x" for key, ratio in ratios.items())
+        print(f"regression: {name} ({details})", file=sys.stderr)
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+"""
+Bytes per object and construction time of model variants.
+
+    $ python -m benchmarks.bench_models
+"""
+
+import gc
+import pathlib
+import time
+import tracemalloc
+import typing as ty
+
+from finavis.core.parsers import quote_parser
+from finavis.library import Numeric, Quote
+from finavis.utils import parse_document
+
+FIXTURES: pathlib.Path = pathlib.Path(__file__).parent.parent / "tests" / "fixtures"
+
+MODES: ty.Tuple[ty.Tuple[str, ty.Any, Numeric], ...] = (
+    ("Quote/decimal", Quote, Numeric.DECIMAL),
+    ("Quote/float", Quote, Numeric.FLOAT),
+    ("CompactQuote/decimal", Quote.compact(), Numeric.DECIMAL),
+    ("CompactQuote/float", Quote.compact(), Numeric.FLOAT),
+    ("FrozenQuote/float", Quote.compact(frozen=True), Numeric.FLOAT),
+)
+
+
+def measure(model: ty.Any, numeric: Numeric, number: int) -> ty.Dict[str, float]:
+    """Bytes per object and microseconds per construction"""
+
+    raw: ty.Dict[str, ty.Any] = quote_parser.parse(
+        raw=parse_document(text=(FIXTURES / "quote.html").read_text())
+    )
+
+    started_at: float = time.perf_counter()
+    for _ in range(number):
+        model.from_response(raw=raw, numeric=numeric)
+    elapsed: float = time.perf_counter() - started_at
+
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    items = [model.from_response(raw=raw, numeric=numeric) for _ in range(number)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert len(items) == number
+    return dict(
+        bytes_per_object=(after - before) / number,
+        usec_per_object=elapsed / number * 1e6,
+    )
+
+
+def run(number: int = 2000) -> ty.Dict[str, ty.Dict[str, float]]:
+    return {name: measure(model, numeric, number) for name, model, numeric in MODES}
+
+
+if __name__ == "__main__":
+    print(f"{'mode':<24}{'bytes/object':>16}{'usec/object':>16}")
+    for name, result in run().items():
+        print(
+            f"{name:<24}{result['bytes_per_object']:>16.0f}"
+            f"{result['usec_per_object']:>16.1f}"
+        )
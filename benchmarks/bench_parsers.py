@@ -0,0 +1,96 @@
+"""
+Quote page parsing on saved page, w/o network, w/ cssselect walk of
+previous parser as reference.
+
+    $ python -m benchmarks.bench_parsers
+"""
+
+import pathlib
+import time
+import typing as ty
+
+from finavis.core.quote import parse_quote
+from finavis.library import Quote
+from finavis.utils import parse_document, text_to_label
+
+if ty.TYPE_CHECKING:
+    from lxml.html import HtmlElement
+
+FIXTURES: pathlib.Path = pathlib.Path(__file__).parent.parent / "tests" / "fixtures"
+
+
+def measure(func: ty.Callable[[], ty.Any], number: int) -> float:
+    """Microseconds per call"""
+
+    started_at: float = time.perf_counter()
+    for _ in range(number):
+        func()
+    return (time.perf_counter() - started_at) / number * 1e6
+
+
+def parse_legacy_quote(raw: "HtmlElement") -> ty.Dict[str, ty.Any]:
+    """Raw data of quote by cssselect walk of `parse_quote` before `QuoteParser`"""
+
+    data: ty.Dict[str, ty.Any] = dict()
+    title: "HtmlElement" = raw.cssselect('div[class="fv-container py-2.5"]')[0]
+
+    ticker = title.cssselect(
+        'h1[class="js-recent-quote-ticker quote-header_ticker-wrapper_ticker"]'
+    )[0].text_content()
+    data["ticker"] = str(ticker).strip()
+
+    try:
+        company = title.cssselect(
+            'h2[class="quote-header_ticker-wrapper_company text-xl"]'
+        )[0]
+    except IndexError:
+        company = title.cssselect('h2[class="quote-header_ticker-wrapper_company"]')[0]
+
+    data["company"] = company.text_content().strip()
+
+    website = company.cssselect('a[class="tab-link block truncate"]')[0].attrib["href"]
+    if str(website).startswith("http"):
+        data["website"] = website
+
+    keys = ["Sector", "Industry", "Country", "Exchange"]
+    fields = [f.text_content() for f in title.cssselect('a[class="tab-link"]')]
+    for key, value in zip(keys, fields):
+        data[key.lower()] = value
+
+    for rows in raw.cssselect('tr[class="table-dark-row"]'):
+        rows = rows.xpath("td")
+        for index in range(0, 11, 2):
+            field_label, field_data = rows[index], rows[index + 1]
+
+            name: str = field_label.text_content().strip()
+            label: str = ty.cast(str, text_to_label(value=name))
+            if label in data.keys() and name == "EPS next Y":
+                name = "EPS growth next Y"
+                label = ty.cast(str, text_to_label(value=name))
+
+            value: ty.Optional[str] = field_data.text_content().strip()
+            data[label] = value if value != "-" else None
+
+    return data
+
+
+def run(number: int = 2000) -> ty.Dict[str, float]:
+    text: str = (FIXTURES / "quote.html").read_text()
+    document = parse_document(text=text)
+
+    return {
+        "parse_document": measure(lambda: parse_document(text=text), number),
+        "parse_quote": measure(lambda: parse_quote(raw=document), number),
+        "parse_quote_legacy": measure(
+            lambda: Quote.from_response(raw=parse_legacy_quote(raw=document)), number
+        ),
+        "document+quote": measure(
+            lambda: parse_quote(raw=parse_document(text=text)), number
+        ),
+    }
+
+
+if __name__ == "__main__":
+    print(f"{'step':<24}{'usec/page':>16}")
+    for name, usec in run().items():
+        print(f"{name:<24}{usec:>16.1f}")
@@ -0,0 +1,61 @@
+"""Offline client for benchmarks and tests, responses are made by handler"""
+
+import typing as ty
+from urllib.parse import parse_qs, urlparse
+
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter
+
+from finavis.utils import Client, ConcurrencyController, RateLimiter
+
+Handler = ty.Callable[..., ty.Tuple[ty.Any, ...]]
+
+
+class FakeAdapter(BaseAdapter):
+    """
+    Adapter w/o network, `handler(path, query_params, headers=...)` returns
+    `(status_code, body[, headers])`, requested URLs are kept in `calls`.
+    """
+
+    def __init__(self, handler: ty.Optional[Handler] = None) -> None:
+        super().__init__()
+        self.handler: Handler = handler or (lambda *args, **kwargs: (200, "<p>ok</p>"))
+        self.calls: ty.List[str] = list()
+
+    def send(self, request: PreparedRequest, **kwargs: ty.Any) -> Response:  # type: ignore[override]
+        self.calls.append(str(request.url))
+
+        url = urlparse(str(request.url))
+        query_params = {k: v[0] for k, v in parse_qs(url.query).items()}
+        status_code, body, *rest = self.handler(
+            url.path, query_params, headers=dict(request.headers)
+        )
+
+        response = Response()
+        response.status_code = status_code
+        response.reason = "Not Found" if status_code == 404 else "OK"
+        response._content = body.encode()
+        response._content_consumed = True  # type: ignore[attr-defined]
+        response.encoding = "utf-8"
+        response.headers.update(rest[0] if rest else {})
+        response.url = str(request.url)
+        response.request = request
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def make_client(
+    handler: ty.Optional[Handler] = None, **kwargs: ty.Any
+) -> ty.Tuple[Client, FakeAdapter]:
+    """Client w/o network and w/o practical rate and concurrency limits"""
+
+    client = Client(
+        rate_limiter=RateLimiter(rate=10_000, burst=10_000),
+        controller=ConcurrencyController(limit=32),
+        **kwargs,
+    )
+    adapter = FakeAdapter(handler=handler)
+    client.session.mount("https://", adapter)
+    return client, adapter
@@ -0,0 +1,234 @@
+"""
+Benchmark suite on checked-in fixtures, w/o network.
+
+Every case reports throughput (items per second), time per call and peak
+traced memory per call. Results are compared to stored baseline, case is a
+regression if it is slower or takes more memory than `threshold` allows.
+
+    $ python -m benchmarks
+    $ python -m benchmarks --save
+"""
+
+import gc
+import io
+import json
+import pathlib
+import time
+import tracemalloc
+import typing as ty
+
+from finavis.core.parsers import SNAPSHOT_LABELS, ScreenerRowParser, quote_parser
+from finavis.core.quote import parse_quote
+from finavis.core.screener import Screener
+from finavis.library import CsvSink, NdjsonSink, Overview, Quote
+from finavis.utils import (
+    DEFAULT_CHUNK_SIZE,
+    parse_document,
+    text_to_decimal,
+    text_to_label,
+)
+
+from .fakes import make_client
+
+FIXTURES: pathlib.Path = pathlib.Path(__file__).parent.parent / "tests" / "fixtures"
+BASELINE: pathlib.Path = pathlib.Path(__file__).parent / "baseline.json"
+
+DEFAULT_MIN_TIME: float = 0.2
+DEFAULT_REPEAT: int = 5
+DEFAULT_THRESHOLD: float = 0.3
+
+Result = ty.Dict[str, float]
+
+
+class Case(ty.NamedTuple):
+    """Named callable, `items` is number of objects handled per call"""
+
+    name: str
+    func: ty.Callable[[], ty.Any]
+    items: int = 1
+
+
+def get_cases() -> ty.List[Case]:
+    """All cases of suite, fixtures are read once, every screener page is fixture"""
+
+    quote_text: str = (FIXTURES / "quote.html").read_text()
+    quote_document = parse_document(text=quote_text)
+    quote_raw: ty.Dict[str, ty.Any] = quote_parser.parse(raw=quote_document)
+    screener_text: str = (FIXTURES / "screener.html").read_text()
+    screener_document = parse_document(text=screener_text)
+
+    screener: Screener = Screener()
+    rows: ty.List[ty.Tuple[ty.Optional[str], ...]] = list(
+        screener._get_rows(raw=screener_document)
+    )
+    screener._set_total(raw=screener_document)
+    overview: ty.Dict[str, ty.Any] = dict(zip(Overview.__annotations__.keys(), rows[0]))
+    overviews: ty.List[ty.Dict[str, ty.Any]] = [overview] * len(rows)
+
+    def handler(path: str, query_params: ty.Dict[str, str], **kwargs: ty.Any) -> ty.Any:
+        return 200, screener_text
+
+    client, _ = make_client(handler=handler)
+
+    def stream_rows() -> int:
+        parser: ScreenerRowParser = ScreenerRowParser()
+        count: int = 0
+        for index in range(0, len(screener_text), DEFAULT_CHUNK_SIZE):
+            count += len(parser.feed(screener_text[index : index + DEFAULT_CHUNK_SIZE]))
+        return count + len(parser.close())
+
+    objects: ty.List[Overview] = Overview.from_responses(rows=overviews)
+
+    def write_sink(klass: ty.Type[ty.Any]) -> int:
+        with klass(io.StringIO()) as sink:
+            return sink.write_all(objects)
+
+    lazy_quote: ty.Any = Quote.lazy()
+
+    def read_lazy_quote(raw: ty.Dict[str, ty.Any]) -> ty.Any:
+        quote: ty.Any = lazy_quote.from_response(raw=raw)
+        return quote.price, quote.change, quote.volume
+
+    def iterate_screener() -> int:
+        return sum(1 for _ in Screener(client=client).iter())
+
+    return [
+        Case("parse_document/quote", lambda: parse_document(text=quote_text)),
+        Case("quote_parser", lambda: quote_parser.parse(raw=quote_document)),
+        Case("parse_quote", lambda: parse_quote(raw=quote_document)),
+        Case(
+            "document+quote", lambda: parse_quote(raw=parse_document(text=quote_text))
+        ),
+        Case(
+            "screener_rows",
+            lambda: list(screener._get_rows(raw=screener_document)),
+            items=len(rows),
+        ),
+        Case(
+            "screener_page",
+            lambda: list(screener._get_rows(raw=parse_document(text=screener_text))),
+            items=len(rows),
+        ),
+        Case("screener_page/stream", stream_rows, items=len(rows)),
+        Case(
+            "screener_overview",
+            lambda: screener._get_objects(rows=rows),
+            items=len(rows),
+        ),
+        Case("Quote.from_response", lambda: Quote.from_response(raw=quote_raw)),
+        Case("LazyQuote.from_response+3", lambda: read_lazy_quote(quote_raw)),
+        Case("Overview.from_response", lambda: Overview.from_response(raw=overview)),
+        Case(
+            "Overview.from_responses",
+            lambda: Overview.from_responses(rows=overviews),
+            items=len(overviews),
+        ),
+        Case(
+            "text_to_label",
+            lambda: [text_to_label(value=name) for name in SNAPSHOT_LABELS],
+            items=len(SNAPSHOT_LABELS),
+        ),
+        Case("csv_sink", lambda: write_sink(CsvSink), items=len(objects)),
+        Case("ndjson_sink", lambda: write_sink(NdjsonSink), items=len(objects)),
+        Case("text_to_decimal", lambda: text_to_decimal(value="2823.46B")),
+        Case("screener_iter", iterate_screener, items=screener.total),
+    ]
+
+
+def measure(
+    case: Case,
+    min_time: float = DEFAULT_MIN_TIME,
+    repeat: int = DEFAULT_REPEAT,
+) -> Result:
+    """Best of `repeat` timings of at least `min_time` each, and peak memory"""
+
+    number: int = 1
+    while timing(func=case.func, number=number) < min_time:
+        number *= 2
+
+    best: float = min(timing(func=case.func, number=number) for _ in range(repeat))
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        case.func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    usec_per_call: float = best / number * 1e6
+    return dict(
+        usec_per_call=usec_per_call,
+        items_per_sec=case.items / usec_per_call * 1e6,
+        peak_kib=peak / 1024,
+    )
+
+
+def timing(func: ty.Callable[[], ty.Any], number: int) -> float:
+    """Seconds of `number` calls, w/o garbage collector as `timeit` does"""
+
+    enabled: bool = gc.isenabled()
+    gc.disable()
+    try:
+        started_at: float = time.perf_counter()
+        for _ in range(number):
+            func()
+        return time.perf_counter() - started_at
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def run(
+    names: ty.Optional[ty.Sequence[str]] = None,
+    min_time: float = DEFAULT_MIN_TIME,
+    repeat: int = DEFAULT_REPEAT,
+) -> ty.Dict[str, Result]:
+    """Measure cases, all of them if `names` is not set"""
+
+    return {
+        case.name: measure(case=case, min_time=min_time, repeat=repeat)
+        for case in get_cases()
+        if not names or case.name in names
+    }
+
+
+def load_baseline(path: pathlib.Path = BASELINE) -> ty.Dict[str, Result]:
+    """Stored results, empty if there are none"""
+
+    if not path.exists():
+        return dict()
+    return json.loads(path.read_text())
+
+
+def save_baseline(
+    results: ty.Dict[str, Result],
+    path: pathlib.Path = BASELINE,
+) -> None:
+    """Store results as baseline"""
+
+    rounded = {
+        name: {key: round(value, 2) for key, value in result.items()}
+        for name, result in results.items()
+    }
+    path.write_text(json.dumps(rounded, indent=2, sort_keys=True) + "\n")
+
+
+def compare(
+    results: ty.Dict[str, Result],
+    baseline: ty.Dict[str, Result],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> ty.Dict[str, ty.Dict[str, float]]:
+    """Ratios to baseline of cases slower or heavier than `threshold` allows"""
+
+    regressions: ty.Dict[str, ty.Dict[str, float]] = dict()
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+
+        for key in ("usec_per_call", "peak_kib"):
+            before: float = baseline[name].get(key, 0.0)
+            if before > 0 and result[key] / before > 1 + threshold:
+                regressions.setdefault(name, dict())[key] = result[key] / before
+
+    return regressions
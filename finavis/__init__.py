@@ -1 +1,2 @@
-from .core import Screener, get_quote, get_quotes
+from .core import Screener, Watchlist, get_quote, get_quotes, iter_quotes
+from .utils import Client
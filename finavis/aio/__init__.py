@@ -0,0 +1,8 @@
+from .quote import get_quote, get_quotes
+from .screener import AsyncScreener
+from .sessions import (
+    DEFAULT_CONCURRENCY,
+    AsyncClient,
+    get_async_client,
+    set_async_client,
+)
@@ -0,0 +1,84 @@
+import asyncio
+import typing as ty
+
+from finavis.core.quote import get_on_error, get_quote_key, parse_quote
+from finavis.exceptions import TickerNotFoundException
+from finavis.library import AbstractModel, Numeric, OnError, Quote
+from finavis.utils import AbstractCache, get_cache
+
+from .sessions import AsyncClient, get_async_client
+
+if ty.TYPE_CHECKING:
+    from lxml.html import HtmlElement
+
+
+async def get_quote(
+    ticker: str,
+    client: ty.Optional[AsyncClient] = None,
+    cache: ty.Optional[AbstractCache] = None,
+    model: ty.Type[AbstractModel] = Quote,
+    numeric: ty.Union[Numeric, str] = Numeric.DECIMAL,
+) -> Quote:
+    """Receive info by ticker name, `model` may be `Quote.compact()`"""
+
+    if not isinstance(ticker, str):
+        raise TypeError(
+            f"Argument `ticker` is not a string (currently: type({type(ticker)}))"
+        )
+
+    cache = cache if cache is not None else get_cache()
+    key: str = get_quote_key(ticker=ticker, model=model, numeric=numeric)
+
+    cached: ty.Any = cache.get(key)
+    if isinstance(cached, TickerNotFoundException):
+        raise TickerNotFoundException(*cached.args)
+    if cached is not None:
+        return cached
+
+    client = client or get_async_client()
+
+    try:
+        raw: "HtmlElement" = await client.request(
+            path="/quote.ashx",
+            query_params={"t": str(ticker)},
+        )
+    except TickerNotFoundException as e:
+        cache.set(key, e)
+        raise
+
+    quote: Quote = parse_quote(
+        raw=raw, model=model, numeric=numeric, metrics=client.metrics
+    )
+    cache.set(key, quote)
+
+    return quote
+
+
+async def get_quotes(
+    tickers: ty.Tuple[str, ...],
+    client: ty.Optional[AsyncClient] = None,
+    cache: ty.Optional[AbstractCache] = None,
+    on_error: ty.Union[OnError, str] = OnError.RAISE,
+    model: ty.Type[AbstractModel] = Quote,
+    numeric: ty.Union[Numeric, str] = Numeric.DECIMAL,
+) -> ty.Tuple[ty.Union[Quote, Exception], ...]:
+    """Receive info by tickers, concurrency is bounded by client"""
+
+    on_error = get_on_error(value=on_error)
+
+    client = client or get_async_client()
+
+    result: ty.List[ty.Union[Quote, BaseException]] = await asyncio.gather(
+        *(
+            get_quote(
+                ticker=ticker, client=client, cache=cache, model=model, numeric=numeric
+            )
+            for ticker in tickers
+        ),
+        return_exceptions=on_error != OnError.RAISE,
+    )
+
+    if on_error == OnError.SKIP:
+        return tuple(x for x in result if not isinstance(x, BaseException))
+
+    return tuple(result)  # type: ignore[arg-type]
@@ -0,0 +1,111 @@
+import asyncio
+import itertools
+import typing as ty
+from collections import deque
+
+from finavis.core.screener import Row, Screener
+from finavis.library import (
+    AbstractModel,
+    Exchange,
+    Index,
+    Numeric,
+    Order,
+    Overview,
+    Signal,
+    Table,
+)
+
+from .sessions import AsyncClient, get_async_client
+
+if ty.TYPE_CHECKING:
+    from lxml import html
+
+
+class AsyncScreener(Screener):
+    """
+    Screener for asyncio, use `async for` or `await screener()`.
+
+    Pages after first are fetched concurrently, at most `read_ahead` pages
+    (default: 8) ahead of the one being yielded.
+    """
+
+    client: ty.Optional[AsyncClient]  # type: ignore[assignment]
+
+    def __init__(
+        self,
+        exchange: ty.Optional[ty.Union[Exchange, str]] = None,
+        index: ty.Optional[ty.Union[Index, str]] = None,
+        signal: ty.Optional[ty.Union[Signal, str]] = None,
+        table: ty.Optional[ty.Union[Table, str]] = Table.OVERVIEW,
+        order_by: ty.Union[Order, str] = Order.TICKER_ASC,
+        client: ty.Optional[AsyncClient] = None,
+        read_ahead: ty.Optional[int] = None,
+        model: ty.Optional[ty.Type[AbstractModel]] = None,
+        numeric: ty.Union[Numeric, str] = Numeric.DECIMAL,
+    ) -> None:
+        """Initialization and validation"""
+
+        super().__init__(
+            exchange=exchange,
+            index=index,
+            signal=signal,
+            table=table,
+            order_by=order_by,
+            read_ahead=read_ahead,
+            model=model,
+            numeric=numeric,
+        )
+
+        self.client = client
+
+    def __aiter__(self) -> ty.AsyncIterator[Overview]:
+        return self._yielding_pages_async(client=self.client or get_async_client())
+
+    async def __call__(self) -> ty.List[Overview]:  # type: ignore[override]
+        if not self._is_fetched:
+            self._items = [item async for item in self]
+            self._is_fetched = True
+
+        return self._items
+
+    async def _yielding_pages_async(
+        self, client: AsyncClient
+    ) -> ty.AsyncIterator[Overview]:
+        """Pages are fetched concurrently, objects are yielded in page order"""
+
+        rows: ty.List[Row] = self._extract_rows(
+            raw=await self._request(client=client, page=1)
+        )
+        if not self.total:
+            return
+
+        for item in self._get_objects(rows=rows):
+            yield item
+
+        pages: ty.Iterator[int] = iter(range(2, self.pages + 1))
+        tasks: ty.Deque["asyncio.Task[html.HtmlElement]"] = deque(
+            asyncio.ensure_future(self._request(client=client, page=page))
+            for page in itertools.islice(pages, self.read_ahead)
+        )
+
+        try:
+            while tasks:
+                raw: "html.HtmlElement" = await tasks.popleft()
+                for page in itertools.islice(pages, 1):
+                    tasks.append(
+                        asyncio.ensure_future(self._request(client=client, page=page))
+                    )
+                for item in self._get_objects(rows=self._extract_rows(raw=raw)):
+                    yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _request(self, client: AsyncClient, page: int) -> "html.HtmlElement":
+        """Getting one page"""
+
+        return await client.request(
+            path="/screener.ashx",
+            query_params=self._get_query_params(page=page),
+        )
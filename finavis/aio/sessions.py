@@ -0,0 +1,241 @@
+import asyncio
+import json
+import logging
+import time
+import typing as ty
+import weakref
+from urllib.parse import urljoin
+
+import aiohttp
+from lxml import html
+from user_agent import generate_user_agent  # type: ignore[import-untyped]
+
+from finavis.exceptions import (
+    RequestMaxRetryException,
+    RequestTimeoutException,
+    RequestUnhandledException,
+    TickerNotFoundException,
+)
+from finavis.utils.limits import ConcurrencyController, RateLimiter, get_rate_limiter
+from finavis.utils.metrics import MetricsRegistry, get_kind, get_metrics
+from finavis.utils.sessions import (
+    DEFAULT_BASE_URL,
+    DEFAULT_CLIENT_TIMEOUT,
+    DEFAULT_RETRY_BACKOFF_FACTOR,
+    DEFAULT_RETRY_TOTAL,
+    parse_document,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY: int = 100
+
+
+class AsyncClient:
+    """
+    Asyncio client w/ keep-alive connection pool and bounded concurrency.
+
+    Unless `controller` is set, client has own AIMD controller sized by
+    `concurrency`, so up to `concurrency` requests are in flight until
+    throttling lowers the limit.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        retry_total: int = DEFAULT_RETRY_TOTAL,
+        retry_backoff_factor: int = DEFAULT_RETRY_BACKOFF_FACTOR,
+        headers: ty.Optional[ty.Mapping] = None,
+        proxy_url: ty.Optional[str] = None,
+        timeout: ty.Optional[float] = DEFAULT_CLIENT_TIMEOUT,
+        base_url: str = DEFAULT_BASE_URL,
+        rate_limiter: ty.Optional[RateLimiter] = None,
+        controller: ty.Optional[ConcurrencyController] = None,
+        metrics: ty.Optional[MetricsRegistry] = None,
+    ) -> None:
+        """Initialization, session is created lazily inside running loop"""
+
+        self.concurrency = concurrency
+        self.retry_total = retry_total or 0
+        self.retry_backoff_factor = retry_backoff_factor
+        self.proxy_url = proxy_url
+        self.timeout = timeout
+        self.base_url = base_url
+        self.rate_limiter: RateLimiter = rate_limiter or get_rate_limiter()
+        self.controller: ConcurrencyController = controller or ConcurrencyController(
+            limiter=self.rate_limiter, limit=concurrency, max_limit=concurrency
+        )
+        self.metrics: MetricsRegistry = metrics or get_metrics()
+
+        self.headers: ty.Dict[str, str] = dict(headers or {})
+        self.headers.update({"User-Agent": generate_user_agent()})
+
+        self.session: ty.Optional[aiohttp.ClientSession] = None
+        self._semaphore: asyncio.Semaphore = asyncio.Semaphore(concurrency)
+
+    def __repr__(self) -> str:
+        """String representation of class"""
+
+        return (
+            f"<{self.__class__.__name__} "
+            f"base_url={self.base_url}, concurrency={self.concurrency}, "
+            f"timeout={self.timeout}>"
+        )
+
+    async def __aenter__(self) -> "AsyncClient":
+        return self
+
+    async def __aexit__(self, *args: ty.Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Release pooled connections"""
+
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Pooled session, `limit` matches client concurrency"""
+
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.concurrency),
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+
+        return self.session
+
+    async def fetch(
+        self,
+        path: str,
+        query_params: ty.Optional[ty.Dict[str, ty.Any]] = None,
+    ) -> str:
+        """Make request to some URL and return body"""
+
+        url: str = urljoin(self.base_url, path)
+        params: ty.Dict[str, str] = {
+            key: str(value) for key, value in (query_params or {}).items()
+        }
+
+        logger.debug(f"make_request = GET {url} query_params={json.dumps(params)}")
+
+        attempt: int = 0
+        while True:
+            try:
+                async with self._semaphore:
+                    return await self._fetch_once(url=url, path=path, params=params)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if attempt < self.retry_total:
+                    # slot is free while backing off
+                    await asyncio.sleep(self.retry_backoff_factor / 1000 * (2**attempt))
+                    attempt += 1
+                    continue
+
+                if isinstance(e, asyncio.TimeoutError):
+                    raise RequestTimeoutException(e)
+                elif self.retry_total > 0:
+                    raise RequestMaxRetryException(e)
+                else:
+                    raise RequestUnhandledException(e)
+
+    async def _fetch_once(self, url: str, path: str, params: ty.Dict[str, str]) -> str:
+        """Single attempt through shared limiter and controller"""
+
+        await self.controller.acquire_async()
+        try:
+            await self.rate_limiter.acquire_async()
+        except BaseException:
+            self.controller.cancel()
+            raise
+
+        started_at: float = time.monotonic()
+        status_code: ty.Optional[int] = None
+        retry_after: ty.Optional[str] = None
+        size: ty.Optional[int] = None
+        try:
+            async with self._get_session().get(
+                url,
+                params=params,
+                allow_redirects=False,
+                proxy=self.proxy_url,
+            ) as response:
+                status_code = response.status
+                retry_after = response.headers.get("Retry-After")
+                if self.metrics.enabled:
+                    self.metrics.ttfb.observe(
+                        time.monotonic() - started_at, kind=get_kind(path=path)
+                    )
+
+                if response.status == 404 and path == "/quote.ashx":
+                    raise TickerNotFoundException(
+                        f"404 Client Error for url: {response.url}"
+                    )
+                if response.status >= 400:
+                    raise RequestUnhandledException(
+                        f"{response.status} Error for url: {response.url}"
+                    )
+
+                logger.debug(f"make_request = DONE status_code={response.status}")
+                body: bytes = await response.read()
+                size = len(body)
+                return body.decode(response.get_encoding())
+        finally:
+            latency: float = time.monotonic() - started_at
+            self.controller.release(
+                latency=latency,
+                status_code=status_code,
+                retry_after=retry_after,
+            )
+            if self.metrics.enabled:
+                kind: str = get_kind(path=path)
+                self.metrics.latency.observe(latency, kind=kind)
+                self.metrics.requests.inc(kind=kind, status=str(status_code or "error"))
+                if size is not None:
+                    self.metrics.size.observe(size, kind=kind)
+                    self.metrics.response_bytes.inc(size, kind=kind)
+
+    async def request(
+        self,
+        path: str,
+        query_params: ty.Optional[ty.Dict[str, ty.Any]] = None,
+    ) -> html.HtmlElement:
+        """Make request to some URL"""
+
+        text: str = await self.fetch(path, query_params=query_params)
+        if not self.metrics.enabled:
+            return parse_document(text=text)
+
+        started_at: float = time.perf_counter()
+        document: html.HtmlElement = parse_document(text=text)
+        self.metrics.parse.observe(
+            time.perf_counter() - started_at, kind=get_kind(path=path)
+        )
+        return document
+
+
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_async_client() -> AsyncClient:
+    """Default client of running loop shared by module-level functions"""
+
+    loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+    client: ty.Optional[AsyncClient] = _clients.get(loop)
+    if client is None:
+        client = _clients[loop] = AsyncClient()
+
+    return client
+
+
+def set_async_client(client: ty.Optional[AsyncClient]) -> None:
+    """Replace default client of running loop (`None` to reset it)"""
+
+    loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+    if client is None:
+        _clients.pop(loop, None)
+    else:
+        _clients[loop] = client
@@ -0,0 +1,311 @@
+"""
+Batch fetcher, results are written to stdout as they arrive.
+
+    $ finavis quote AAPL MSFT > quotes.ndjson
+    $ cat tickers.txt | finavis quote --concurrency 16 --rate 20 --format csv
+    $ finavis screen --index idx_sp500 --columns p_e,rsi_14 -o sp500.parquet
+"""
+
+import argparse
+import sys
+import time
+import typing as ty
+
+from finavis.core.quote import DEFAULT_MAX_WORKERS, iter_quotes
+from finavis.core.screener import Screener
+from finavis.library import (
+    Exchange,
+    Index,
+    Numeric,
+    OnError,
+    Order,
+    Signal,
+    SinkFormat,
+    get_sink,
+)
+from finavis.library.sinks import AbstractSink
+from finavis.utils import (
+    DEFAULT_CLIENT_TIMEOUT,
+    Client,
+    ConcurrencyController,
+    MetricsRegistry,
+    ProxyPool,
+    RateLimiter,
+)
+from finavis.utils.limits import DEFAULT_RATE_LIMIT
+
+DEFAULT_CLI_BATCH_SIZE: int = 1
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """Parser of command line"""
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help=f"max requests in flight (default: {DEFAULT_MAX_WORKERS})",
+    )
+    common.add_argument(
+        "--rate",
+        type=positive_float,
+        default=DEFAULT_RATE_LIMIT,
+        help=f"max requests per second (default: {DEFAULT_RATE_LIMIT:g})",
+    )
+    common.add_argument(
+        "--timeout",
+        type=positive_float,
+        default=DEFAULT_CLIENT_TIMEOUT,
+        help=f"seconds (default: {DEFAULT_CLIENT_TIMEOUT:g})",
+    )
+    common.add_argument(
+        "--proxy",
+        action="append",
+        help="proxy url, e.g. socks5://127.0.0.1:1080, requests are spread if repeated",
+    )
+    common.add_argument(
+        "--format",
+        choices=SinkFormat.values(),
+        help="output format (default: by extension of output, or ndjson)",
+    )
+    common.add_argument("-o", "--output", help="output path (default: stdout)")
+    common.add_argument(
+        "--fields", help="comma-separated fields of output (default: all)"
+    )
+    common.add_argument(
+        "--numeric", choices=Numeric.values(), default=Numeric.FLOAT.value
+    )
+    common.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_CLI_BATCH_SIZE,
+        help="objects written at once (default: every object as it arrives)",
+    )
+    common.add_argument(
+        "-q", "--quiet", action="store_true", help="no summary on stderr"
+    )
+
+    parser = argparse.ArgumentParser(prog="finavis")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    quote = commands.add_parser("quote", parents=[common], help="quotes by tickers")
+    quote.add_argument("tickers", nargs="*", help="tickers, stdin if none")
+    quote.add_argument(
+        "-f",
+        "--file",
+        help="file w/ tickers (whitespace or comma separated, `-` is stdin)",
+    )
+
+    screen = commands.add_parser("screen", parents=[common], help="screener rows")
+    screen.add_argument("--exchange", choices=Exchange.values())
+    screen.add_argument("--index", choices=Index.values())
+    screen.add_argument("--signal", choices=Signal.values())
+    screen.add_argument("--order-by", choices=Order.values(), default=Order.TICKER_ASC)
+    screen.add_argument("--columns", help="comma-separated fields of custom view")
+    screen.add_argument(
+        "--stream", action="store_true", help="parse pages while they are downloaded"
+    )
+
+    return parser
+
+
+def positive_float(value: str) -> float:
+    """Argument type of rates and seconds"""
+
+    try:
+        number: float = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"{value} is not a number")
+
+    if not 0 < number < float("inf"):
+        raise argparse.ArgumentTypeError(f"{value} is not a positive number")
+
+    return number
+
+
+def get_tickers(
+    values: ty.Sequence[str],
+    file: ty.Optional[ty.TextIO] = None,
+) -> ty.Tuple[str, ...]:
+    """Unique upper-cased tickers in order, `#` starts comment"""
+
+    lines: ty.List[str] = list(values)
+    if file is not None:
+        lines.extend(line.split("#", 1)[0] for line in file)
+
+    tickers: ty.Iterable[str] = (
+        ticker.strip().upper()
+        for line in lines
+        for ticker in line.replace(",", " ").split()
+    )
+    return tuple(dict.fromkeys(filter(None, tickers)))
+
+
+def get_client(args: argparse.Namespace) -> Client:
+    """Client w/ concurrency and rate limits of command line"""
+
+    concurrency: int = max(1, args.concurrency)
+    proxies: ty.List[str] = args.proxy or list()
+    return Client(
+        timeout=args.timeout,
+        proxy_url=proxies[0] if len(proxies) == 1 else None,
+        proxy_pool=(
+            ProxyPool(proxies, pool_maxsize=concurrency) if len(proxies) > 1 else None
+        ),
+        pool_maxsize=concurrency,
+        rate_limiter=RateLimiter(rate=args.rate, burst=max(1, int(args.rate))),
+        controller=ConcurrencyController(limit=concurrency, max_limit=concurrency),
+        metrics=MetricsRegistry(),
+    )
+
+
+def run_quote(
+    args: argparse.Namespace,
+    client: Client,
+    sink: AbstractSink,
+    stdin: ty.TextIO,
+    stderr: ty.TextIO,
+) -> int:
+    """Write quotes as completed, failed tickers are reported to stderr"""
+
+    if args.file == "-" or (not args.file and not args.tickers):
+        tickers = get_tickers(values=args.tickers, file=stdin)
+    elif args.file:
+        with open(args.file, encoding="utf-8") as file:
+            tickers = get_tickers(values=args.tickers, file=file)
+    else:
+        tickers = get_tickers(values=args.tickers)
+
+    failed: int = 0
+    for ticker, quote in iter_quotes(
+        tickers=tickers,
+        client=client,
+        max_workers=max(1, args.concurrency),
+        on_error=OnError.RETURN,
+        numeric=args.numeric,
+    ):
+        if isinstance(quote, Exception):
+            failed += 1
+            print(f"{ticker}: {quote.__class__.__name__}: {quote}", file=stderr)
+        else:
+            sink.write(quote)
+
+    return failed
+
+
+def run_screen(
+    args: argparse.Namespace,
+    client: Client,
+    sink: AbstractSink,
+    stdin: ty.TextIO,
+    stderr: ty.TextIO,
+) -> int:
+    """Write screener rows in order of pages"""
+
+    screener: Screener = Screener(
+        exchange=args.exchange,
+        index=args.index,
+        signal=args.signal,
+        order_by=args.order_by,
+        client=client,
+        max_workers=max(1, args.concurrency),
+        numeric=args.numeric,
+        stream=args.stream,
+        columns=args.columns.split(",") if args.columns else None,
+    )
+
+    for item in screener.iter():
+        sink.write(item)
+
+    return 0
+
+
+_command_mapping: ty.Dict[str, ty.Callable[..., int]] = dict(
+    quote=run_quote,
+    screen=run_screen,
+)
+
+
+def main(
+    argv: ty.Optional[ty.Sequence[str]] = None,
+    client: ty.Optional[Client] = None,
+) -> int:
+    """Entry point, exit code is 1 if anything failed"""
+
+    parser: argparse.ArgumentParser = get_parser()
+    args: argparse.Namespace = parser.parse_args(argv)
+
+    format: ty.Optional[str] = args.format
+    if args.output is None and format is None:
+        format = SinkFormat.NDJSON.value
+    if args.output is None and format == SinkFormat.PARQUET:
+        parser.error("parquet is written only to file, please set --output")
+
+    try:
+        sink: AbstractSink = get_sink(
+            args.output or sys.stdout,
+            format=format,
+            fields=args.fields.split(",") if args.fields else None,
+            batch_size=args.batch_size,
+        )
+    except TypeError as e:
+        parser.error(str(e))
+
+    is_owner: bool = client is None
+    client = client or get_client(args=args)
+    started_at: float = time.perf_counter()
+    failed: int = 0
+
+    try:
+        with sink:
+            failed = _command_mapping[args.command](
+                args=args,
+                client=client,
+                sink=sink,
+                stdin=sys.stdin,
+                stderr=sys.stderr,
+            )
+    except KeyboardInterrupt:
+        return 130
+    except Exception as e:
+        failed += 1
+        print(f"error: {e.__class__.__name__}: {e}", file=sys.stderr)
+    finally:
+        if is_owner:
+            client.close()
+
+    if not args.quiet:
+        print(
+            get_summary(
+                command=args.command,
+                count=sink.count,
+                failed=failed,
+                elapsed=time.perf_counter() - started_at,
+                metrics=client.metrics,
+            ),
+            file=sys.stderr,
+        )
+
+    return 1 if failed else 0
+
+
+def get_summary(
+    command: str,
+    count: int,
+    failed: int,
+    elapsed: float,
+    metrics: MetricsRegistry,
+) -> str:
+    """Line of timing and throughput"""
+
+    requests: float = sum(metrics.requests.values.values())
+    latencies: ty.List[ty.List[float]] = list(metrics.latency.values.values())
+    total: float = sum(row[-1] for row in latencies)
+    latency: float = sum(row[-2] for row in latencies) / total if total else 0.0
+
+    return (
+        f"finavis {command}: {count} written, {failed} failed in {elapsed:.2f}s "
+        f"({count / elapsed if elapsed > 0 else 0.0:.1f}/s), "
+        f"{requests:.0f} requests, {latency * 1000:.0f}ms avg latency"
+    )
@@ -1,2 +1,3 @@
-from .quote import get_quote, get_quotes
+from .quote import get_quote, get_quotes, iter_quotes
 from .screener import Screener
+from .watchlist import QuoteChange, Watchlist
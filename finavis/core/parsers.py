@@ -0,0 +1,427 @@
+import threading
+import typing as ty
+
+from lxml import etree
+from lxml.cssselect import CSSSelector
+
+from finavis.library import Column
+from finavis.utils import text_to_label
+
+if ty.TYPE_CHECKING:
+    from lxml.html import HtmlElement
+
+SNAPSHOT_LABELS: ty.Tuple[str, ...] = (
+    "Index",
+    "P/E",
+    "EPS (ttm)",
+    "Insider Own",
+    "Shs Outstand",
+    "Perf Week",
+    "Market Cap",
+    "Forward P/E",
+    "EPS next Y",
+    "Insider Trans",
+    "Shs Float",
+    "Perf Month",
+    "Income",
+    "PEG",
+    "EPS next Q",
+    "Inst Own",
+    "Short Float / Ratio",
+    "Perf Quarter",
+    "Sales",
+    "P/S",
+    "EPS this Y",
+    "Inst Trans",
+    "Short Interest",
+    "Perf Half Y",
+    "Book/sh",
+    "P/B",
+    "ROA",
+    "Target Price",
+    "Perf Year",
+    "Cash/sh",
+    "P/C",
+    "EPS next 5Y",
+    "ROE",
+    "52W Range",
+    "Perf YTD",
+    "Dividend",
+    "P/FCF",
+    "EPS past 5Y",
+    "ROI",
+    "52W High",
+    "Beta",
+    "Dividend %",
+    "Quick Ratio",
+    "Sales past 5Y",
+    "Gross Margin",
+    "52W Low",
+    "ATR",
+    "Employees",
+    "Current Ratio",
+    "Sales Q/Q",
+    "Oper. Margin",
+    "RSI (14)",
+    "Volatility",
+    "Optionable",
+    "Debt/Eq",
+    "EPS Q/Q",
+    "Profit Margin",
+    "Rel Volume",
+    "Prev Close",
+    "Shortable",
+    "LT Debt/Eq",
+    "Earnings",
+    "Payout",
+    "Avg Volume",
+    "Price",
+    "Recom",
+    "SMA20",
+    "SMA50",
+    "SMA200",
+    "Volume",
+    "Change",
+)
+
+# second "EPS next Y" of snapshot table is growth, not estimate
+SNAPSHOT_DUPLICATES: ty.Dict[str, str] = {"EPS next Y": "eps_growth_next_y"}
+
+# columns of custom screener view by fields of quote, `float_short` and
+# `short_ratio` are joined to `short_float_ratio` as on quote page
+SCREENER_QUOTE_COLUMNS: ty.Tuple[ty.Tuple[Column, str], ...] = (
+    (Column.TICKER, "ticker"),
+    (Column.COMPANY, "company"),
+    (Column.SECTOR, "sector"),
+    (Column.INDUSTRY, "industry"),
+    (Column.COUNTRY, "country"),
+    (Column.MARKET_CAP, "market_cap"),
+    (Column.PE, "p_e"),
+    (Column.FORWARD_PE, "forward_p_e"),
+    (Column.PEG, "peg"),
+    (Column.PS, "p_s"),
+    (Column.PB, "p_b"),
+    (Column.PC, "p_c"),
+    (Column.PFCF, "p_fcf"),
+    (Column.DIVIDEND_YIELD, "dividend_percent"),
+    (Column.PAYOUT_RATIO, "payout"),
+    (Column.EPS, "eps_ttm"),
+    (Column.EPS_THIS_Y, "eps_this_y"),
+    (Column.EPS_NEXT_Y, "eps_growth_next_y"),
+    (Column.EPS_PAST_5Y, "eps_past_5y"),
+    (Column.EPS_NEXT_5Y, "eps_next_5y"),
+    (Column.SALES_PAST_5Y, "sales_past_5y"),
+    (Column.EPS_QQ, "eps_q_q"),
+    (Column.SALES_QQ, "sales_q_q"),
+    (Column.SHS_OUTSTAND, "shs_outstand"),
+    (Column.SHS_FLOAT, "shs_float"),
+    (Column.INSIDER_OWN, "insider_own"),
+    (Column.INSIDER_TRANS, "insider_trans"),
+    (Column.INST_OWN, "inst_own"),
+    (Column.INST_TRANS, "inst_trans"),
+    (Column.FLOAT_SHORT, "float_short"),
+    (Column.SHORT_RATIO, "short_ratio"),
+    (Column.ROA, "roa"),
+    (Column.ROE, "roe"),
+    (Column.ROI, "roi"),
+    (Column.CURRENT_RATIO, "current_ratio"),
+    (Column.QUICK_RATIO, "quick_ratio"),
+    (Column.LT_DEBT_EQ, "lt_debt_eq"),
+    (Column.DEBT_EQ, "debt_eq"),
+    (Column.GROSS_MARGIN, "gross_margin"),
+    (Column.OPER_MARGIN, "oper_margin"),
+    (Column.PROFIT_MARGIN, "profit_margin"),
+    (Column.PERF_WEEK, "perf_week"),
+    (Column.PERF_MONTH, "perf_month"),
+    (Column.PERF_QUARTER, "perf_quarter"),
+    (Column.PERF_HALF_Y, "perf_half_y"),
+    (Column.PERF_YEAR, "perf_year"),
+    (Column.PERF_YTD, "perf_ytd"),
+    (Column.BETA, "beta"),
+    (Column.ATR, "atr"),
+    (Column.VOLATILITY_W, "volatility_w"),
+    (Column.VOLATILITY_M, "volatility_m"),
+    (Column.SMA20, "sma20"),
+    (Column.SMA50, "sma50"),
+    (Column.SMA200, "sma200"),
+    (Column.HIGH_52W, "ttm_high"),
+    (Column.LOW_52W, "ttm_low"),
+    (Column.RSI, "rsi_14"),
+    (Column.RECOM, "recom"),
+    (Column.AVG_VOLUME, "avg_volume"),
+    (Column.REL_VOLUME, "rel_volume"),
+    (Column.PRICE, "price"),
+    (Column.CHANGE, "change"),
+    (Column.VOLUME, "volume"),
+    (Column.EARNINGS, "earnings"),
+    (Column.TARGET_PRICE, "target_price"),
+)
+
+# fields of quote provided by custom screener view
+SCREENER_QUOTE_FIELDS: ty.FrozenSet[str] = frozenset(
+    name
+    for _, name in SCREENER_QUOTE_COLUMNS
+    if name not in ("float_short", "short_ratio", "earnings")
+) | {"short_float_ratio", "earnings_at", "earnings_market"}
+
+# field names of custom screener view columns, quote names where possible
+COLUMN_FIELDS: ty.Dict[Column, str] = dict(
+    [(column, column.name.lower()) for column in Column if column != Column.NO]
+    + list(SCREENER_QUOTE_COLUMNS)
+)
+COLUMNS_BY_FIELD: ty.Dict[str, Column] = {
+    name: column for column, name in COLUMN_FIELDS.items()
+}
+
+# columns of custom screener view w/ text values, others are numbers
+TEXT_COLUMNS: ty.FrozenSet[Column] = frozenset(
+    (
+        Column.TICKER,
+        Column.COMPANY,
+        Column.SECTOR,
+        Column.INDUSTRY,
+        Column.COUNTRY,
+        Column.EARNINGS,
+        Column.IPO_DATE,
+    )
+)
+
+# earnings time of screener, like `Nov 02/a`, by market of quote page
+SCREENER_EARNINGS_MARKETS: ty.Dict[str, str] = {"a": "AMC", "b": "BMO"}
+
+# printable symbols for unit/record separators, control chars are not valid XML
+CELL_SEPARATOR: str = "\u241f"
+ROW_SEPARATOR: str = "\u241e"
+
+# snapshot table as plain text in one pass, cells and rows are separated
+SNAPSHOT_XSLT: str = f"""\
+<xsl:stylesheet version="1.0" xmlns:xsl="http://www.w3.org/1999/XSL/Transform">
+  <xsl:output method="text" encoding="utf-8"/>
+  <xsl:template match="/">
+    <xsl:for-each select="//tr[@class='table-dark-row']">
+      <xsl:for-each select="td">
+        <xsl:value-of select="."/><xsl:text>{CELL_SEPARATOR}</xsl:text>
+      </xsl:for-each>
+      <xsl:text>{ROW_SEPARATOR}</xsl:text>
+    </xsl:for-each>
+  </xsl:template>
+</xsl:stylesheet>
+"""
+
+
+class QuoteParser:
+    """Quote page parser, selectors and labels are compiled once"""
+
+    def __init__(self) -> None:
+        self._title = CSSSelector('div[class="fv-container py-2.5"]')
+        self._ticker = CSSSelector(
+            'h1[class="js-recent-quote-ticker quote-header_ticker-wrapper_ticker"]'
+        )
+        self._company = CSSSelector(
+            'h2[class="quote-header_ticker-wrapper_company text-xl"]'
+        )
+        self._company_fallback = CSSSelector(
+            'h2[class="quote-header_ticker-wrapper_company"]'
+        )
+        self._website = CSSSelector('a[class="tab-link block truncate"]')
+        self._links = CSSSelector('a[class="tab-link"]')
+        self._stylesheet: "etree._Element" = etree.XML(SNAPSHOT_XSLT)
+        self._local: threading.local = threading.local()
+
+        self._labels: ty.Dict[str, str] = {
+            name: ty.cast(str, text_to_label(value=name)) for name in SNAPSHOT_LABELS
+        }
+
+    def __call__(self, raw: "HtmlElement") -> ty.Dict[str, ty.Any]:
+        return self.parse(raw=raw)
+
+    @property
+    def snapshot(self) -> etree.XSLT:
+        """Compiled snapshot transform, XSLT objects are not shared by threads"""
+
+        transform: ty.Optional[etree.XSLT] = getattr(self._local, "transform", None)
+        if transform is None:
+            transform = self._local.transform = etree.XSLT(self._stylesheet)
+        return transform
+
+    def get_label(self, name: str) -> str:
+        """Field name by label of snapshot table, unknown labels are memoized"""
+
+        label: ty.Optional[str] = self._labels.get(name)
+        if label is None:
+            label = self._labels[name] = ty.cast(str, text_to_label(value=name))
+        return label
+
+    def parse(self, raw: "HtmlElement") -> ty.Dict[str, ty.Any]:
+        """Raw data of quote page in one pass"""
+
+        data: ty.Dict[str, ty.Any] = dict()
+        title: "HtmlElement" = self._title(raw)[0]
+
+        data["ticker"] = self._ticker(title)[0].text_content().strip()
+
+        companies: ty.List["HtmlElement"] = self._company(title)
+        company: "HtmlElement" = (companies or self._company_fallback(title))[0]
+        data["company"] = company.text_content().strip()
+
+        website: str = self._website(company)[0].attrib["href"]
+        if str(website).startswith("http"):
+            data["website"] = website
+
+        for key, link in zip(
+            ("sector", "industry", "country", "exchange"), self._links(title)
+        ):
+            data[key] = link.text_content()
+
+        snapshot: str = str(self.snapshot(raw.getroottree()))
+        for row in snapshot.split(ROW_SEPARATOR)[:-1]:
+            cells: ty.List[str] = row.split(CELL_SEPARATOR)
+            for index in range(0, len(cells) - 1, 2):
+                name: str = cells[index].strip()
+                label: str = self.get_label(name=name)
+                if label in data and name in SNAPSHOT_DUPLICATES:
+                    label = SNAPSHOT_DUPLICATES[name]
+
+                value: ty.Optional[str] = cells[index + 1].strip()
+                data[label] = value if value != "-" else None
+
+        return data
+
+
+quote_parser: QuoteParser = QuoteParser()
+
+
+def parse_screener_rows(
+    raw: "HtmlElement",
+) -> ty.Iterator[ty.Tuple[ty.Optional[str], ...]]:
+    """Raw cells of screener table w/o number column, `-` is None"""
+
+    try:
+        raw = raw.get_element_by_id("screener-table")
+    except KeyError:
+        return None
+
+    for raw_item in raw.cssselect("tr")[3:]:
+        yield tuple(x if x != "-" else None for x in raw_item.xpath("td//text()")[1:])
+
+
+def get_column(value: ty.Union[Column, str]) -> Column:
+    """Column of custom screener view by id or by field name"""
+
+    if str(value) in Column and str(value) != Column.NO:
+        return Column(str(value))
+
+    if str(value) in COLUMNS_BY_FIELD:
+        return COLUMNS_BY_FIELD[str(value)]
+
+    raise TypeError(
+        f"column {value} is not allowed, please select "
+        f"some another, if required: {', '.join(COLUMNS_BY_FIELD.keys())}."
+    )
+
+
+def get_column_fields(
+    columns: ty.Iterable[Column],
+) -> ty.Tuple[ty.Tuple[str, str], ...]:
+    """Field names and types (`str` or `Decimal`) of columns"""
+
+    return tuple(
+        (COLUMN_FIELDS[column], "str" if column in TEXT_COLUMNS else "Decimal")
+        for column in columns
+    )
+
+
+def parse_screener_quote(row: ty.Sequence[ty.Optional[str]]) -> ty.Dict[str, ty.Any]:
+    """Raw data of quote by row of custom screener view w/ `SCREENER_QUOTE_COLUMNS`"""
+
+    data: ty.Dict[str, ty.Any] = dict(
+        zip((name for _, name in SCREENER_QUOTE_COLUMNS), row)
+    )
+
+    float_short: ty.Optional[str] = data.pop("float_short", None)
+    short_ratio: ty.Optional[str] = data.pop("short_ratio", None)
+    if float_short is not None or short_ratio is not None:
+        data["short_float_ratio"] = f"{float_short or '-'} / {short_ratio or '-'}"
+
+    earnings: ty.Optional[str] = data.get("earnings")
+    if earnings is not None and "/" in earnings:
+        date, market = earnings.split("/", 1)
+        data["earnings"] = (
+            f"{date.strip()} {SCREENER_EARNINGS_MARKETS.get(market.strip(), market)}"
+        )
+
+    return data
+
+
+class ScreenerRowParser:
+    """
+    Incremental parser of screener page, fed by body chunks.
+
+    Rows of screener table are returned as soon as they are closed and then
+    dropped from tree, total line is kept as `total_text`.
+    """
+
+    _total_id: str = "screener-total"
+    _table_id: str = "screener-table"
+    _skip_rows: int = 3
+
+    def __init__(self) -> None:
+        self.total_text: ty.Optional[str] = None
+        self.is_done: bool = False
+
+        self._parser: etree.HTMLPullParser = etree.HTMLPullParser(
+            events=("start", "end"), tag=("div", "table", "tr")
+        )
+        self._cells: etree.XPath = etree.XPath("td//text()")
+        self._in_table: bool = False
+        self._row_index: int = 0
+        self._rows: ty.Set[etree._Element] = set()
+
+    def feed(
+        self, chunk: ty.Union[str, bytes]
+    ) -> ty.List[ty.Tuple[ty.Optional[str], ...]]:
+        """Rows closed by this chunk"""
+
+        self._parser.feed(chunk)
+        return self._read_events()
+
+    def close(self) -> ty.List[ty.Tuple[ty.Optional[str], ...]]:
+        """Rows closed by end of document"""
+
+        try:
+            self._parser.close()
+        except etree.XMLSyntaxError:
+            pass
+        return self._read_events()
+
+    def _read_events(self) -> ty.List[ty.Tuple[ty.Optional[str], ...]]:
+        rows: ty.List[ty.Tuple[ty.Optional[str], ...]] = list()
+
+        for event, element in self._parser.read_events():
+            if event == "start":
+                if element.tag == "tr" and self._in_table:
+                    if self._row_index >= self._skip_rows:
+                        self._rows.add(element)
+                    self._row_index += 1
+                elif element.get("id") == self._table_id:
+                    self._in_table = True
+                continue
+
+            if element in self._rows:
+                self._rows.discard(element)
+                rows.append(
+                    tuple(
+                        str(x) if x != "-" else None for x in self._cells(element)[1:]
+                    )
+                )
+                element.clear()
+                parent: ty.Optional[etree._Element] = element.getparent()
+                if parent is not None:
+                    parent.remove(element)
+            elif element.get("id") == self._total_id:
+                self.total_text = "".join(element.itertext())
+            elif element.get("id") == self._table_id:
+                self._in_table = False
+                self.is_done = True
+
+        return rows
@@ -1,78 +1,460 @@
-import functools
+import time
 import typing as ty
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 
-from finavis.library import Quote
-from finavis.utils import make_request, text_to_label
+import attr
+
+from finavis.exceptions import TickerNotFoundException
+from finavis.library import AbstractModel, Column, Numeric, OnError, Quote, Table
+from finavis.library.models import LazyModel
+from finavis.utils import (
+    AbstractCache,
+    Client,
+    MetricsRegistry,
+    get_cache,
+    get_client,
+    get_metrics,
+    make_request,
+)
+
+from .parsers import (
+    SCREENER_QUOTE_COLUMNS,
+    SCREENER_QUOTE_FIELDS,
+    parse_screener_quote,
+    parse_screener_rows,
+    quote_parser,
+)
 
 if ty.TYPE_CHECKING:
     from lxml.html import HtmlElement
 
+DEFAULT_MAX_WORKERS: int = 8
+DEFAULT_BATCH_SIZE: int = 20
+
+
+def parse_quote(
+    raw: "HtmlElement",
+    model: ty.Type[AbstractModel] = Quote,
+    numeric: ty.Union[Numeric, str] = Numeric.DECIMAL,
+    metrics: ty.Optional[MetricsRegistry] = None,
+) -> Quote:
+    """Make quote object from quote page, extract and build time go to `metrics`"""
+
+    metrics = metrics or get_metrics()
+    if not metrics.enabled:
+        return model.from_response(raw=quote_parser.parse(raw=raw), numeric=numeric)
+
+    started_at: float = time.perf_counter()
+    data: ty.Dict[str, ty.Any] = quote_parser.parse(raw=raw)
+    extracted_at: float = time.perf_counter()
+    quote: Quote = model.from_response(raw=data, numeric=numeric)
+
+    metrics.extract.observe(extracted_at - started_at, kind="quote")
+    metrics.build.observe(time.perf_counter() - extracted_at, kind="quote")
+    return quote
+
+
+def get_quote(
+    ticker: str,
+    client: ty.Optional[Client] = None,
+    cache: ty.Optional[AbstractCache] = None,
+    model: ty.Type[AbstractModel] = Quote,
+    numeric: ty.Union[Numeric, str] = Numeric.DECIMAL,
+) -> Quote:
+    """
+    Receive info by ticker name, `model` may be `Quote.compact()`.
 
-@functools.lru_cache(maxsize=32, typed=False)
-def get_quote(ticker: str) -> Quote:
-    """Receive info by ticker name"""
+    Concurrent calls for the same quote share one fetch, unless coalescing is
+    turned off on client.
+    """
 
     if not isinstance(ticker, str):
         raise TypeError(
             f"Argument `ticker` is not a string (currently: type({type(ticker)}))"
         )
 
-    data: ty.Dict[str, ty.Any] = dict()
-    raw: "HtmlElement" = make_request(
-        path="/quote.ashx",
-        query_params={"t": str(ticker)},
+    cache = cache if cache is not None else get_cache()
+    key: str = get_quote_key(ticker=ticker, model=model, numeric=numeric)
+
+    cached: ty.Any = cache.get(key)
+    if isinstance(cached, TickerNotFoundException):
+        raise TickerNotFoundException(*cached.args)
+    if cached is not None:
+        return cached
+
+    shared: Client = client or get_client()
+    if not shared.coalesce:
+        return fetch_quote(
+            ticker=ticker,
+            key=key,
+            client=client,
+            cache=cache,
+            model=model,
+            numeric=numeric,
+        )
+
+    quote, is_shared = shared.flights.do(
+        key=key,
+        func=lambda: fetch_quote(
+            ticker=ticker,
+            key=key,
+            client=client,
+            cache=cache,
+            model=model,
+            numeric=numeric,
+        ),
     )
-    title: "HtmlElement" = raw.cssselect('div[class="fv-container py-2.5"]')[0]
+    if is_shared and shared.metrics.enabled:
+        shared.metrics.coalesced.inc(kind="quote")
 
-    ticker = title.cssselect(
-        'h1[class="js-recent-quote-ticker quote-header_ticker-wrapper_ticker"]'
-    )[0].text_content()
-    data["ticker"] = str(ticker).strip()
+    return quote
+
+
+def fetch_quote(
+    ticker: str,
+    key: str,
+    client: ty.Optional[Client],
+    cache: AbstractCache,
+    model: ty.Type[AbstractModel] = Quote,
+    numeric: ty.Union[Numeric, str] = Numeric.DECIMAL,
+) -> Quote:
+    """Request and parse quote page, result (or not found ticker) goes to cache"""
 
     try:
-        company = title.cssselect(
-            'h2[class="quote-header_ticker-wrapper_company text-xl"]'
-        )[0]
-    except IndexError:
-        company = title.cssselect('h2[class="quote-header_ticker-wrapper_company"]')[0]
+        raw: "HtmlElement" = make_request(
+            path="/quote.ashx",
+            query_params={"t": str(ticker)},
+            client=client,
+        )
+    except TickerNotFoundException as e:
+        cache.set(key, e)
+        raise
+
+    quote: Quote = parse_quote(
+        raw=raw,
+        model=model,
+        numeric=numeric,
+        metrics=client.metrics if client is not None else None,
+    )
+    cache.set(key, quote)
+
+    return quote
+
+
+def get_quote_key(
+    ticker: str,
+    model: ty.Type[AbstractModel] = Quote,
+    numeric: ty.Union[Numeric, str] = Numeric.DECIMAL,
+) -> str:
+    """Key of quote in cache"""
+
+    key: str = f"quote:{ticker.strip().upper()}"
+    if model is not Quote or numeric != Numeric.DECIMAL:
+        key += f":{model.__name__}:{numeric}"
+
+    return key
+
+
+def get_quotes(
+    tickers: ty.Tuple[str, ...],
+    client: ty.Optional[Client] = None,
+    cache: ty.Optional[AbstractCache] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    on_error: ty.Union[OnError, str] = OnError.RAISE,
+    model: ty.Type[AbstractModel] = Quote,
+    numeric: ty.Union[Numeric, str] = Numeric.DECIMAL,
+    batch: bool = False,
+    fields: ty.Optional[ty.Iterable[str]] = None,
+) -> ty.Tuple[ty.Union[Quote, Exception], ...]:
+    """
+    Receive info by tickers, order of result is the same as `tickers`.
+
+    If `batch`, tickers are received by custom screener view, up to 20 per
+    request; quote page is requested for tickers missing there and for ones
+    whose batch failed, and for every ticker if some of `fields` (all fields
+    of model by default) are not provided by screener, then only these fields
+    are taken from quote page.
+    """
 
-    data["company"] = company.text_content().strip()
+    on_error = get_on_error(value=on_error)
 
-    website = company.cssselect('a[class="tab-link block truncate"]')[0].attrib["href"]
-    if str(website).startswith("http"):
-        data["website"] = website
+    if batch:
+        return get_quotes_by_screener(
+            tickers=tickers,
+            client=client,
+            cache=cache,
+            max_workers=max_workers,
+            on_error=on_error,
+            model=model,
+            numeric=numeric,
+            fields=fields,
+        )
 
-    keys = ["Sector", "Industry", "Country", "Exchange"]
-    fields = [f.text_content() for f in title.cssselect('a[class="tab-link"]')]
-    data_raw = dict(zip(keys, fields))
-    for key, value in data_raw.items():
-        data[key.lower()] = value
+    result: ty.List[ty.Union[Quote, Exception]] = list()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures: ty.List[Future] = [
+            executor.submit(
+                get_quote,
+                ticker=ticker,
+                client=client,
+                cache=cache,
+                model=model,
+                numeric=numeric,
+            )
+            for ticker in tickers
+        ]
 
-    for rows in raw.cssselect('tr[class="table-dark-row"]'):
-        rows = rows.xpath("td")
-        for index in range(0, 11, 2):
-            field_label, field_data = rows[index], rows[index + 1]
+        try:
+            for future in futures:
+                try:
+                    result.append(future.result())
+                except Exception as e:
+                    if on_error == OnError.RAISE:
+                        raise
+                    elif on_error == OnError.RETURN:
+                        result.append(e)
+        finally:
+            for future in futures:
+                future.cancel()
 
-            name: str = field_label.text_content().strip()
-            label: str = ty.cast(str, text_to_label(value=name))
-            if label in data.keys() and name == "EPS next Y":
-                name = "EPS growth next Y"
-                label = ty.cast(str, text_to_label(value=name))
+    return tuple(result)
 
-            value = field_data.text_content().strip()  # type: ignore[assignment]
-            if value == "-":
-                value = None  # type: ignore[assignment]
 
-            data[label] = value
+def get_quotes_by_screener(
+    tickers: ty.Tuple[str, ...],
+    client: ty.Optional[Client] = None,
+    cache: ty.Optional[AbstractCache] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    on_error: ty.Union[OnError, str] = OnError.RAISE,
+    model: ty.Type[AbstractModel] = Quote,
+    numeric: ty.Union[Numeric, str] = Numeric.DECIMAL,
+    fields: ty.Optional[ty.Iterable[str]] = None,
+) -> ty.Tuple[ty.Union[Quote, Exception], ...]:
+    """
+    Receive info by tickers from screener, missing ones and `fields` w/o
+    screener column (all fields of model by default) from quote pages.
+    """
 
-    return Quote.from_response(raw=data)
+    on_error = get_on_error(value=on_error)
 
+    names: ty.Set[str] = {x.name for x in attr.fields(model)}  # type: ignore[arg-type]
+    extra: ty.Set[str] = (
+        names & set(fields if fields is not None else names)
+    ) - SCREENER_QUOTE_FIELDS
 
-def get_quotes(tickers: ty.Tuple[str, ...]) -> ty.Tuple[Quote]:
-    """Receive info by tickers"""
+    found: ty.Dict[str, ty.Union[Quote, Exception]] = get_screener_quotes(
+        tickers=tickers,
+        client=client,
+        cache=cache,
+        max_workers=max_workers,
+        model=model,
+        numeric=numeric,
+    )
 
-    result: ty.Any = list()
+    pending: ty.Tuple[str, ...] = tuple(
+        ticker
+        for ticker in dict.fromkeys(ticker.strip().upper() for ticker in tickers)
+        if extra or not isinstance(found.get(ticker), AbstractModel)
+    )
+    pages: ty.Tuple[ty.Union[Quote, Exception], ...] = tuple()
+    if pending:
+        pages = get_quotes(
+            tickers=pending,
+            client=client,
+            cache=cache,
+            max_workers=max_workers,
+            on_error=OnError.RETURN,
+            model=model,
+            numeric=numeric,
+        )
+    for ticker, page in zip(pending, pages):
+        quote: ty.Any = found.get(ticker)
+        if isinstance(quote, AbstractModel) and not isinstance(page, Exception):
+            found[ticker] = merge_quote(
+                quote=quote, other=page, names=extra, numeric=numeric
+            )
+        else:
+            found[ticker] = page
+
+    result: ty.List[ty.Union[Quote, Exception]] = list()
     for ticker in tickers:
-        result.append(get_quote(ticker=ticker))
+        value: ty.Union[Quote, Exception] = found[ticker.strip().upper()]
+        if not isinstance(value, Exception):
+            result.append(value)
+        elif on_error == OnError.RAISE:
+            raise value
+        elif on_error == OnError.RETURN:
+            result.append(value)
 
     return tuple(result)
+
+
+def merge_quote(
+    quote: ty.Any,
+    other: ty.Any,
+    names: ty.Iterable[str],
+    numeric: ty.Union[Numeric, str] = Numeric.DECIMAL,
+) -> ty.Any:
+    """Copy of quote w/ fields `names` taken from other quote of the same model"""
+
+    if isinstance(quote, LazyModel):
+        # nothing is converted yet, raw data of quote page fills the gaps
+        return type(quote).from_response(
+            raw=dict(other._raw, **quote._raw), numeric=numeric
+        )
+
+    return attr.evolve(quote, **{name: getattr(other, name) for name in names})
+
+
+def get_screener_quotes(
+    tickers: ty.Iterable[str],
+    client: ty.Optional[Client] = None,
+    cache: ty.Optional[AbstractCache] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    model: ty.Type[AbstractModel] = Quote,
+    numeric: ty.Union[Numeric, str] = Numeric.DECIMAL,
+) -> ty.Dict[str, ty.Union[Quote, Exception]]:
+    """
+    Receive info by tickers from custom screener view, pages are fetched by pool.
+
+    Result is keyed by upper-cased ticker, tickers not found by screener are
+    missing, failure of request is put to every ticker of its batch.
+    """
+
+    cache = cache if cache is not None else get_cache()
+
+    result: ty.Dict[str, ty.Union[Quote, Exception]] = dict()
+    pending: ty.List[str] = list()
+    for ticker in dict.fromkeys(ticker.strip().upper() for ticker in tickers):
+        cached: ty.Any = cache.get(
+            get_screener_quote_key(ticker=ticker, model=model, numeric=numeric)
+        )
+        if cached is not None:
+            result[ticker] = cached
+        else:
+            pending.append(ticker)
+
+    batches: ty.List[ty.List[str]] = [
+        pending[index : index + DEFAULT_BATCH_SIZE]
+        for index in range(0, len(pending), DEFAULT_BATCH_SIZE)
+    ]
+    if not batches:
+        return result
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures: ty.Dict[Future, ty.List[str]] = {
+            executor.submit(
+                get_screener_page,
+                tickers=batch,
+                client=client,
+                model=model,
+                numeric=numeric,
+            ): batch
+            for batch in batches
+        }
+
+        for future, batch in futures.items():
+            try:
+                quotes: ty.List[Quote] = future.result()
+            except Exception as e:
+                result.update((ticker, e) for ticker in batch)
+                continue
+
+            for quote in quotes:
+                ticker = quote.ticker.upper()
+                result[ticker] = quote
+                cache.set(
+                    get_screener_quote_key(ticker=ticker, model=model, numeric=numeric),
+                    quote,
+                )
+
+    return result
+
+
+def get_screener_page(
+    tickers: ty.Sequence[str],
+    client: ty.Optional[Client] = None,
+    model: ty.Type[AbstractModel] = Quote,
+    numeric: ty.Union[Numeric, str] = Numeric.DECIMAL,
+) -> ty.List[Quote]:
+    """Quotes of one page of custom screener view filtered by tickers"""
+
+    raw: "HtmlElement" = make_request(
+        path="/screener.ashx",
+        query_params=dict(
+            v=Table.CUSTOM,
+            t=",".join(tickers),
+            c=",".join([Column.NO] + [column for column, _ in SCREENER_QUOTE_COLUMNS]),
+        ),
+        client=client,
+    )
+
+    return model.from_responses(
+        rows=[parse_screener_quote(row=row) for row in parse_screener_rows(raw=raw)],
+        numeric=numeric,
+    )
+
+
+def get_screener_quote_key(
+    ticker: str,
+    model: ty.Type[AbstractModel] = Quote,
+    numeric: ty.Union[Numeric, str] = Numeric.DECIMAL,
+) -> str:
+    """Key of quote from screener in cache, it has less fields than quote page"""
+
+    return f"{get_quote_key(ticker=ticker, model=model, numeric=numeric)}:screener"
+
+
+def iter_quotes(
+    tickers: ty.Tuple[str, ...],
+    client: ty.Optional[Client] = None,
+    cache: ty.Optional[AbstractCache] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    on_error: ty.Union[OnError, str] = OnError.RAISE,
+    model: ty.Type[AbstractModel] = Quote,
+    numeric: ty.Union[Numeric, str] = Numeric.DECIMAL,
+) -> ty.Iterator[ty.Tuple[str, ty.Union[Quote, Exception]]]:
+    """Receive info by tickers, pairs `(ticker, quote)` are yielded as completed"""
+
+    on_error = get_on_error(value=on_error)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures: ty.Dict[Future, str] = {
+            executor.submit(
+                get_quote,
+                ticker=ticker,
+                client=client,
+                cache=cache,
+                model=model,
+                numeric=numeric,
+            ): ticker
+            for ticker in tickers
+        }
+
+        try:
+            for future in as_completed(futures):
+                try:
+                    quote: Quote = future.result()
+                except Exception as e:
+                    if on_error == OnError.RAISE:
+                        raise
+                    elif on_error == OnError.RETURN:
+                        yield futures[future], e
+                    continue
+
+                yield futures[future], quote
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def get_on_error(value: ty.Union[OnError, str]) -> OnError:
+    """Validate failure mode"""
+
+    if str(value) not in OnError:
+        raise TypeError(
+            f"arg on_error={value} is not allowed, please select "
+            f"some another, if required: {', '.join(OnError.values())}."
+        )
+
+    return OnError(str(value))
@@ -1,12 +1,45 @@
+import itertools
 import re
+import time
 import typing as ty
-
-from finavis.library import Exchange, Index, Order, Overview, Signal, Table
-from finavis.utils.sessions import make_request
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from urllib.parse import urlencode
+
+from finavis.library import (
+    AbstractModel,
+    Column,
+    Exchange,
+    Frame,
+    Index,
+    Numeric,
+    Order,
+    Overview,
+    Record,
+    Signal,
+    Snapshot,
+    Table,
+    get_record_model,
+)
+from finavis.utils.caches import AbstractCache
+from finavis.utils.metrics import MetricsRegistry, get_metrics
+from finavis.utils.sessions import Client, make_request, stream_request
+
+from .parsers import (
+    ScreenerRowParser,
+    get_column,
+    get_column_fields,
+    parse_screener_rows,
+)
 
 if ty.TYPE_CHECKING:
     from lxml import html
 
+DEFAULT_SCREENER_MAX_WORKERS: int = 4
+
+T = ty.TypeVar("T")
+Row = ty.Tuple[ty.Optional[str], ...]
+
 
 class Screener:
     """Screen! Screen! Screener!"""
@@ -18,9 +51,11 @@ class Screener:
         table=Table,
         order_by=Order,
     )
-    _screener_mapping: ty.Dict[str, ty.Any] = {Table.OVERVIEW.value: Overview}
+    _screener_mapping: ty.Dict[str, ty.Any] = {
+        Table.OVERVIEW.value: Overview,
+        Table.CUSTOM.value: Record,
+    }
     _per_pages: int = 20
-    _items: ty.List[Overview] = list()
 
     def __len__(self) -> int:
         """Total objects in array"""
@@ -47,14 +82,52 @@ class Screener:
         signal: ty.Optional[ty.Union[Signal, str]] = None,
         table: ty.Optional[ty.Union[Table, str]] = Table.OVERVIEW,
         order_by: ty.Union[Order, str] = Order.TICKER_ASC,
+        client: ty.Optional[Client] = None,
+        cache: ty.Optional[AbstractCache] = None,
+        max_workers: int = DEFAULT_SCREENER_MAX_WORKERS,
+        read_ahead: ty.Optional[int] = None,
+        keep_items: bool = False,
+        model: ty.Optional[ty.Type[AbstractModel]] = None,
+        numeric: ty.Union[Numeric, str] = Numeric.DECIMAL,
+        stream: bool = False,
+        columns: ty.Optional[ty.Sequence[ty.Union[Column, str]]] = None,
     ) -> None:
-        """Initialization and validation"""
+        """
+        Initialization and validation.
+
+        Pages are cached only if `cache` is set. Once total is known, pages are
+        fetched by `max_workers` threads, at most `read_ahead` pages (default:
+        twice `max_workers`) are fetched ahead of the one being yielded.
+        Objects streamed by `iter` are kept on instance only if `keep_items`.
+        Objects are built by `model` (e.g. `Overview.compact()`) w/ `numeric` mode.
+        If `stream`, pages are parsed incrementally while body is downloaded, and
+        rows of first page are yielded as soon as they are parsed.
+        If `columns` (field names like `p_e` or column ids) are set, custom view
+        is requested and objects are records w/ ticker and only these fields.
+        """
 
         self.exchange = str(exchange) if exchange is not None else None
         self.index = str(index) if index is not None else None
         self.signal = str(signal) if signal is not None else None
         self.table = str(table) if table is not None else None
         self.order_by = str(order_by) if order_by is not None else None
+        self.client = client
+        self.cache = cache
+        self.max_workers = max(1, max_workers)
+        self.read_ahead = max(1, read_ahead or self.max_workers * 2)
+        self.keep_items = keep_items
+        self.model = model
+        self.numeric = numeric
+        self.stream = stream
+        self.columns: ty.Tuple[Column, ...] = tuple()
+
+        if columns is not None:
+            self.table = Table.CUSTOM.value
+            self.columns = tuple(
+                dict.fromkeys([Column.TICKER] + [get_column(x) for x in columns])
+            )
+        elif self.table == Table.CUSTOM:
+            raise TypeError(f"arg columns is required w/ table={self.table}.")
 
         for arg_name, arg_choices in self._args_validate_mapping.items():
             value: ty.Optional[str] = getattr(self, arg_name)
@@ -69,6 +142,9 @@ class Screener:
         self.total: int = 0
         self.pages: int = 0
 
+        self._items: ty.List[Overview] = list()
+        self._is_fetched: bool = False
+
     def __repr__(self) -> str:
         """String representation of class"""
 
@@ -76,20 +152,217 @@ class Screener:
             f"<{self.__class__.__name__} "
             f"exchange={self.exchange}, index={self.index}, signal={self.signal}, "
             f"table={self.table}, order_by={self.order_by}, total={self.total}, "
+            f"columns={len(self.columns)}, "
             f"pages={self.pages}>"
         )
 
     def __call__(self) -> ty.List[Overview]:
-        if len(self._items) > 0:
-            return self._items
-
-        for index, item in enumerate(self._yielding_objects(page=1)):
-            self._items.append(item)
+        if not self._is_fetched:
+            self._items = list(self._yielding_objects(page=1))
+            self._is_fetched = True
 
         return self._items
 
+    def iter(self) -> ty.Iterator[Overview]:
+        """Streaming objects, only pages being fetched are held in memory"""
+
+        if self._is_fetched:
+            yield from self._items
+            return None
+
+        items: ty.Optional[ty.List[Overview]] = list() if self.keep_items else None
+        for item in self._yielding_objects(page=1):
+            if items is not None:
+                items.append(item)
+            yield item
+
+        if items is not None:
+            self._items = items
+            self._is_fetched = True
+
+    def to_frame(self) -> Frame:
+        """Columnar result built from raw table rows, w/o model objects"""
+
+        return Frame.from_rows(
+            model=self._get_model(default=True), rows=self._yielding_rows(page=1)
+        )
+
+    def to_snapshot(self) -> Snapshot:
+        """Raw table rows keyed by ticker, for diffing w/ snapshot of previous run"""
+
+        model: ty.Any = self._get_model(default=True)
+        return Snapshot.from_rows(
+            fields=tuple(model.__annotations__.keys()),
+            rows=self._yielding_rows(page=1),
+        )
+
     def _yielding_objects(self, page: int = 1) -> ty.Iterable[ty.Union[Overview]]:
-        """Getting data and create object"""
+        """Getting data and create object, objects are yielded in page order"""
+
+        return self._yielding_pages(
+            getter=self._get_page,
+            page=page,
+            first=self._iter_page if self.stream else None,
+        )
+
+    def _yielding_rows(self, page: int = 1) -> ty.Iterable[Row]:
+        """Getting raw table rows in page order"""
+
+        return self._yielding_pages(
+            getter=self._get_page_rows,
+            page=page,
+            first=self._iter_page_rows if self.stream else None,
+        )
+
+    def _yielding_pages(
+        self,
+        getter: ty.Callable[[int], ty.List[T]],
+        page: int = 1,
+        first: ty.Optional[ty.Callable[[int], ty.Iterable[T]]] = None,
+    ) -> ty.Iterator[T]:
+        """Walk pages, after first one (by `first` if set) pages are fetched by pool"""
+
+        yield from (first or getter)(page)
+
+        pages: ty.Iterator[int] = iter(range(page + 1, self.pages + 1))
+        if self.max_workers == 1:
+            for page in pages:
+                yield from getter(page)
+            return None
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures: ty.Deque[Future] = deque(
+                executor.submit(getter, page)
+                for page in itertools.islice(pages, self.read_ahead)
+            )
+
+            try:
+                while futures:
+                    items: ty.List[T] = futures.popleft().result()
+                    for page in itertools.islice(pages, 1):
+                        futures.append(executor.submit(getter, page))
+                    yield from items
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    def _get_page(self, page: int = 1) -> ty.List[Overview]:
+        """Getting objects of one page"""
+
+        return self._get_objects(rows=self._get_page_rows(page=page))
+
+    def _iter_page(self, page: int = 1) -> ty.Iterator[Overview]:
+        """Streaming objects of one page, built in batch by rows of every chunk"""
+
+        for rows in self._iter_page_batches(page=page):
+            yield from self._get_objects(rows=rows)
+
+    def _iter_page_rows(self, page: int = 1) -> ty.Iterator[Row]:
+        """Streaming raw table rows of one page, yielded as soon as parsed"""
+
+        for rows in self._iter_page_batches(page=page):
+            yield from rows
+
+    def _iter_page_batches(self, page: int = 1) -> ty.Iterator[ty.List[Row]]:
+        """Streaming raw table rows of one page, rows parsed from every chunk at once"""
+
+        query_params: ty.Dict[str, ty.Any] = self._get_query_params(page=page)
+        key: str = f"screener:{urlencode(sorted(query_params.items()))}"
+
+        if self.cache is not None:
+            cached: ty.Optional[ty.Tuple[int, ty.List[Row]]] = self.cache.get(key)
+            if cached is not None:
+                if not self.total:
+                    self._set_pages(total=cached[0])
+                yield cached[1]
+                return None
+
+        parser: ScreenerRowParser = ScreenerRowParser()
+        rows: ty.List[Row] = list()
+        yielded: int = 0
+        extracting: float = 0.0
+
+        chunks: ty.Iterator[str] = stream_request(
+            path="/screener.ashx",
+            query_params=query_params,
+            client=self.client,
+        )
+        try:
+            for chunk in itertools.chain(chunks, (None,)):
+                started_at: float = time.perf_counter()
+                items: ty.List[Row] = (
+                    parser.feed(chunk) if chunk is not None else parser.close()
+                )
+                extracting += time.perf_counter() - started_at
+
+                if not self.total and parser.total_text is not None:
+                    self._set_total_by_text(text=parser.total_text)
+
+                # rows parsed before total line are held till it is seen
+                rows.extend(items)
+                if self.total and yielded < len(rows):
+                    yield rows[yielded:]
+                    yielded = len(rows)
+
+                if parser.is_done and self.total:
+                    break
+        finally:
+            chunks.close()  # type: ignore[attr-defined]
+
+        metrics: MetricsRegistry = self._get_metrics()
+        if metrics.enabled:
+            metrics.extract.observe(extracting, kind="screener")
+
+        if self.total and self.cache is not None:
+            self.cache.set(key, (self.total, rows))
+
+    def _get_page_rows(self, page: int = 1) -> ty.List[Row]:
+        """Getting raw table rows of one page"""
+
+        if self.stream:
+            return list(self._iter_page_rows(page=page))
+
+        query_params: ty.Dict[str, ty.Any] = self._get_query_params(page=page)
+        key: str = f"screener:{urlencode(sorted(query_params.items()))}"
+
+        if self.cache is not None:
+            cached: ty.Optional[ty.Tuple[int, ty.List[Row]]] = self.cache.get(key)
+            if cached is not None:
+                if not self.total:
+                    self._set_pages(total=cached[0])
+                return cached[1]
+
+        raw: "html.HtmlElement" = make_request(
+            path="/screener.ashx",
+            query_params=query_params,
+            client=self.client,
+        )
+
+        rows: ty.List[Row] = self._extract_rows(raw=raw)
+
+        if self.total and self.cache is not None:
+            self.cache.set(key, (self.total, rows))
+
+        return rows
+
+    def _get_model(self, default: bool = False) -> ty.Any:
+        """Model of objects, `model` arg wins over one of table unless `default`"""
+
+        if self.model is not None and not default:
+            return self.model
+
+        if self.columns:
+            return get_record_model(fields=get_column_fields(columns=self.columns))
+
+        return self._screener_mapping[self.table]  # type: ignore[index]
+
+    def _get_metrics(self) -> MetricsRegistry:
+        """Registry of client, shared one if client is not set"""
+
+        return self.client.metrics if self.client is not None else get_metrics()
+
+    def _get_query_params(self, page: int = 1) -> ty.Dict[str, ty.Any]:
+        """Query params of screener page"""
 
         query_params: ty.Dict[str, ty.Any] = dict(
             v=self.table,
@@ -100,52 +373,75 @@ class Screener:
         if len(self.filters) > 0:
             query_params.update(f=",".join(self.filters))
 
-        raw: "html.HtmlElement" = make_request(
-            path="/screener.ashx",
-            query_params=query_params,
-        )
+        if self.columns:
+            query_params.update(c=",".join((Column.NO,) + self.columns))
 
-        if not self.total:
-            try:
-                total_raw = raw.get_element_by_id("screener-total")
-                total_raw = total_raw.text_content()  # type: ignore[assignment]
-            except IndexError:
-                return None
-            else:
-                total_raw_lines = re.findall(r"\s\d+", str(total_raw))
-                if len(total_raw_lines) > 0:
-                    self.total = int(total_raw_lines[0].strip())
-                    self.pages = self._get_total_pages(
-                        total=self.total / self._per_pages
-                    )
+        return query_params
 
-        if not self.total:
-            return None
+    def _set_total(self, raw: "html.HtmlElement") -> None:
+        """Fill `total` and `pages` from first page"""
 
         try:
-            raw = raw.get_element_by_id("screener-table")
-        except KeyError:
+            total_raw = raw.get_element_by_id("screener-total")
+            total_raw = total_raw.text_content()  # type: ignore[assignment]
+        except (IndexError, KeyError):
             return None
 
-        for raw_item in raw.cssselect("tr")[3:]:
-            key: str = self._screener_mapping[self.table].__name__.lower()  # type: ignore[index]
-            yield getattr(self, f"_get_{key}")(raw=raw_item)
+        self._set_total_by_text(text=str(total_raw))
 
-        if page < self.pages:
-            yield from self._yielding_objects(page=page + 1)
+    def _set_total_by_text(self, text: str) -> None:
+        """Fill `total` and `pages` from total line, like `#1 / 8561 Total`"""
 
-    @staticmethod
-    def _get_overview(raw: "html.HtmlElement") -> Overview:
-        """Make overview object"""
+        total_raw_lines = re.findall(r"\s\d+", text)
+        if len(total_raw_lines) > 0:
+            self._set_pages(total=int(total_raw_lines[0].strip()))
 
-        kwargs: ty.Dict[str, str] = dict(
-            zip(
-                Overview.__annotations__.keys(),
-                [x if x != "-" else None for x in raw.xpath("td//text()")[1:]],
-            )
+    def _set_pages(self, total: int) -> None:
+        """Fill `total` and `pages`"""
+
+        self.total = total
+        self.pages = self._get_total_pages(total=self.total / self._per_pages)
+
+    def _get_objects(self, rows: ty.Sequence[Row]) -> ty.List[Overview]:
+        """Objects of raw table rows, built in batch by model"""
+
+        model: ty.Any = self._get_model()
+        fields: ty.Tuple[str, ...] = tuple(model.__annotations__.keys())
+
+        started_at: float = time.perf_counter()
+        objects: ty.List[Overview] = model.from_responses(
+            rows=[dict(zip(fields, row)) for row in rows],
+            numeric=self.numeric,
         )
 
-        return Overview.from_response(raw=kwargs)
+        metrics: MetricsRegistry = self._get_metrics()
+        if metrics.enabled:
+            metrics.build.observe(time.perf_counter() - started_at, kind="screener")
+
+        return objects
+
+    def _extract_rows(self, raw: "html.HtmlElement") -> ty.List[Row]:
+        """Raw table rows of fetched page, total is filled from first one"""
+
+        if not self.total:
+            self._set_total(raw=raw)
+
+        if not self.total:
+            return list()
+
+        started_at: float = time.perf_counter()
+        rows: ty.List[Row] = list(self._get_rows(raw=raw))
+
+        metrics: MetricsRegistry = self._get_metrics()
+        if metrics.enabled:
+            metrics.extract.observe(time.perf_counter() - started_at, kind="screener")
+
+        return rows
+
+    def _get_rows(self, raw: "html.HtmlElement") -> ty.Iterable[Row]:
+        """Raw cells of screener table, `-` is None"""
+
+        return parse_screener_rows(raw=raw)
 
     @staticmethod
     def _get_total_pages(total: float) -> int:
@@ -0,0 +1,387 @@
+import heapq
+import itertools
+import logging
+import queue
+import threading
+import time
+import typing as ty
+from concurrent.futures import ThreadPoolExecutor
+
+import attr
+
+from finavis.library import AbstractModel, Numeric, Quote
+from finavis.library.sinks import get_fields, get_getter
+from finavis.utils import AbstractCache, Client, RateLimiter, make_request
+
+from .quote import get_quote_key, parse_quote
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WATCHLIST_INTERVAL: float = 60.0
+DEFAULT_WATCHLIST_MAX_WORKERS: int = 4
+
+Change = ty.Tuple[ty.Any, ty.Any]
+Subscriber = ty.Callable[["QuoteChange"], ty.Any]
+
+
+@attr.s(auto_attribs=True, slots=True, frozen=True)
+class QuoteChange:
+    """
+    Fields of quote changed since previous refresh.
+
+    :param str ticker: Ticker name
+    :param ty.Dict[str, Change] changes: `(old, new)` by field, old is None on first refresh
+    :param Quote quote: Fresh quote
+    :param bool is_new: Whether it is first quote of ticker
+    """
+
+    ticker: str
+    changes: ty.Dict[str, Change]
+    quote: Quote
+    is_new: bool = False
+
+
+@attr.s(auto_attribs=True, slots=True)
+class Entry:
+    """Scheduled ticker, higher `priority` is refreshed more often"""
+
+    ticker: str
+    priority: float = 1.0
+    refreshed_at: ty.Optional[float] = None
+    quote: ty.Optional[Quote] = None
+    is_active: bool = True
+
+
+class Watchlist:
+    """
+    Background refresher of quotes, subscribers get only changed fields.
+
+    Every ticker is refreshed once per `interval / priority` seconds, first
+    refreshes are staggered over `interval` from `start` (or first
+    `run_pending`), so requests are spread evenly.
+    Due tickers go in order of staleness (higher priority first on ties), at
+    most `budget` refreshes per second if set, by `max_workers` threads.
+    Changes are passed to subscribers and put into `queue` if set. Quotes are
+    fetched w/o quote cache, fresh ones are put into `cache` if set.
+    """
+
+    def __init__(
+        self,
+        tickers: ty.Iterable[str] = (),
+        interval: float = DEFAULT_WATCHLIST_INTERVAL,
+        budget: ty.Optional[float] = None,
+        client: ty.Optional[Client] = None,
+        cache: ty.Optional[AbstractCache] = None,
+        model: ty.Type[AbstractModel] = Quote,
+        numeric: ty.Union[Numeric, str] = Numeric.DECIMAL,
+        max_workers: int = DEFAULT_WATCHLIST_MAX_WORKERS,
+        queue: ty.Optional["queue.Queue[QuoteChange]"] = None,
+        timer: ty.Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialization, refreshes start on `start`"""
+
+        if interval <= 0:
+            raise TypeError(f"arg interval={interval} should be positive.")
+
+        self.interval = interval
+        self.budget: ty.Optional[RateLimiter] = (
+            RateLimiter(rate=budget, burst=1) if budget else None
+        )
+        self.client = client
+        self.cache = cache
+        self.model = model
+        self.numeric = numeric
+        self.max_workers = max(1, max_workers)
+        self.queue = queue
+        self.timer = timer
+
+        self.entries: ty.Dict[str, Entry] = dict()
+        self.subscribers: ty.List[Subscriber] = list()
+
+        self.refreshes: int = 0
+        self.changes: int = 0
+        self.errors: int = 0
+
+        self._heap: ty.List[ty.Tuple[float, float, int, Entry]] = list()
+        self._counter: ty.Iterator[int] = itertools.count()
+        self._condition: threading.Condition = threading.Condition()
+        self._slots: threading.Semaphore = threading.Semaphore(self.max_workers)
+        self._thread: ty.Optional[threading.Thread] = None
+        self._executor: ty.Optional[ThreadPoolExecutor] = None
+        self._is_stopped: bool = True
+
+        # first refreshes of these are staggered from `start` (or `run_pending`)
+        self._unscheduled: ty.List[Entry] = list()
+        for ticker in tickers:
+            ticker = ticker.strip().upper()
+            if ticker not in self.entries:
+                self.entries[ticker] = Entry(ticker=ticker)
+                self._unscheduled.append(self.entries[ticker])
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __repr__(self) -> str:
+        """String representation of class"""
+
+        return (
+            f"<{self.__class__.__name__} "
+            f"tickers={len(self)}, interval={self.interval}, "
+            f"refreshes={self.refreshes}, changes={self.changes}, errors={self.errors}>"
+        )
+
+    def __enter__(self) -> "Watchlist":
+        self.start()
+        return self
+
+    def __exit__(self, *args: ty.Any) -> None:
+        self.stop()
+
+    def add(
+        self,
+        ticker: str,
+        priority: float = 1.0,
+        due_at: ty.Optional[float] = None,
+    ) -> None:
+        """Watch ticker (or change its priority), it is due now unless `due_at`"""
+
+        if priority <= 0:
+            raise TypeError(f"arg priority={priority} should be positive.")
+
+        ticker = ticker.strip().upper()
+        with self._condition:
+            entry: ty.Optional[Entry] = self.entries.get(ticker)
+            if entry is not None:
+                entry.priority = priority
+                return None
+
+            entry = self.entries[ticker] = Entry(ticker=ticker, priority=priority)
+            self._schedule(entry=entry, due_at=due_at if due_at is not None else 0.0)
+
+    def remove(self, ticker: str) -> None:
+        """Stop watching ticker, refresh in flight is not rescheduled"""
+
+        with self._condition:
+            entry: ty.Optional[Entry] = self.entries.pop(ticker.strip().upper(), None)
+            if entry is not None:
+                entry.is_active = False
+
+    def subscribe(self, callback: Subscriber) -> None:
+        """Call `callback(change)` on every change, from worker thread"""
+
+        self.subscribers.append(callback)
+
+    def unsubscribe(self, callback: Subscriber) -> None:
+        self.subscribers.remove(callback)
+
+    def get(self, ticker: str) -> ty.Optional[Quote]:
+        """Last quote of ticker, if any"""
+
+        entry: ty.Optional[Entry] = self.entries.get(ticker.strip().upper())
+        return entry.quote if entry is not None else None
+
+    def start(self) -> None:
+        """Run scheduler in background thread"""
+
+        with self._condition:
+            if not self._is_stopped:
+                return None
+            self._is_stopped = False
+
+        self._stagger()
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        self._thread = threading.Thread(
+            target=self._run, name="finavis-watchlist", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: ty.Optional[float] = None) -> None:
+        """Stop scheduler, refreshes in flight are finished"""
+
+        with self._condition:
+            self._is_stopped = True
+            self._condition.notify_all()
+
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def run_pending(self) -> int:
+        """Refresh due tickers in calling thread, number of refreshes is returned"""
+
+        self._stagger()
+
+        count: int = 0
+        while True:
+            entry: ty.Optional[Entry] = self._pop_due(now=self.timer())
+            if entry is None:
+                return count
+
+            if self.budget is not None:
+                self.budget.acquire()
+            self.refresh(entry=entry)
+            count += 1
+
+    def refresh(self, entry: Entry) -> ty.Optional[QuoteChange]:
+        """Fetch quote, notify about changes and schedule next refresh"""
+
+        change: ty.Optional[QuoteChange] = None
+        error: ty.Optional[Exception] = None
+        try:
+            # not `get_quote`: it would return cached quote, while page request
+            # is still coalesced (and revalidated by page cache) by client
+            quote: Quote = parse_quote(
+                raw=make_request(
+                    path="/quote.ashx",
+                    query_params={"t": entry.ticker},
+                    client=self.client,
+                ),
+                model=self.model,
+                numeric=self.numeric,
+                metrics=self.client.metrics if self.client is not None else None,
+            )
+        except Exception as e:
+            error = e
+            logger.warning(
+                f"watchlist = ERROR {entry.ticker} {e.__class__.__name__}: {e}"
+            )
+        else:
+            if self.cache is not None:
+                key: str = get_quote_key(
+                    ticker=entry.ticker, model=self.model, numeric=self.numeric
+                )
+                self.cache.set(key, quote)
+
+            change = self._get_change(entry=entry, quote=quote)
+            entry.quote = quote
+        finally:
+            entry.refreshed_at = self.timer()
+            with self._condition:
+                self.errors += 1 if error is not None else 0
+                self.refreshes += 1 if error is None else 0
+                self.changes += 1 if change is not None else 0
+                if entry.is_active:
+                    self._schedule(
+                        entry=entry,
+                        due_at=entry.refreshed_at + self.interval / entry.priority,
+                    )
+
+        if change is not None:
+            self._notify(change=change)
+
+        return change
+
+    def _get_change(self, entry: Entry, quote: Quote) -> ty.Optional[QuoteChange]:
+        """Changed fields, all filled ones on first quote, None if nothing changed"""
+
+        fields: ty.Tuple[str, ...] = get_fields(type(quote))
+        getter: ty.Callable[[ty.Any], ty.Tuple[ty.Any, ...]] = get_getter(fields)
+
+        new: ty.Tuple[ty.Any, ...] = getter(quote)
+        if entry.quote is None:
+            return QuoteChange(
+                ticker=entry.ticker,
+                changes={
+                    name: (None, value)
+                    for name, value in zip(fields, new)
+                    if value is not None
+                },
+                quote=quote,
+                is_new=True,
+            )
+
+        old: ty.Tuple[ty.Any, ...] = getter(entry.quote)
+        if old == new:
+            return None
+
+        return QuoteChange(
+            ticker=entry.ticker,
+            changes={
+                name: (before, after)
+                for name, before, after in zip(fields, old, new)
+                if before != after
+            },
+            quote=quote,
+        )
+
+    def _notify(self, change: QuoteChange) -> None:
+        """Pass change to subscribers and queue, failing subscriber is logged"""
+
+        for callback in list(self.subscribers):
+            try:
+                callback(change)
+            except Exception as e:
+                logger.exception(f"watchlist = SUBSCRIBER ERROR {change.ticker}: {e}")
+
+        if self.queue is not None:
+            self.queue.put(change)
+
+    def _stagger(self) -> None:
+        """Schedule first refreshes of initial tickers evenly over `interval` from now"""
+
+        with self._condition:
+            now: float = self.timer()
+            for index, entry in enumerate(self._unscheduled):
+                self._schedule(
+                    entry=entry,
+                    due_at=now + index * self.interval / len(self._unscheduled),
+                )
+            self._unscheduled = list()
+
+    def _schedule(self, entry: Entry, due_at: float) -> None:
+        """Push entry to heap, called under lock"""
+
+        heapq.heappush(
+            self._heap, (due_at, -entry.priority, next(self._counter), entry)
+        )
+        self._condition.notify_all()
+
+    def _pop_due(self, now: float) -> ty.Optional[Entry]:
+        """Stalest due entry, if any"""
+
+        with self._condition:
+            while self._heap and self._heap[0][0] <= now:
+                _, _, _, entry = heapq.heappop(self._heap)
+                if entry.is_active:
+                    return entry
+        return None
+
+    def _run(self) -> None:
+        """Loop of scheduler thread"""
+
+        while True:
+            with self._condition:
+                while not self._is_stopped:
+                    now: float = self.timer()
+                    if self._heap and self._heap[0][0] <= now:
+                        break
+                    timeout: ty.Optional[float] = (
+                        self._heap[0][0] - now if self._heap else None
+                    )
+                    self._condition.wait(timeout=timeout)
+
+                if self._is_stopped:
+                    return None
+
+            self._slots.acquire()
+            entry: ty.Optional[Entry] = self._pop_due(now=self.timer())
+            if entry is None:
+                self._slots.release()
+                continue
+
+            if self.budget is not None:
+                self.budget.acquire()
+
+            ty.cast(ThreadPoolExecutor, self._executor).submit(
+                self._refresh_in_slot, entry
+            )
+
+    def _refresh_in_slot(self, entry: Entry) -> None:
+        try:
+            self.refresh(entry=entry)
+        finally:
+            self._slots.release()
@@ -20,3 +20,7 @@ class RequestMaxRetryException(Exception):
 
 class RequestDocumentIsEmptyException(Exception):
     """If document is empty"""
+
+
+class RequestNotRecordedException(Exception):
+    """If request is not found in replay archive"""
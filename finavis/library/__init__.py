@@ -1,3 +1,19 @@
-from .enums import EnumWithValues, Exchange, Index, Order, Signal, Table
-from .models import Overview, Quote
+from .enums import (
+    Column,
+    EnumWithValues,
+    Exchange,
+    Index,
+    Numeric,
+    OnError,
+    Order,
+    ProxyStrategy,
+    Signal,
+    SinkFormat,
+    Table,
+    TransportMode,
+)
+from .frames import Frame
+from .models import AbstractModel, Overview, Quote, Record, get_record_model
+from .sinks import AbstractSink, CsvSink, NdjsonSink, ParquetSink, get_sink
+from .snapshots import Delta, Snapshot
 from .types import Decimal, InvalidOperation
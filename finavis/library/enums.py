@@ -86,3 +86,106 @@ class Signal(EnumWithValues):
 
 class Table(EnumWithValues):
     OVERVIEW = "111"
+    CUSTOM = "152"
+
+
+class Column(EnumWithValues):
+    NO = "0"
+    TICKER = "1"
+    COMPANY = "2"
+    SECTOR = "3"
+    INDUSTRY = "4"
+    COUNTRY = "5"
+    MARKET_CAP = "6"
+    PE = "7"
+    FORWARD_PE = "8"
+    PEG = "9"
+    PS = "10"
+    PB = "11"
+    PC = "12"
+    PFCF = "13"
+    DIVIDEND_YIELD = "14"
+    PAYOUT_RATIO = "15"
+    EPS = "16"
+    EPS_THIS_Y = "17"
+    EPS_NEXT_Y = "18"
+    EPS_PAST_5Y = "19"
+    EPS_NEXT_5Y = "20"
+    SALES_PAST_5Y = "21"
+    EPS_QQ = "22"
+    SALES_QQ = "23"
+    SHS_OUTSTAND = "24"
+    SHS_FLOAT = "25"
+    INSIDER_OWN = "26"
+    INSIDER_TRANS = "27"
+    INST_OWN = "28"
+    INST_TRANS = "29"
+    FLOAT_SHORT = "30"
+    SHORT_RATIO = "31"
+    ROA = "32"
+    ROE = "33"
+    ROI = "34"
+    CURRENT_RATIO = "35"
+    QUICK_RATIO = "36"
+    LT_DEBT_EQ = "37"
+    DEBT_EQ = "38"
+    GROSS_MARGIN = "39"
+    OPER_MARGIN = "40"
+    PROFIT_MARGIN = "41"
+    PERF_WEEK = "42"
+    PERF_MONTH = "43"
+    PERF_QUARTER = "44"
+    PERF_HALF_Y = "45"
+    PERF_YEAR = "46"
+    PERF_YTD = "47"
+    BETA = "48"
+    ATR = "49"
+    VOLATILITY_W = "50"
+    VOLATILITY_M = "51"
+    SMA20 = "52"
+    SMA50 = "53"
+    SMA200 = "54"
+    HIGH_50D = "55"
+    LOW_50D = "56"
+    HIGH_52W = "57"
+    LOW_52W = "58"
+    RSI = "59"
+    CHANGE_OPEN = "60"
+    GAP = "61"
+    RECOM = "62"
+    AVG_VOLUME = "63"
+    REL_VOLUME = "64"
+    PRICE = "65"
+    CHANGE = "66"
+    VOLUME = "67"
+    EARNINGS = "68"
+    TARGET_PRICE = "69"
+    IPO_DATE = "70"
+
+
+class OnError(EnumWithValues):
+    RAISE = "raise"
+    SKIP = "skip"
+    RETURN = "return"
+
+
+class Numeric(EnumWithValues):
+    DECIMAL = "decimal"
+    FLOAT = "float"
+
+
+class TransportMode(EnumWithValues):
+    PASSTHROUGH = "passthrough"
+    RECORD = "record"
+    REPLAY = "replay"
+
+
+class SinkFormat(EnumWithValues):
+    CSV = "csv"
+    NDJSON = "ndjson"
+    PARQUET = "parquet"
+
+
+class ProxyStrategy(EnumWithValues):
+    ROUND_ROBIN = "round_robin"
+    LEAST_LOADED = "least_loaded"
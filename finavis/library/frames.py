@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import abc
+import typing as ty
+from array import array
+
+from finavis.library.models import INTEGER_FIELDS
+from finavis.utils import text_to_float
+
+if ty.TYPE_CHECKING:
+    import numpy
+    import pandas
+    import pyarrow
+
+DEFAULT_INTEGER_FIELDS: ty.FrozenSet[str] = INTEGER_FIELDS
+DEFAULT_CATEGORY_FIELDS: ty.FrozenSet[str] = frozenset(
+    ("sector", "industry", "country", "exchange")
+)
+
+
+class FrameColumn(abc.ABC):
+    """Typed column w/ null mask (1 = valid, 0 = null)"""
+
+    kind: str = "object"
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.mask: bytearray = bytearray()
+
+    def __len__(self) -> int:
+        return len(self.mask)
+
+    def __repr__(self) -> str:
+        """String representation of class"""
+
+        return f"<{self.__class__.__name__} name={self.name}, size={len(self)}>"
+
+    @property
+    def null_count(self) -> int:
+        return len(self.mask) - sum(self.mask)
+
+    @abc.abstractmethod
+    def append(self, value: ty.Optional[str]) -> None:
+        """Add raw cell, `None` is null"""
+
+    @abc.abstractmethod
+    def to_list(self) -> ty.List[ty.Any]:
+        """Values w/ `None` for nulls"""
+
+
+class NumericColumn(FrameColumn):
+    """Column of float64 (`d`) or int64 (`q`) values"""
+
+    def __init__(self, name: str, typecode: str = "d") -> None:
+        super().__init__(name=name)
+        self.kind = "float64" if typecode == "d" else "int64"
+        self.data: array = array(typecode)
+
+    def append(self, value: ty.Optional[str]) -> None:
+        number: ty.Optional[float] = text_to_float(value=value)
+        if number is None:
+            self.data.append(0)
+            self.mask.append(0)
+        else:
+            self.data.append(number if self.data.typecode == "d" else round(number))
+            self.mask.append(1)
+
+    def to_list(self) -> ty.List[ty.Any]:
+        return [x if m else None for x, m in zip(self.data, self.mask)]
+
+
+class StringColumn(FrameColumn):
+    """Column of plain strings"""
+
+    kind = "string"
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name=name)
+        self.data: ty.List[ty.Optional[str]] = list()
+
+    def append(self, value: ty.Optional[str]) -> None:
+        self.data.append(value)
+        self.mask.append(0 if value is None else 1)
+
+    def to_list(self) -> ty.List[ty.Any]:
+        return list(self.data)
+
+
+class CategoryColumn(FrameColumn):
+    """Dictionary-encoded column of strings, null code is -1"""
+
+    kind = "category"
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name=name)
+        self.codes: array = array("i")
+        self.categories: ty.List[str] = list()
+        self._lookup: ty.Dict[str, int] = dict()
+
+    def append(self, value: ty.Optional[str]) -> None:
+        if value is None:
+            self.codes.append(-1)
+            self.mask.append(0)
+            return None
+
+        code: ty.Optional[int] = self._lookup.get(value)
+        if code is None:
+            code = self._lookup[value] = len(self.categories)
+            self.categories.append(value)
+
+        self.codes.append(code)
+        self.mask.append(1)
+
+    def to_list(self) -> ty.List[ty.Any]:
+        return [self.categories[x] if x >= 0 else None for x in self.codes]
+
+
+class Frame:
+    """Columnar result of screener, built from raw table rows"""
+
+    def __init__(
+        self,
+        fields: ty.Sequence[str],
+        annotations: ty.Mapping[str, str],
+        integer_fields: ty.FrozenSet[str] = DEFAULT_INTEGER_FIELDS,
+        category_fields: ty.FrozenSet[str] = DEFAULT_CATEGORY_FIELDS,
+    ) -> None:
+        """Initialization, `annotations` are field types of model (`str`/`Decimal`)"""
+
+        self.fields: ty.Tuple[str, ...] = tuple(fields)
+        self.columns: ty.Dict[str, FrameColumn] = dict()
+
+        for name in self.fields:
+            if annotations.get(name) == "Decimal":
+                typecode: str = "q" if name in integer_fields else "d"
+                self.columns[name] = NumericColumn(name=name, typecode=typecode)
+            elif name in category_fields:
+                self.columns[name] = CategoryColumn(name=name)
+            else:
+                self.columns[name] = StringColumn(name=name)
+
+        self._appenders: ty.Tuple[ty.Callable[[ty.Optional[str]], None], ...] = tuple(
+            self.columns[name].append for name in self.fields
+        )
+
+    def __len__(self) -> int:
+        return len(self.columns[self.fields[0]]) if self.fields else 0
+
+    def __repr__(self) -> str:
+        """String representation of class"""
+
+        return (
+            f"<{self.__class__.__name__} rows={len(self)}, fields={len(self.fields)}>"
+        )
+
+    def __getitem__(self, name: str) -> FrameColumn:
+        return self.columns[name]
+
+    @classmethod
+    def from_rows(
+        cls,
+        model: ty.Any,
+        rows: ty.Iterable[ty.Sequence[ty.Optional[str]]],
+    ) -> Frame:
+        """Make frame from raw rows in order of model fields"""
+
+        frame: Frame = cls(
+            fields=list(model.__annotations__.keys()),
+            annotations=model.__annotations__,
+        )
+        frame.extend(rows=rows)
+        return frame
+
+    def append(self, row: ty.Sequence[ty.Optional[str]]) -> None:
+        """Add raw row, missing trailing cells are null"""
+
+        for index, append in enumerate(self._appenders):
+            append(row[index] if index < len(row) else None)
+
+    def extend(self, rows: ty.Iterable[ty.Sequence[ty.Optional[str]]]) -> None:
+        for row in rows:
+            self.append(row=row)
+
+    def to_dict(self) -> ty.Dict[str, ty.List[ty.Any]]:
+        """Plain python lists, nulls are `None`"""
+
+        return {name: column.to_list() for name, column in self.columns.items()}
+
+    def to_numpy(self) -> ty.Dict[str, "numpy.ndarray"]:
+        """Numeric columns as masked arrays, strings as object arrays"""
+
+        import numpy as np
+
+        result: ty.Dict[str, "numpy.ndarray"] = dict()
+        for name, column in self.columns.items():
+            invalid = np.frombuffer(column.mask, dtype=np.uint8) == 0
+            if isinstance(column, NumericColumn):
+                data = np.frombuffer(column.data, dtype=column.kind)
+                result[name] = np.ma.MaskedArray(data, mask=invalid)
+            else:
+                result[name] = np.array(column.to_list(), dtype=object)
+
+        return result
+
+    def to_arrow(self) -> "pyarrow.Table":
+        """Arrow table, categories as dictionary arrays"""
+
+        import numpy as np
+        import pyarrow as pa
+
+        arrays: ty.List["pyarrow.Array"] = list()
+        for column in self.columns.values():
+            invalid = np.frombuffer(column.mask, dtype=np.uint8) == 0
+            if isinstance(column, NumericColumn):
+                data = np.frombuffer(column.data, dtype=column.kind)
+                arrays.append(pa.array(data, mask=invalid))
+            elif isinstance(column, CategoryColumn):
+                codes = np.frombuffer(column.codes, dtype=np.int32)
+                arrays.append(
+                    pa.DictionaryArray.from_arrays(
+                        pa.array(codes, mask=invalid),
+                        pa.array(column.categories, type=pa.string()),
+                    )
+                )
+            else:
+                arrays.append(pa.array(column.to_list(), type=pa.string()))
+
+        return pa.Table.from_arrays(arrays, names=list(self.columns.keys()))
+
+    def to_pandas(self) -> "pandas.DataFrame":
+        """DataFrame w/ nullable dtypes and categoricals"""
+
+        import numpy as np
+        import pandas as pd
+
+        data: ty.Dict[str, ty.Any] = dict()
+        for name, column in self.columns.items():
+            invalid = np.frombuffer(column.mask, dtype=np.uint8) == 0
+            if isinstance(column, NumericColumn):
+                values = np.frombuffer(column.data, dtype=column.kind).copy()
+                klass = (
+                    pd.arrays.FloatingArray
+                    if column.kind == "float64"
+                    else pd.arrays.IntegerArray
+                )
+                data[name] = klass(values, invalid.copy())
+            elif isinstance(column, CategoryColumn):
+                data[name] = pd.Categorical.from_codes(
+                    np.frombuffer(column.codes, dtype=np.int32),
+                    categories=column.categories,
+                )
+            else:
+                data[name] = pd.array(column.to_list(), dtype="string")
+
+        return pd.DataFrame(data)
@@ -1,22 +1,255 @@
 from __future__ import annotations
 
 import datetime as dt
+import functools
 import typing as ty
-from copy import deepcopy
 
 import attr
 
+from finavis.library.enums import Numeric
 from finavis.library.types import Decimal
-from finavis.utils import text_to_decimal
+from finavis.utils import text_to_float
+
+INTEGER_FIELDS: ty.FrozenSet[str] = frozenset(
+    ("volume", "avg_volume", "employees", "shs_outstand", "shs_float")
+)
+
+MONTHS: ty.Dict[str, int] = {
+    name: number
+    for number, name in enumerate(
+        (
+            "Jan",
+            "Feb",
+            "Mar",
+            "Apr",
+            "May",
+            "Jun",
+            "Jul",
+            "Aug",
+            "Sep",
+            "Oct",
+            "Nov",
+            "Dec",
+        ),
+        start=1,
+    )
+}
+
+_DECIMAL_EXPONENTS: ty.Dict[str, int] = {"K": 3, "M": 6, "B": 9, "T": 12}
+
+Converter = ty.Callable[[str], ty.Any]
+Cached = ty.TypeVar("Cached", bound=ty.Callable[..., ty.Any])
+
+
+def model_cache(func: Cached) -> Cached:
+    """
+    Unbounded cache of function by model class, signature is kept for mypy:
+    attrs sets `__hash__ = None` on models, so mypy treats their classes as
+    unhashable, while classes are hashable by identity.
+    """
+
+    return ty.cast(Cached, functools.lru_cache(maxsize=None)(func))
+
+
+def to_decimal(value: str) -> Decimal:
+    """Some `1.5B`, `-0.20%` or `27,070,101` convert to Decimal, suffixed are whole"""
+
+    exponent: ty.Optional[int] = _DECIMAL_EXPONENTS.get(value[-1])
+    if exponent is not None:
+        return Decimal(int(Decimal(value[:-1]).scaleb(exponent)))
+
+    if value[-1] == "%":
+        return Decimal(value[:-1])
+
+    if "," in value:
+        value = value.replace(",", "")
+
+    return Decimal(value)
+
+
+def to_integer(value: str) -> ty.Optional[int]:
+    """Some `1.5B` or `27,070,101` convert to int"""
+
+    number: ty.Optional[float] = text_to_float(value=value)
+    return round(number) if number is not None else None
+
+
+def get_converter(
+    numeric: ty.Union[Numeric, str] = Numeric.DECIMAL,
+    is_integer: bool = False,
+) -> Converter:
+    """Converter of numeric field by mode"""
+
+    if numeric == Numeric.FLOAT:
+        return to_integer if is_integer else text_to_float  # type: ignore[return-value]
+
+    return to_decimal
+
+
+def to_number(
+    value: ty.Optional[str],
+    numeric: ty.Union[Numeric, str] = Numeric.DECIMAL,
+    is_integer: bool = False,
+) -> ty.Any:
+    """Some `1.5B`, `-0.20%` or `27,070,101` convert to Decimal, float or int"""
+
+    if value is None:
+        return None
+
+    return get_converter(numeric=numeric, is_integer=is_integer)(value)
+
+
+@model_cache
+def get_converters(
+    model: ty.Type[AbstractModel],
+    numeric: ty.Union[Numeric, str] = Numeric.DECIMAL,
+) -> ty.Tuple[ty.Tuple[str, ty.Optional[Converter]], ...]:
+    """Conversion plan of `str` and `Decimal` fields, built once per model and mode"""
+
+    converters: ty.List[ty.Tuple[str, ty.Optional[Converter]]] = list()
+    for field_name, field_type in model.__annotations__.items():
+        if field_type == "Decimal":
+            converter: Converter = get_converter(
+                numeric=numeric, is_integer=field_name in INTEGER_FIELDS
+            )
+            converters.append((field_name, converter))
+        elif field_type == "str":
+            converters.append((field_name, None))
+
+    return tuple(converters)
+
+
+def convert(
+    raw: ty.Mapping[str, ty.Any],
+    converters: ty.Tuple[ty.Tuple[str, ty.Optional[Converter]], ...],
+    data: ty.Dict[str, ty.Any],
+) -> ty.Dict[str, ty.Any]:
+    """Fill `data` by conversion plan, fields already in `data` are kept"""
+
+    for field_name, converter in converters:
+        if field_name in data:
+            continue
+
+        value: ty.Any = raw.get(field_name)
+        if converter is not None and value is not None:
+            value = converter(value)
+        data[field_name] = value
+
+    return data
+
+
+@functools.lru_cache(maxsize=1024)
+def get_index(value: str) -> ty.Tuple[str, ...]:
+    """Some `DJIA, S&P 500` convert to tuple, memoized"""
+
+    return tuple(x.strip() for x in value.split(","))
+
+
+@functools.lru_cache(maxsize=1024)
+def get_earnings(value: str, today: dt.date) -> ty.Tuple[str, dt.date]:
+    """Some `Nov 02 AMC` convert to market and nearest date since today, memoized"""
+
+    parts: ty.List[str] = value.split()
+    month, day = MONTHS[parts[0]], int(parts[1])
+
+    earn_at: dt.date = dt.date(today.year, month, day)
+    if earn_at < today:
+        earn_at = dt.date(today.year + 1, month, day)
+
+    return parts[-1], earn_at
+
+
+def get_index_fields(
+    value: ty.Any, numeric: ty.Union[Numeric, str]
+) -> ty.Dict[str, ty.Any]:
+    """Helper func"""
+
+    return dict(index=get_index(value=value)) if isinstance(value, str) else dict()
+
+
+def get_earnings_fields(
+    value: ty.Any, numeric: ty.Union[Numeric, str]
+) -> ty.Dict[str, ty.Any]:
+    """Helper func"""
+
+    if not isinstance(value, str):
+        return dict()
+
+    earnings_market, earnings_at = get_earnings(value=value, today=dt.date.today())
+    return dict(earnings_market=earnings_market, earnings_at=earnings_at)
+
+
+def get_volatility_fields(
+    value: ty.Any, numeric: ty.Union[Numeric, str]
+) -> ty.Dict[str, ty.Any]:
+    """Helper func"""
+
+    if not isinstance(value, str):
+        return dict()
+
+    volatility_w, volatility_m = value.split()
+    return dict(
+        volatility_w=to_number(value=volatility_w, numeric=numeric),
+        volatility_m=to_number(value=volatility_m, numeric=numeric),
+    )
+
+
+Deriver = ty.Callable[[ty.Any, ty.Union[Numeric, str]], ty.Dict[str, ty.Any]]
+
+# raw keys of quote converted to other fields: (raw key, fields, deriver)
+QUOTE_DERIVED_FIELDS: ty.Tuple[ty.Tuple[str, ty.Tuple[str, ...], Deriver], ...] = (
+    ("index", ("index",), get_index_fields),
+    ("optionable", ("is_optionable",), lambda v, n: dict(is_optionable=v == "Yes")),
+    ("shortable", ("is_shortable",), lambda v, n: dict(is_shortable=v == "Yes")),
+    ("earnings", ("earnings_market", "earnings_at"), get_earnings_fields),
+    ("volatility", ("volatility_w", "volatility_m"), get_volatility_fields),
+)
 
 
 class AbstractModel:
+    __slots__ = ()
+
+    _derived_fields: ty.ClassVar[
+        ty.Tuple[ty.Tuple[str, ty.Tuple[str, ...], Deriver], ...]
+    ] = tuple()
+
     def to_dict(self) -> ty.Dict[str, str]:
-        return deepcopy(self.__dict__)
+        """Field values by name, values are immutable, so copy is shallow"""
+
+        if hasattr(self, "__dict__"):
+            return dict(self.__dict__)
+        return attr.asdict(self, recurse=False)  # type: ignore[arg-type]
 
     @classmethod
-    def from_response(cls, raw: ty.Dict[str, ty.Any]) -> ty.Any:
-        raise NotImplemented
+    def from_response(
+        cls,
+        raw: ty.Dict[str, ty.Any],
+        numeric: ty.Union[Numeric, str] = Numeric.DECIMAL,
+    ) -> ty.Any:
+        raise NotImplementedError
+
+    @classmethod
+    def from_responses(
+        cls,
+        rows: ty.Iterable[ty.Mapping[str, ty.Any]],
+        numeric: ty.Union[Numeric, str] = Numeric.DECIMAL,
+    ) -> ty.List[ty.Any]:
+        """Make objects from many raw rows, conversion plan is built once"""
+
+        from_response: ty.Callable[..., ty.Any] = cls.from_response
+        return [from_response(raw=raw, numeric=numeric) for raw in rows]
+
+    @classmethod
+    def compact(cls, frozen: bool = False) -> ty.Any:
+        """Slotted variant of model (w/o per-instance `__dict__`), optionally frozen"""
+
+        return get_compact_model(model=cls, frozen=frozen)
+
+    @classmethod
+    def lazy(cls) -> ty.Any:
+        """Variant of model converting every field on its first access"""
+
+        return get_lazy_model(model=cls)
 
     @property
     def is_filled(self) -> bool:
@@ -193,80 +426,31 @@ class Quote(AbstractModel):
     index: ty.Optional[ty.Tuple[str, ...]] = None
     earnings_at: ty.Optional[dt.date] = None
 
+    _derived_fields = QUOTE_DERIVED_FIELDS
+
     def to_dict(self) -> ty.Dict[str, str]:
-        raw: ty.Dict[str, str] = super().to_dict()
-        for key, value in self.__dict__.items():
+        raw: ty.Dict[str, str] = AbstractModel.to_dict(self)
+        for key, value in list(raw.items()):
             if key.startswith("ttm_"):
                 raw["52w_" + key.split("ttm_")[-1]] = value
         return raw
 
     @classmethod
-    def from_response(cls, raw: ty.Dict[str, ty.Any]) -> Quote:
-        """Make class from raw_data"""
+    def from_response(
+        cls,
+        raw: ty.Dict[str, ty.Any],
+        numeric: ty.Union[Numeric, str] = Numeric.DECIMAL,
+    ) -> Quote:
+        """Make class from raw_data, numbers are Decimal or float/int by `numeric`"""
 
         data: ty.Dict[str, ty.Any] = dict()
 
-        index = raw.pop("index", None)
-        if isinstance(index, str):
-            data.update(index=tuple((x.strip() for x in index.split(","))))
-
-        optionable = raw.pop("optionable", None)
-        if optionable is not None:
-            data.update(is_optionable=optionable == "Yes")
-
-        shortable = raw.pop("shortable", None)
-        if shortable is not None:
-            data.update(is_shortable=shortable == "Yes")
-
-        earnings = raw.pop("earnings", None)
-        if isinstance(earnings, str):
-            data.update(earnings_market=earnings.split()[-1])
-
-            today = dt.date.today()
-            earn_at = dt.datetime.strptime(
-                " ".join([str(today.year)] + earnings.split()[0:2]), "%Y %b %d"
-            ).date()
-            if earn_at < today:
-                earn_at = dt.date(today.year + 1, earn_at.month, earn_at.day)
-
-            data.update(earnings_at=earn_at)
-
-        volatility = raw.pop("volatility", None)
-        if isinstance(volatility, str):
-            volatility_w, volatility_m = volatility.split()
-            if isinstance(volatility_w, str):
-                data.update(volatility_w=Decimal(volatility_w.split("%")[0]))
-            if isinstance(volatility_m, str):
-                data.update(volatility_m=Decimal(volatility_m.split("%")[0]))
-
-        for field_name, field_type in cls.__annotations__.items():
-            value: ty.Any = raw.get(field_name)
-
-            if field_name in data.keys():
-                continue
-
-            if field_type == "str":
-                data[field_name] = value
-                continue
-
-            if field_type == "Decimal":
-                if value is None:
-                    data[field_name] = value
-                    continue
-
-                if value.endswith(("M", "B")):
-                    data[field_name] = text_to_decimal(value=value)
-                    continue
-
-                if value.endswith("%"):
-                    data[field_name] = Decimal(value.split("%")[0])
-                    continue
-
-                if "," in value:
-                    value = value.replace(",", "")
-
-                data[field_name] = Decimal(value)
+        for key, _, deriver in cls._derived_fields:
+            value: ty.Any = raw.get(key)
+            if value is not None:
+                data.update(deriver(value, numeric))
 
+        convert(raw=raw, converters=get_converters(cls, numeric), data=data)
         return cls(**data)
 
 
@@ -299,31 +483,207 @@ class Overview(AbstractModel):
     volume: Decimal
 
     @classmethod
-    def from_response(cls, raw: ty.Dict[str, ty.Any]) -> Overview:
-        """Make class from raw_data"""
+    def from_response(
+        cls,
+        raw: ty.Dict[str, ty.Any],
+        numeric: ty.Union[Numeric, str] = Numeric.DECIMAL,
+    ) -> Overview:
+        """Make class from raw_data, numbers are Decimal or float/int by `numeric`"""
 
         data: ty.Dict[str, ty.Any] = dict()
-        for field_name, field_type in cls.__annotations__.items():
-            value: ty.Any = raw.get(field_name)
+        convert(raw=raw, converters=get_converters(cls, numeric), data=data)
 
-            if field_type == "Decimal":
-                if value is None:
-                    data[field_name] = value
-                    continue
+        return cls(**data)
 
-                if value.endswith("%"):
-                    data[field_name] = Decimal(value.split("%")[0])
-                    continue
 
-                if value.endswith(("M", "B")):
-                    data[field_name] = text_to_decimal(value=value)
-                    continue
+class Record(AbstractModel):
+    """Base of lightweight records w/ some fields of custom screener view"""
 
-                if "," in value:
-                    value = value.replace(",", "")
+    __slots__ = ()
 
-                data[field_name] = Decimal(value)
-            else:
-                data[field_name] = value
+    @classmethod
+    def from_response(
+        cls,
+        raw: ty.Dict[str, ty.Any],
+        numeric: ty.Union[Numeric, str] = Numeric.DECIMAL,
+    ) -> Record:
+        """Make class from raw_data, numbers are Decimal or float/int by `numeric`"""
 
-        return Overview(**data)
+        data: ty.Dict[str, ty.Any] = dict()
+        convert(raw=raw, converters=get_converters(cls, numeric), data=data)
+
+        return cls(**data)
+
+
+@functools.lru_cache(maxsize=None)
+def get_record_model(
+    fields: ty.Tuple[ty.Tuple[str, str], ...],
+    frozen: bool = False,
+) -> ty.Any:
+    """Slotted record model w/ only `(name, type)` fields, type is `str` or `Decimal`"""
+
+    namespace: ty.Dict[str, ty.Any] = {
+        name: attr.ib(default=None) for name, _ in fields
+    }
+    namespace.update(
+        __doc__=Record.__doc__,
+        __module__=Record.__module__,
+        __annotations__=dict(fields),
+    )
+
+    klass: ty.Any = type("Record", (Record,), namespace)
+    return attr.s(auto_attribs=True, slots=True, frozen=frozen)(klass)
+
+
+@model_cache
+def get_compact_model(model: ty.Type[AbstractModel], frozen: bool = False) -> ty.Any:
+    """Slotted copy of model w/ the same fields and methods"""
+
+    namespace: ty.Dict[str, ty.Any] = {
+        name: value
+        for name, value in vars(model).items()
+        if not name.startswith("__") and not name.startswith("_attrs_")
+    }
+    namespace.update(
+        __doc__=model.__doc__,
+        __module__=model.__module__,
+        __annotations__=dict(model.__annotations__),
+    )
+
+    for field in attr.fields(model):  # type: ignore[arg-type]
+        if field.default is not attr.NOTHING:
+            namespace[field.name] = attr.ib(default=field.default)
+
+    name: str = ("Frozen" if frozen else "Compact") + model.__name__
+    klass: ty.Any = type(name, (AbstractModel,), namespace)
+    return attr.s(auto_attribs=True, slots=True, frozen=frozen)(klass)
+
+
+Resolver = ty.Callable[[ty.Mapping[str, ty.Any]], ty.Dict[str, ty.Any]]
+
+
+class LazyModel:
+    """
+    Base of lazy variants, raw strings are kept and every field is converted
+    on its first access, then it is a plain attribute.
+    """
+
+    __slots__ = ("_raw", "_plan")
+
+    _model: ty.ClassVar[ty.Type[AbstractModel]]
+
+    def __getattr__(self, name: str) -> ty.Any:
+        """Convert field, called only if it is not converted yet"""
+
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        resolver: ty.Optional[Resolver] = self._plan.get(name)
+        if resolver is None:
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute '{name}'"
+            )
+
+        values: ty.Dict[str, ty.Any] = self.__dict__
+        for field_name, value in resolver(self._raw).items():
+            values.setdefault(field_name, value)
+
+        return values[name]
+
+    @classmethod
+    def from_response(
+        cls,
+        raw: ty.Dict[str, ty.Any],
+        numeric: ty.Union[Numeric, str] = Numeric.DECIMAL,
+    ) -> ty.Any:
+        """Keep raw data, nothing is converted yet"""
+
+        instance: ty.Any = cls.__new__(cls)
+        instance._raw = raw
+        instance._plan = get_lazy_plan(model=cls._model, numeric=numeric)
+        return instance
+
+    def to_dict(self) -> ty.Dict[str, ty.Any]:
+        """Convert all fields, then the same as model does"""
+
+        values: ty.Dict[str, ty.Any] = self.__dict__
+        if len(values) < len(self._plan):
+            for name in self._plan:
+                getattr(self, name)
+
+            ordered: ty.Dict[str, ty.Any] = {
+                name: values.pop(name) for name in self._plan
+            }
+            ordered.update(values)
+            values.clear()
+            values.update(ordered)
+
+        return super().to_dict()  # type: ignore[misc]
+
+
+@model_cache
+def get_lazy_plan(
+    model: ty.Type[AbstractModel],
+    numeric: ty.Union[Numeric, str] = Numeric.DECIMAL,
+) -> ty.Dict[str, Resolver]:
+    """Resolvers by field name, every one returns values of one or more fields"""
+
+    plan: ty.Dict[str, Resolver] = {
+        field.name: functools.partial(
+            lambda raw, name, default: {name: default},
+            name=field.name,
+            default=field.default if field.default is not attr.NOTHING else None,
+        )
+        for field in attr.fields(model)  # type: ignore[arg-type]
+    }
+
+    for field_name, converter in get_converters(model, numeric):
+        plan[field_name] = functools.partial(
+            lambda raw, name, converter: {
+                name: (
+                    converter(raw[name])
+                    if converter is not None and raw.get(name) is not None
+                    else raw.get(name)
+                )
+            },
+            name=field_name,
+            converter=converter,
+        )
+
+    for key, field_names, deriver in model._derived_fields:
+        resolver: Resolver = functools.partial(
+            lambda raw, key, deriver, defaults: (
+                dict(defaults, **deriver(raw[key], numeric))
+                if raw.get(key) is not None
+                else defaults
+            ),
+            key=key,
+            deriver=deriver,
+            defaults={name: None for name in field_names},
+        )
+        for field_name in field_names:
+            plan[field_name] = resolver
+
+    return plan
+
+
+@model_cache
+def get_lazy_model(model: ty.Type[AbstractModel]) -> ty.Any:
+    """Subclass of model w/ lazy conversion of fields"""
+
+    if "__slots__" in vars(model):
+        raise TypeError(
+            f"model {model.__name__} is slotted, lazy variant is not allowed."
+        )
+
+    return type(
+        "Lazy" + model.__name__,
+        (LazyModel, model),
+        dict(
+            __doc__=model.__doc__,
+            __module__=model.__module__,
+            __annotations__=dict(model.__annotations__),
+            __slots__=(),
+            _model=model,
+        ),
+    )
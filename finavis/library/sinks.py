@@ -0,0 +1,359 @@
+from __future__ import annotations
+
+import csv
+import datetime as dt
+import decimal
+import functools
+import json
+import operator
+import os
+import re
+import typing as ty
+
+import attr
+
+from finavis.library.enums import SinkFormat
+from finavis.library.models import INTEGER_FIELDS, model_cache
+from finavis.library.types import Decimal
+
+if ty.TYPE_CHECKING:
+    import pyarrow
+
+DEFAULT_SINK_BATCH_SIZE: int = 1000
+SINK_EXTENSIONS: ty.Dict[str, SinkFormat] = {
+    ".csv": SinkFormat.CSV,
+    ".ndjson": SinkFormat.NDJSON,
+    ".jsonl": SinkFormat.NDJSON,
+    ".parquet": SinkFormat.PARQUET,
+}
+
+Row = ty.Tuple[ty.Any, ...]
+Target = ty.Union[str, "os.PathLike[str]", ty.IO[ty.Any]]
+
+
+@model_cache
+def get_fields(model: ty.Type[ty.Any]) -> ty.Tuple[str, ...]:
+    """Field names of model in order of definition"""
+
+    if attr.has(model):
+        return tuple(field.name for field in attr.fields(model))
+    return tuple(model.__annotations__.keys())
+
+
+@functools.lru_cache(maxsize=None)
+def get_getter(fields: ty.Tuple[str, ...]) -> ty.Callable[[ty.Any], Row]:
+    """Reader of field values of object as tuple, w/o dict copy"""
+
+    getter: ty.Callable[[ty.Any], ty.Any] = operator.attrgetter(*fields)
+    if len(fields) == 1:
+        return lambda obj: (getter(obj),)
+    return getter
+
+
+def to_text(value: ty.Any) -> str:
+    """Cell of CSV, null is empty"""
+
+    return _TEXT_FORMATTERS.get(type(value), str)(value)
+
+
+def to_json(value: ty.Any) -> ty.Any:
+    """Value of JSON for types unknown to encoder"""
+
+    if isinstance(value, decimal.Decimal):
+        return format(value, "f")
+    if isinstance(value, dt.date):
+        return value.isoformat()
+    raise TypeError(f"value of type {type(value).__name__} is not serializable.")
+
+
+_TEXT_FORMATTERS: ty.Dict[type, ty.Callable[[ty.Any], str]] = {
+    str: str,
+    type(None): lambda value: "",
+    Decimal: lambda value: format(value, "f"),
+    decimal.Decimal: lambda value: format(value, "f"),
+    tuple: lambda value: ", ".join(value),
+    dt.date: lambda value: value.isoformat(),
+    dt.datetime: lambda value: value.isoformat(),
+}
+
+
+class AbstractSink:
+    """
+    Writer of model objects (quotes, overviews, records), `batch_size` rows at once.
+
+    Values are read by attribute into tuples, w/o `to_dict`. Fields are taken
+    from `fields` or from model of first object, exceptions (e.g. results of
+    `get_quotes` w/ `on_error="return"`) are skipped. Target is path or open
+    file, the latter is not closed by sink.
+    """
+
+    mode: str = "w"
+
+    def __init__(
+        self,
+        target: Target,
+        fields: ty.Optional[ty.Sequence[str]] = None,
+        batch_size: int = DEFAULT_SINK_BATCH_SIZE,
+    ) -> None:
+        self.target = target
+        self.fields: ty.Optional[ty.Tuple[str, ...]] = (
+            tuple(fields) if fields is not None else None
+        )
+        self.batch_size = max(1, batch_size)
+
+        self.count: int = 0
+        self.skipped: int = 0
+
+        self._rows: ty.List[Row] = list()
+        self._getter: ty.Optional[ty.Callable[[ty.Any], Row]] = None
+        self._file: ty.Optional[ty.IO[ty.Any]] = None
+        self._is_owner: bool = False
+
+    def __repr__(self) -> str:
+        """String representation of class"""
+
+        return (
+            f"<{self.__class__.__name__} "
+            f"target={self.target}, count={self.count}, skipped={self.skipped}>"
+        )
+
+    def __enter__(self) -> AbstractSink:
+        return self
+
+    def __exit__(self, *args: ty.Any) -> None:
+        self.close()
+
+    def write(self, item: ty.Any) -> None:
+        """Buffer object, batch is written once full"""
+
+        if isinstance(item, BaseException):
+            self.skipped += 1
+            return None
+
+        if self._getter is None:
+            self._start(model=type(item))
+
+        self._rows.append(self._getter(item))  # type: ignore[misc]
+        if len(self._rows) >= self.batch_size:
+            self.flush()
+
+    def write_all(self, items: ty.Iterable[ty.Any]) -> int:
+        """Write objects of iterable (e.g. `Screener.iter()`), total written is returned"""
+
+        for item in items:
+            self.write(item)
+        self.flush()
+
+        return self.count
+
+    def flush(self) -> None:
+        """Write buffered rows"""
+
+        if not self._rows:
+            return None
+
+        self._write_rows(rows=self._rows)
+        self.count += len(self._rows)
+        self._rows = list()
+
+        if self._file is not None and hasattr(self._file, "flush"):
+            self._file.flush()
+
+    def close(self) -> None:
+        """Flush rows and finish file, nothing is created if nothing was written"""
+
+        if self._getter is None:
+            return None
+
+        self.flush()
+        self._finish()
+
+        if self._file is not None and self._is_owner:
+            self._file.close()
+        self._file = None
+
+    def _start(self, model: ty.Type[ty.Any]) -> None:
+        """Resolve fields by model and open target"""
+
+        if self.fields is None:
+            self.fields = get_fields(model)
+        self._getter = get_getter(self.fields)
+
+        if hasattr(self.target, "write"):
+            self._file = ty.cast(ty.IO[ty.Any], self.target)
+        else:
+            path: str = os.fspath(ty.cast(str, self.target))
+            directory: str = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            kwargs: ty.Dict[str, ty.Any] = (
+                dict(encoding="utf-8", newline="") if "b" not in self.mode else dict()
+            )
+            self._file = open(path, self.mode, **kwargs)
+            self._is_owner = True
+
+        self._open(model=model)
+
+    def _open(self, model: ty.Type[ty.Any]) -> None:
+        """Hook of opened file, e.g. to write header"""
+
+    def _write_rows(self, rows: ty.List[Row]) -> None:
+        raise NotImplementedError
+
+    def _finish(self) -> None:
+        """Hook before file is closed"""
+
+
+class CsvSink(AbstractSink):
+    """CSV w/ header, nulls are empty cells, index is `, `-joined"""
+
+    def _open(self, model: ty.Type[ty.Any]) -> None:
+        self._writer = csv.writer(ty.cast(ty.TextIO, self._file))
+        self._writer.writerow(self.fields)  # type: ignore[arg-type]
+
+    def _write_rows(self, rows: ty.List[Row]) -> None:
+        self._writer.writerows(tuple(map(to_text, row)) for row in rows)
+
+
+class NdjsonSink(AbstractSink):
+    """
+    JSON object per line, nulls are `null`. Decimals are strings to keep their
+    precision, floats (`numeric="float"` models) are JSON numbers.
+    """
+
+    def _open(self, model: ty.Type[ty.Any]) -> None:
+        self._encoder = json.JSONEncoder(
+            default=to_json, ensure_ascii=False, separators=(",", ":")
+        )
+
+    def _write_rows(self, rows: ty.List[Row]) -> None:
+        encode: ty.Callable[[ty.Any], str] = self._encoder.encode
+        fields: ty.Tuple[str, ...] = ty.cast(ty.Tuple[str, ...], self.fields)
+
+        ty.cast(ty.TextIO, self._file).write(
+            "".join(encode(dict(zip(fields, row))) + "\n" for row in rows)
+        )
+
+
+class ParquetSink(AbstractSink):
+    """
+    Parquet file, every batch is a row group, requires `finavis[frames]`.
+
+    Column types are taken from model: numbers are float64 (int64 for volumes
+    and shares), dates are date32, index is list of strings, nulls are nulls.
+    """
+
+    mode = "wb"
+
+    def _open(self, model: ty.Type[ty.Any]) -> None:
+        import pyarrow.parquet as pq
+
+        fields: ty.Tuple[str, ...] = ty.cast(ty.Tuple[str, ...], self.fields)
+        annotations: ty.Dict[str, ty.Any] = get_annotations(model)
+
+        self._types: ty.List[str] = [
+            get_column_type(name=name, annotation=annotations.get(name, "str"))
+            for name in fields
+        ]
+        self._schema: "pyarrow.Schema" = get_schema(fields=fields, types=self._types)
+        self._writer = pq.ParquetWriter(self._file, self._schema)
+
+    def _write_rows(self, rows: ty.List[Row]) -> None:
+        import pyarrow as pa
+
+        arrays: ty.List["pyarrow.Array"] = list()
+        for kind, values in zip(self._types, zip(*rows)):
+            if kind == "float64":
+                values = tuple(float(x) if x is not None else None for x in values)
+            elif kind == "int64":
+                values = tuple(int(x) if x is not None else None for x in values)
+            arrays.append(pa.array(values, type=self._schema.field(len(arrays)).type))
+
+        self._writer.write_table(pa.Table.from_arrays(arrays, schema=self._schema))
+
+    def _finish(self) -> None:
+        self._writer.close()
+
+
+def get_annotations(model: ty.Type[ty.Any]) -> ty.Dict[str, ty.Any]:
+    """Annotations of model incl. base classes"""
+
+    annotations: ty.Dict[str, ty.Any] = dict()
+    for klass in reversed(model.__mro__):
+        annotations.update(getattr(klass, "__annotations__", {}))
+    return annotations
+
+
+def get_column_type(name: str, annotation: ty.Any) -> str:
+    """Type of parquet column by annotation of field (string or type), nulls are allowed"""
+
+    text: str = annotation.__name__ if isinstance(annotation, type) else str(annotation)
+    text = re.sub(r"\b(?:typing|ty)\.", "", text.replace(" ", ""))
+    optional: ty.Optional[re.Match] = re.fullmatch(r"Optional\[(.+)\]", text)
+    if optional is not None:
+        text = optional.group(1)
+
+    kind: str = _COLUMN_TYPES.get(text, "string")
+    if kind == "float64" and name in INTEGER_FIELDS:
+        return "int64"
+    return kind
+
+
+_COLUMN_TYPES: ty.Dict[str, str] = {
+    "Decimal": "float64",
+    "decimal.Decimal": "float64",
+    "float": "float64",
+    "int": "int64",
+    "date": "date32",
+    "dt.date": "date32",
+    "datetime.date": "date32",
+    "Tuple[str,...]": "list",
+    "tuple[str,...]": "list",
+    "bool": "bool",
+}
+
+
+def get_schema(
+    fields: ty.Sequence[str],
+    types: ty.Sequence[str],
+) -> "pyarrow.Schema":
+    """Arrow schema of columns"""
+
+    import pyarrow as pa
+
+    mapping: ty.Dict[str, "pyarrow.DataType"] = dict(
+        float64=pa.float64(),
+        int64=pa.int64(),
+        date32=pa.date32(),
+        list=pa.list_(pa.string()),
+        bool=pa.bool_(),
+        string=pa.string(),
+    )
+    return pa.schema([(name, mapping[kind]) for name, kind in zip(fields, types)])
+
+
+_sink_mapping: ty.Dict[str, ty.Type[AbstractSink]] = {
+    SinkFormat.CSV.value: CsvSink,
+    SinkFormat.NDJSON.value: NdjsonSink,
+    SinkFormat.PARQUET.value: ParquetSink,
+}
+
+
+def get_sink(
+    target: Target,
+    format: ty.Optional[ty.Union[SinkFormat, str]] = None,
+    **kwargs: ty.Any,
+) -> AbstractSink:
+    """Sink by `format`, or by extension of path if format is not set"""
+
+    if format is None and not hasattr(target, "write"):
+        _, extension = os.path.splitext(os.fspath(ty.cast(str, target)))
+        format = SINK_EXTENSIONS.get(extension.lower())
+
+    if format is None or str(format) not in SinkFormat:
+        raise TypeError(
+            f"arg format={format} is not allowed, please select "
+            f"some another, if required: {', '.join(SinkFormat.values())}."
+        )
+
+    return _sink_mapping[str(format)](target, **kwargs)
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import time
+import typing as ty
+
+import attr
+
+SNAPSHOT_VERSION: int = 1
+
+Row = ty.Tuple[ty.Optional[str], ...]
+Change = ty.Tuple[ty.Optional[str], ty.Optional[str]]
+
+
+@attr.s(auto_attribs=True, slots=True, frozen=True)
+class Delta:
+    """
+    Changes between two snapshots, values are raw cells of table.
+
+    :param ty.Dict[str, ty.Dict[str, ty.Optional[str]]] added: New rows by ticker
+    :param ty.Tuple[str, ...] removed: Tickers missing in newer snapshot
+    :param ty.Dict[str, ty.Dict[str, Change]] changed: `(old, new)` by field by ticker
+    """
+
+    added: ty.Dict[str, ty.Dict[str, ty.Optional[str]]] = attr.Factory(dict)
+    removed: ty.Tuple[str, ...] = tuple()
+    changed: ty.Dict[str, ty.Dict[str, Change]] = attr.Factory(dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    def __len__(self) -> int:
+        """Total tickers touched"""
+
+        return len(self.added) + len(self.removed) + len(self.changed)
+
+    def to_dict(self) -> ty.Dict[str, ty.Any]:
+        return dict(
+            added=self.added,
+            removed=list(self.removed),
+            changed={
+                ticker: {name: list(change) for name, change in fields.items()}
+                for ticker, fields in self.changed.items()
+            },
+        )
+
+
+class Snapshot:
+    """
+    Raw table rows of one screener run, keyed by ticker.
+
+    Rows are kept as tuples of cells, so comparing runs is tuple equality per
+    ticker, fields are compared one by one only for rows which differ.
+    """
+
+    def __init__(
+        self,
+        fields: ty.Sequence[str],
+        rows: ty.Optional[ty.Dict[str, Row]] = None,
+        created_at: ty.Optional[float] = None,
+    ) -> None:
+        if "ticker" not in fields:
+            raise TypeError("field ticker is required to key rows of snapshot.")
+
+        self.fields: ty.Tuple[str, ...] = tuple(fields)
+        self.rows: ty.Dict[str, Row] = rows if rows is not None else dict()
+        self.created_at: float = created_at if created_at is not None else time.time()
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __contains__(self, ticker: object) -> bool:
+        return ticker in self.rows
+
+    def __iter__(self) -> ty.Iterator[str]:
+        return iter(self.rows)
+
+    def __repr__(self) -> str:
+        """String representation of class"""
+
+        return (
+            f"<{self.__class__.__name__} "
+            f"rows={len(self)}, fields={len(self.fields)}, created_at={self.created_at}>"
+        )
+
+    @classmethod
+    def from_rows(
+        cls,
+        fields: ty.Sequence[str],
+        rows: ty.Iterable[ty.Sequence[ty.Optional[str]]],
+    ) -> Snapshot:
+        """Make snapshot from raw table rows, the last row of ticker wins"""
+
+        snapshot: Snapshot = cls(fields=fields)
+        index: int = snapshot.fields.index("ticker")
+        for row in rows:
+            snapshot.rows[ty.cast(str, row[index])] = tuple(row)
+        return snapshot
+
+    def get(self, ticker: str) -> ty.Optional[ty.Dict[str, ty.Optional[str]]]:
+        """Raw row of ticker by field name, ready for `model.from_response`"""
+
+        row: ty.Optional[Row] = self.rows.get(ticker)
+        return dict(zip(self.fields, row)) if row is not None else None
+
+    def diff(self, previous: ty.Optional[Snapshot]) -> Delta:
+        """Changes since `previous` snapshot, everything is added if there is none"""
+
+        if previous is None:
+            return Delta(added={ticker: self.get(ticker) for ticker in self.rows})  # type: ignore[misc]
+
+        if previous.fields != self.fields:
+            raise TypeError(
+                f"snapshot w/ fields={', '.join(previous.fields)} is not comparable, "
+                f"fields should be: {', '.join(self.fields)}."
+            )
+
+        added: ty.Dict[str, ty.Dict[str, ty.Optional[str]]] = dict()
+        changed: ty.Dict[str, ty.Dict[str, Change]] = dict()
+        for ticker, row in self.rows.items():
+            old: ty.Optional[Row] = previous.rows.get(ticker)
+            if old is None:
+                added[ticker] = dict(zip(self.fields, row))
+            elif old != row:
+                changed[ticker] = {
+                    name: (before, after)
+                    for name, before, after in zip(self.fields, old, row)
+                    if before != after
+                }
+
+        removed: ty.Tuple[str, ...] = tuple(
+            ticker for ticker in previous.rows if ticker not in self.rows
+        )
+
+        return Delta(added=added, removed=removed, changed=changed)
+
+    def save(self, path: str) -> None:
+        """Write snapshot as one JSON document (gzipped if path ends w/ `.gz`)"""
+
+        data: str = json.dumps(
+            dict(
+                version=SNAPSHOT_VERSION,
+                created_at=self.created_at,
+                fields=self.fields,
+                rows=list(self.rows.values()),
+            ),
+            separators=(",", ":"),
+        )
+
+        directory: str = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        temp_path: str = f"{path}.tmp"
+        with _open(path=temp_path, mode="wt") as file:
+            file.write(data)
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> Snapshot:
+        """Read snapshot written by `save`"""
+
+        with _open(path=path, mode="rt") as file:
+            data: ty.Dict[str, ty.Any] = json.load(file)
+
+        if data.get("version") != SNAPSHOT_VERSION:
+            raise TypeError(f"snapshot version={data.get('version')} is not supported.")
+
+        snapshot: Snapshot = cls(fields=data["fields"], created_at=data["created_at"])
+        index: int = snapshot.fields.index("ticker")
+        snapshot.rows = {row[index]: tuple(row) for row in data["rows"]}
+        return snapshot
+
+
+def _open(path: str, mode: str) -> ty.TextIO:
+    """Text file, gzipped by extension of path w/o `.tmp`"""
+
+    if path.removesuffix(".tmp").endswith(".gz"):
+        return ty.cast(ty.TextIO, gzip.open(path, mode, encoding="utf-8"))
+    return ty.cast(ty.TextIO, open(path, mode, encoding="utf-8"))
@@ -1,10 +1,48 @@
-from .functions import text_to_decimal, text_to_label
+from .caches import (
+    DEFAULT_CACHE_MAXSIZE,
+    DEFAULT_CACHE_NEGATIVE_TTL,
+    DEFAULT_CACHE_TTL,
+    AbstractCache,
+    TTLCache,
+    get_cache,
+    set_cache,
+)
+from .flights import SingleFlight
+from .functions import text_to_decimal, text_to_float, text_to_label
+from .limits import ConcurrencyController, RateLimiter, get_controller, get_rate_limiter
+from .metrics import (
+    Counter,
+    Histogram,
+    MetricsRegistry,
+    get_kind,
+    get_metrics,
+    set_metrics,
+)
+from .proxies import (
+    DEFAULT_PROXY_COOLDOWN,
+    DEFAULT_PROXY_MAX_FAILURES,
+    Proxy,
+    ProxyPool,
+    ProxyStats,
+)
 from .sessions import (
+    DEFAULT_BASE_URL,
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_CLIENT_TIMEOUT,
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
     DEFAULT_REQUEST_TIMEOUT,
     DEFAULT_RETRY_ALLOWED_METHODS,
     DEFAULT_RETRY_BACKOFF_FACTOR,
     DEFAULT_RETRY_TOTAL,
+    Client,
     Session,
+    get_client,
     get_session,
     make_request,
+    parse_document,
+    set_client,
+    stream_request,
 )
+from .storages import DEFAULT_PAGE_CACHE_PATH, PageCache, PageEntry
+from .transports import Recording, Transport, load_recordings
@@ -0,0 +1,152 @@
+import threading
+import time
+import typing as ty
+from collections import OrderedDict
+
+DEFAULT_CACHE_MAXSIZE: int = 4096
+DEFAULT_CACHE_TTL: float = 15 * 60
+DEFAULT_CACHE_NEGATIVE_TTL: float = 5 * 60
+
+_MISSING: ty.Any = object()
+
+
+class AbstractCache:
+    """Interface of pluggable cache, keys are namespaced strings"""
+
+    def get(self, key: str, default: ty.Any = None) -> ty.Any:
+        raise NotImplementedError
+
+    def set(self, key: str, value: ty.Any, ttl: ty.Optional[float] = None) -> None:
+        raise NotImplementedError
+
+    def invalidate(self, key: str) -> bool:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+class TTLCache(AbstractCache):
+    """Thread-safe LRU cache w/ expiration, exceptions are cached w/ `negative_ttl`"""
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_CACHE_MAXSIZE,
+        ttl: float = DEFAULT_CACHE_TTL,
+        negative_ttl: float = DEFAULT_CACHE_NEGATIVE_TTL,
+        timer: ty.Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialization"""
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.timer = timer
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.expirations: int = 0
+
+        self._data: ty.OrderedDict[str, ty.Tuple[float, ty.Any]] = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """String representation of class"""
+
+        return (
+            f"<{self.__class__.__name__} "
+            f"size={len(self)}, maxsize={self.maxsize}, ttl={self.ttl}, "
+            f"hits={self.hits}, misses={self.misses}, evictions={self.evictions}>"
+        )
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: str) -> bool:
+        entry: ty.Optional[ty.Tuple[float, ty.Any]] = self._data.get(key)
+        return entry is not None and entry[0] > self.timer()
+
+    @property
+    def stats(self) -> ty.Dict[str, int]:
+        """Counters of cache"""
+
+        return dict(
+            size=len(self),
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            expirations=self.expirations,
+        )
+
+    def get(self, key: str, default: ty.Any = None) -> ty.Any:
+        """Value by key if not expired"""
+
+        with self._lock:
+            entry: ty.Optional[ty.Tuple[float, ty.Any]] = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            expires_at, value = entry
+            if expires_at <= self.timer():
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: ty.Any, ttl: ty.Optional[float] = None) -> None:
+        """Store value, least recently used entries are evicted"""
+
+        if ttl is None:
+            ttl = self.negative_ttl if isinstance(value, Exception) else self.ttl
+
+        with self._lock:
+            self._data[key] = (self.timer() + ttl, value)
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: str) -> bool:
+        """Drop entry by key"""
+
+        with self._lock:
+            return self._data.pop(key, _MISSING) is not _MISSING
+
+    def clear(self) -> None:
+        """Drop all entries"""
+
+        with self._lock:
+            self._data.clear()
+
+
+_cache: ty.Optional[AbstractCache] = None
+_cache_lock: threading.Lock = threading.Lock()
+
+
+def get_cache() -> AbstractCache:
+    """Default cache shared by module-level functions"""
+
+    global _cache
+
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = TTLCache()
+
+    return _cache
+
+
+def set_cache(cache: ty.Optional[AbstractCache]) -> None:
+    """Replace default shared cache (`None` to reset it)"""
+
+    global _cache
+
+    with _cache_lock:
+        _cache = cache
@@ -0,0 +1,69 @@
+import threading
+import typing as ty
+
+T = ty.TypeVar("T")
+
+
+class Flight:
+    """Call in progress, result or exception is shared by every waiter"""
+
+    __slots__ = ("event", "result", "error", "waiters")
+
+    def __init__(self) -> None:
+        self.event: threading.Event = threading.Event()
+        self.result: ty.Any = None
+        self.error: ty.Optional[BaseException] = None
+        self.waiters: int = 0
+
+
+class SingleFlight:
+    """
+    Coalescing of concurrent identical calls.
+
+    The first caller of key runs the function, callers of the same key
+    arriving while it runs wait for it and get the same result or exception.
+    Nothing is kept once call is done, so it is not a cache.
+    """
+
+    def __init__(self) -> None:
+        self.flights: ty.Dict[str, Flight] = dict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Calls in progress"""
+
+        return len(self.flights)
+
+    def __repr__(self) -> str:
+        """String representation of class"""
+
+        return f"<{self.__class__.__name__} in_flight={len(self)}>"
+
+    def do(self, key: str, func: ty.Callable[[], T]) -> ty.Tuple[T, bool]:
+        """Result of call by key and whether it was shared w/ call in progress"""
+
+        with self._lock:
+            flight: ty.Optional[Flight] = self.flights.get(key)
+            is_leader: bool = flight is None
+            if flight is None:
+                flight = self.flights[key] = Flight()
+            else:
+                flight.waiters += 1
+
+        if not is_leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result, True
+
+        try:
+            flight.result = func()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self.flights[key]
+            flight.event.set()
+
+        return flight.result, False
@@ -52,3 +52,27 @@ def text_to_decimal(value: str) -> ty.Optional[Decimal]:
 
     sym: str = value[-1]
     return Decimal(str(int(Decimal(value.split(sym)[0]) * mapp[sym])))
+
+
+_FLOAT_MULTIPLIERS: ty.Dict[str, float] = {
+    "K": 1e3,
+    "M": 1e6,
+    "B": 1e9,
+    "T": 1e12,
+}
+
+
+def text_to_float(value: ty.Optional[str]) -> ty.Optional[float]:
+    """Some `1.5B`, `-0.20%` or `27,070,101` convert to float"""
+
+    if value is None or value == "-":
+        return None
+
+    multiplier: ty.Optional[float] = _FLOAT_MULTIPLIERS.get(value[-1])
+    if multiplier is not None:
+        return float(value[:-1]) * multiplier
+
+    if value.endswith("%"):
+        return float(value[:-1])
+
+    return float(value.replace(",", ""))
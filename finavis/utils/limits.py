@@ -0,0 +1,312 @@
+import asyncio
+import datetime as dt
+import threading
+import time
+import typing as ty
+from email.utils import parsedate_to_datetime
+
+DEFAULT_RATE_LIMIT: float = 10.0
+DEFAULT_RATE_BURST: int = 10
+DEFAULT_MIN_RATE_LIMIT: float = 0.5
+DEFAULT_CONCURRENCY_LIMIT: int = 4
+DEFAULT_MIN_CONCURRENCY_LIMIT: int = 1
+DEFAULT_MAX_CONCURRENCY_LIMIT: int = 32
+DEFAULT_LATENCY_TARGET: float = 1.5
+DEFAULT_DECREASE_FACTOR: float = 0.5
+DEFAULT_THROTTLE_PAUSE: float = 1.0
+DEFAULT_POLL_INTERVAL: float = 0.01
+
+
+class RateLimiter:
+    """Token bucket shared by threads and asyncio tasks"""
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE_LIMIT,
+        burst: int = DEFAULT_RATE_BURST,
+    ) -> None:
+        """Initialization, `rate` is requests per second"""
+
+        if rate <= 0 or burst < 1:
+            raise ValueError(f"rate and burst must be positive ({rate=}, {burst=})")
+
+        self._rate: float = float(rate)
+        self.burst: int = burst
+        self._tokens: float = float(burst)
+        self._updated: float = time.monotonic()
+        self._waiting: int = 0
+        self._lock: threading.Lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """String representation of class"""
+
+        return (
+            f"<{self.__class__.__name__} "
+            f"rate={self.rate:.2f}, burst={self.burst}, queue_depth={self.queue_depth}>"
+        )
+
+    @property
+    def rate(self) -> float:
+        """Current rate, requests per second"""
+
+        return self._rate
+
+    @rate.setter
+    def rate(self, value: float) -> None:
+        with self._lock:
+            self._refill(now=time.monotonic())
+            self._rate = float(value)
+
+    @property
+    def queue_depth(self) -> int:
+        """Callers waiting for a token right now"""
+
+        return self._waiting
+
+    def _refill(self, now: float) -> None:
+        elapsed: float = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(float(self.burst), self._tokens + elapsed * self._rate)
+            self._updated = now
+
+    def reserve(self) -> float:
+        """Take a token, returns seconds to wait before using it"""
+
+        with self._lock:
+            now: float = time.monotonic()
+            self._refill(now=now)
+            self._tokens -= 1
+
+            delay: float = max(0.0, self._updated - now)
+            if self._tokens < 0:
+                delay += -self._tokens / self._rate
+
+            return delay
+
+    def pause(self, seconds: float) -> None:
+        """Stop issuing tokens for some time (e.g. `Retry-After`)"""
+
+        with self._lock:
+            now: float = time.monotonic()
+            self._refill(now=now)
+            self._tokens = min(self._tokens, 0.0)
+            self._updated = max(self._updated, now + seconds)
+
+    def acquire(self) -> None:
+        """Blocking wait for token"""
+
+        delay: float = self.reserve()
+        if delay > 0:
+            self._set_waiting(step=1)
+            try:
+                time.sleep(delay)
+            finally:
+                self._set_waiting(step=-1)
+
+    async def acquire_async(self) -> None:
+        """Non-blocking wait for token"""
+
+        delay: float = self.reserve()
+        if delay > 0:
+            self._set_waiting(step=1)
+            try:
+                await asyncio.sleep(delay)
+            finally:
+                self._set_waiting(step=-1)
+
+    def _set_waiting(self, step: int) -> None:
+        with self._lock:
+            self._waiting += step
+
+
+class ConcurrencyController:
+    """AIMD controller of in-flight requests and rate of limiter"""
+
+    def __init__(
+        self,
+        limiter: ty.Optional[RateLimiter] = None,
+        limit: int = DEFAULT_CONCURRENCY_LIMIT,
+        min_limit: int = DEFAULT_MIN_CONCURRENCY_LIMIT,
+        max_limit: int = DEFAULT_MAX_CONCURRENCY_LIMIT,
+        min_rate: float = DEFAULT_MIN_RATE_LIMIT,
+        max_rate: ty.Optional[float] = None,
+        latency_target: float = DEFAULT_LATENCY_TARGET,
+        decrease_factor: float = DEFAULT_DECREASE_FACTOR,
+    ) -> None:
+        """Initialization, `max_rate` defaults to current rate of limiter"""
+
+        self.limiter = limiter
+        self._limit: float = float(limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.min_rate = min_rate
+        self.max_rate = max_rate or (limiter.rate if limiter is not None else None)
+        self.latency_target = latency_target
+        self.decrease_factor = decrease_factor
+
+        self.in_flight: int = 0
+        self._waiting: int = 0
+        self._condition: threading.Condition = threading.Condition()
+
+    def __repr__(self) -> str:
+        """String representation of class"""
+
+        return (
+            f"<{self.__class__.__name__} "
+            f"limit={self.limit}, in_flight={self.in_flight}, "
+            f"queue_depth={self.queue_depth}>"
+        )
+
+    @property
+    def limit(self) -> int:
+        """Current limit of in-flight requests"""
+
+        return max(self.min_limit, int(self._limit))
+
+    @property
+    def queue_depth(self) -> int:
+        """Callers waiting for a slot right now"""
+
+        return self._waiting
+
+    def try_acquire(self) -> bool:
+        """Take a slot if any"""
+
+        with self._condition:
+            if self.in_flight < self.limit:
+                self.in_flight += 1
+                return True
+
+        return False
+
+    def acquire(self) -> None:
+        """Blocking wait for slot"""
+
+        with self._condition:
+            self._waiting += 1
+            try:
+                while self.in_flight >= self.limit:
+                    self._condition.wait()
+            finally:
+                self._waiting -= 1
+
+            self.in_flight += 1
+
+    async def acquire_async(self, poll_interval: float = DEFAULT_POLL_INTERVAL) -> None:
+        """Non-blocking wait for slot"""
+
+        if self.try_acquire():
+            return None
+
+        with self._condition:
+            self._waiting += 1
+        try:
+            while not self.try_acquire():
+                await asyncio.sleep(poll_interval)
+        finally:
+            with self._condition:
+                self._waiting -= 1
+
+    def cancel(self) -> None:
+        """Free slot of request that was not sent, limits are kept"""
+
+        with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    def release(
+        self,
+        latency: float,
+        status_code: ty.Optional[int] = None,
+        retry_after: ty.Optional[str] = None,
+        throttle: bool = True,
+    ) -> None:
+        """
+        Free slot and adjust limits, `status_code=None` is connection error.
+
+        Throttling cuts limits and pauses limiter unless `throttle` is off
+        (e.g. if proxy of request cools down on its own), slot is just freed.
+        """
+
+        throttled: bool = status_code is None or status_code == 429
+        throttled = throttled or status_code >= 500  # type: ignore[operator]
+
+        with self._condition:
+            self.in_flight -= 1
+
+            if throttled and throttle:
+                self._limit = max(
+                    float(self.min_limit), self._limit * self.decrease_factor
+                )
+            elif not throttled and latency <= self.latency_target:
+                self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
+
+            self._condition.notify_all()
+
+        if self.limiter is None or (throttled and not throttle):
+            return None
+
+        if throttled:
+            self.limiter.rate = max(
+                self.min_rate, self.limiter.rate * self.decrease_factor
+            )
+            self.limiter.pause(
+                seconds=get_retry_after(value=retry_after) or DEFAULT_THROTTLE_PAUSE
+            )
+        elif latency <= self.latency_target and self.max_rate is not None:
+            rate: float = self.limiter.rate
+            if rate < self.max_rate:
+                self.limiter.rate = min(self.max_rate, rate + 1 / rate)
+
+
+def get_retry_after(value: ty.Optional[str]) -> ty.Optional[float]:
+    """Seconds from `Retry-After` header (delay-seconds or HTTP-date)"""
+
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at: dt.datetime = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=dt.timezone.utc)
+
+    return max(0.0, (retry_at - dt.datetime.now(tz=dt.timezone.utc)).total_seconds())
+
+
+_rate_limiter: ty.Optional[RateLimiter] = None
+_controller: ty.Optional[ConcurrencyController] = None
+_lock: threading.Lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Process-wide limiter shared by every client"""
+
+    global _rate_limiter
+
+    if _rate_limiter is None:
+        with _lock:
+            if _rate_limiter is None:
+                _rate_limiter = RateLimiter()
+
+    return _rate_limiter
+
+
+def get_controller() -> ConcurrencyController:
+    """Process-wide controller shared by every client"""
+
+    global _controller
+
+    if _controller is None:
+        limiter: RateLimiter = get_rate_limiter()
+        with _lock:
+            if _controller is None:
+                _controller = ConcurrencyController(limiter=limiter)
+
+    return _controller
@@ -0,0 +1,329 @@
+import bisect
+import threading
+import typing as ty
+
+DEFAULT_LATENCY_BUCKETS: ty.Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+DEFAULT_BYTES_BUCKETS: ty.Tuple[float, ...] = (
+    1024,
+    4 * 1024,
+    16 * 1024,
+    64 * 1024,
+    256 * 1024,
+    1024 * 1024,
+    4 * 1024 * 1024,
+)
+
+Labels = ty.Tuple[str, ...]
+Hook = ty.Callable[[str, float, ty.Dict[str, str]], None]
+
+
+class Metric:
+    """Named metric w/ fixed label names, values are kept per label values"""
+
+    kind: str = ""
+
+    def __init__(
+        self,
+        name: str,
+        description: str = "",
+        labels: ty.Sequence[str] = ("kind",),
+        hooks: ty.Optional[ty.List[Hook]] = None,
+    ) -> None:
+        self.name = name
+        self.description = description
+        self.labels: Labels = tuple(labels)
+        self.hooks: ty.List[Hook] = hooks if hooks is not None else list()
+        self.values: ty.Dict[Labels, ty.Any] = dict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """String representation of class"""
+
+        return f"<{self.__class__.__name__} name={self.name}, labels={self.labels}>"
+
+    def get_key(self, labels: ty.Dict[str, str]) -> Labels:
+        """Label values in order of label names, missing are empty"""
+
+        return tuple(str(labels.get(name, "")) for name in self.labels)
+
+    def get(self, **labels: str) -> ty.Any:
+        raise NotImplementedError
+
+    def reset(self) -> None:
+        with self._lock:
+            self.values.clear()
+
+    def notify(self, value: float, labels: ty.Dict[str, str]) -> None:
+        """Call hooks, if any"""
+
+        for hook in self.hooks:
+            hook(self.name, value, labels)
+
+
+class Counter(Metric):
+    """Monotonic counter"""
+
+    kind = "counter"
+
+    def inc(self, value: float = 1, **labels: str) -> None:
+        key: Labels = self.get_key(labels=labels)
+        with self._lock:
+            self.values[key] = self.values.get(key, 0) + value
+
+        if self.hooks:
+            self.notify(value=value, labels=labels)
+
+    def get(self, **labels: str) -> float:
+        return self.values.get(self.get_key(labels=labels), 0)
+
+
+class Histogram(Metric):
+    """Cumulative-bucket histogram w/ sum and count"""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        *args: ty.Any,
+        buckets: ty.Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+        **kwargs: ty.Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.buckets: ty.Tuple[float, ...] = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Count value in its bucket, last slots are `+Inf`, sum and count"""
+
+        key: Labels = self.get_key(labels=labels)
+        index: int = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            row: ty.Optional[ty.List[float]] = self.values.get(key)
+            if row is None:
+                row = self.values[key] = [0] * (len(self.buckets) + 3)
+            row[index] += 1
+            row[-2] += value
+            row[-1] += 1
+
+        if self.hooks:
+            self.notify(value=value, labels=labels)
+
+    def get(self, **labels: str) -> ty.Dict[str, ty.Any]:
+        """Cumulative buckets, sum and count of label values"""
+
+        row: ty.List[float] = self.values.get(
+            self.get_key(labels=labels), [0] * (len(self.buckets) + 3)
+        )
+
+        buckets: ty.Dict[str, float] = dict()
+        total: float = 0
+        for bound, count in zip(self.buckets + (float("inf"),), row):
+            total += count
+            buckets[str(bound)] = total
+
+        return dict(buckets=buckets, sum=row[-2], count=row[-1])
+
+
+class MetricsRegistry:
+    """
+    Counters and histograms of hot path, labeled by `kind` of page.
+
+    Hooks are called w/ metric name, value and labels on every record.
+    Nothing is recorded by callers if registry is disabled.
+    """
+
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self.hooks: ty.List[Hook] = list()
+        self.metrics: ty.Dict[str, Metric] = dict()
+        self._lock: threading.Lock = threading.Lock()
+
+        self.requests = self.counter(
+            "finavis_requests_total",
+            "Requests by status code (`error` if no response)",
+            labels=("kind", "status"),
+        )
+        self.retries = self.counter(
+            "finavis_retries_total", "Retries done by connection pool"
+        )
+        self.page_cache = self.counter(
+            "finavis_page_cache_total",
+            "Page cache lookups by result (`fresh`, `revalidated`, `miss`)",
+            labels=("kind", "result"),
+        )
+        self.coalesced = self.counter(
+            "finavis_coalesced_total",
+            "Callers served by identical request or quote already in flight",
+        )
+        self.response_bytes = self.counter(
+            "finavis_response_bytes_total", "Bytes of response bodies"
+        )
+        self.ttfb = self.histogram(
+            "finavis_ttfb_seconds", "Seconds till response headers were received"
+        )
+        self.latency = self.histogram(
+            "finavis_request_seconds", "Seconds of request incl. body download"
+        )
+        self.size = self.histogram(
+            "finavis_response_bytes",
+            "Bytes of response body",
+            buckets=DEFAULT_BYTES_BUCKETS,
+        )
+        self.parse = self.histogram(
+            "finavis_parse_seconds", "Seconds of building DOM from response body"
+        )
+        self.extract = self.histogram(
+            "finavis_extract_seconds", "Seconds of extracting raw data from DOM"
+        )
+        self.build = self.histogram(
+            "finavis_build_seconds", "Seconds of `from_response` per page or quote"
+        )
+
+    def __repr__(self) -> str:
+        """String representation of class"""
+
+        return (
+            f"<{self.__class__.__name__} "
+            f"enabled={self.enabled}, metrics={len(self.metrics)}>"
+        )
+
+    def counter(
+        self,
+        name: str,
+        description: str = "",
+        labels: ty.Sequence[str] = ("kind",),
+    ) -> Counter:
+        """Registered counter by name, created if required"""
+
+        return ty.cast(Counter, self._register(Counter, name, description, labels))
+
+    def histogram(
+        self,
+        name: str,
+        description: str = "",
+        labels: ty.Sequence[str] = ("kind",),
+        buckets: ty.Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Registered histogram by name, created if required"""
+
+        return ty.cast(
+            Histogram,
+            self._register(Histogram, name, description, labels, buckets=buckets),
+        )
+
+    def add_hook(self, hook: Hook) -> None:
+        """Call `hook(name, value, labels)` on every record"""
+
+        self.hooks.append(hook)
+
+    def remove_hook(self, hook: Hook) -> None:
+        self.hooks.remove(hook)
+
+    def reset(self) -> None:
+        """Drop all recorded values"""
+
+        for metric in self.metrics.values():
+            metric.reset()
+
+    def snapshot(self) -> ty.Dict[str, ty.Dict[str, ty.Any]]:
+        """Recorded values by metric name and label values"""
+
+        result: ty.Dict[str, ty.Dict[str, ty.Any]] = dict()
+        for name, metric in self.metrics.items():
+            values: ty.Dict[str, ty.Any] = dict()
+            for key in list(metric.values):
+                labels: ty.Dict[str, str] = dict(zip(metric.labels, key))
+                name_of_labels: str = ",".join(f"{k}={v}" for k, v in labels.items())
+                values[name_of_labels] = metric.get(**labels)
+            result[name] = dict(type=metric.kind, values=values)
+        return result
+
+    def to_text(self) -> str:
+        """Recorded values in Prometheus text format"""
+
+        lines: ty.List[str] = list()
+        for name, metric in self.metrics.items():
+            lines.append(f"# HELP {name} {metric.description}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            for key in list(metric.values):
+                labels = dict(zip(metric.labels, key))
+                pairs: ty.List[str] = [f'{k}="{v}"' for k, v in labels.items()]
+
+                if isinstance(metric, Counter):
+                    lines.append(f"{name}{{{','.join(pairs)}}} {metric.get(**labels)}")
+                    continue
+
+                data: ty.Dict[str, ty.Any] = ty.cast(Histogram, metric).get(**labels)
+                for bound, count in data["buckets"].items():
+                    le: str = "+Inf" if bound == "inf" else bound
+                    bucket: str = ",".join(pairs + [f'le="{le}"'])
+                    lines.append(f"{name}_bucket{{{bucket}}} {count}")
+                lines.append(f"{name}_sum{{{','.join(pairs)}}} {data['sum']}")
+                lines.append(f"{name}_count{{{','.join(pairs)}}} {data['count']}")
+
+        return "\n".join(lines) + "\n"
+
+    def _register(
+        self,
+        klass: ty.Type[Metric],
+        name: str,
+        description: str,
+        labels: ty.Sequence[str],
+        **kwargs: ty.Any,
+    ) -> Metric:
+        with self._lock:
+            metric: ty.Optional[Metric] = self.metrics.get(name)
+            if metric is None:
+                metric = self.metrics[name] = klass(
+                    name, description, labels=labels, hooks=self.hooks, **kwargs
+                )
+            elif not isinstance(metric, klass):
+                raise TypeError(f"metric {name} is already registered as {metric.kind}")
+        return metric
+
+
+def get_kind(path: str) -> str:
+    """Label of page by path"""
+
+    if path.startswith("/quote"):
+        return "quote"
+    if path.startswith("/screener"):
+        return "screener"
+    return "other"
+
+
+_metrics: ty.Optional[MetricsRegistry] = None
+_lock: threading.Lock = threading.Lock()
+
+
+def get_metrics() -> MetricsRegistry:
+    """Process-wide registry shared by every client"""
+
+    global _metrics
+
+    if _metrics is None:
+        with _lock:
+            if _metrics is None:
+                _metrics = MetricsRegistry()
+
+    return _metrics
+
+
+def set_metrics(metrics: ty.Optional[MetricsRegistry]) -> None:
+    """Replace process-wide registry (`None` to reset it)"""
+
+    global _metrics
+
+    with _lock:
+        _metrics = metrics
@@ -0,0 +1,253 @@
+import itertools
+import threading
+import time
+import typing as ty
+from urllib.parse import urlparse
+
+import attr
+from requests import Session
+
+from finavis.library.enums import ProxyStrategy
+
+from .limits import RateLimiter, get_retry_after
+
+DEFAULT_PROXY_COOLDOWN: float = 30.0
+DEFAULT_PROXY_MAX_FAILURES: int = 3
+
+
+@attr.s(auto_attribs=True, slots=True, frozen=True)
+class ProxyStats:
+    """
+    Report of proxy.
+
+    :param str name: Proxy URL w/o credentials
+    :param int requests: Requests done
+    :param int errors: Connection errors and 5xx responses
+    :param int throttled: 429 responses
+    :param int in_flight: Requests in flight right now
+    :param float latency: Average seconds of request
+    :param float cooldown: Seconds till proxy is back in rotation, 0 if it is there
+    """
+
+    name: str
+    requests: int = 0
+    errors: int = 0
+    throttled: int = 0
+    in_flight: int = 0
+    latency: float = 0.0
+    cooldown: float = 0.0
+
+    @property
+    def error_rate(self) -> float:
+        """Share of failed requests (errors and throttled)"""
+
+        if not self.requests:
+            return 0.0
+        return (self.errors + self.throttled) / self.requests
+
+    @property
+    def is_available(self) -> bool:
+        return self.cooldown <= 0
+
+
+class Proxy:
+    """Proxy w/ its own pooled session, optional limiter and counters"""
+
+    def __init__(
+        self,
+        url: str,
+        session: Session,
+        rate_limiter: ty.Optional[RateLimiter] = None,
+    ) -> None:
+        self.url = url
+        self.name: str = get_proxy_name(url=url)
+        self.session = session
+        self.rate_limiter = rate_limiter
+
+        self.in_flight: int = 0
+        self.requests: int = 0
+        self.errors: int = 0
+        self.throttled: int = 0
+        self.failures: int = 0
+        self.latency_sum: float = 0.0
+        self.cooldown_until: float = 0.0
+
+    def __repr__(self) -> str:
+        """String representation of class"""
+
+        return (
+            f"<{self.__class__.__name__} "
+            f"name={self.name}, in_flight={self.in_flight}, requests={self.requests}>"
+        )
+
+    def get_stats(self, now: float) -> ProxyStats:
+        return ProxyStats(
+            name=self.name,
+            requests=self.requests,
+            errors=self.errors,
+            throttled=self.throttled,
+            in_flight=self.in_flight,
+            latency=self.latency_sum / self.requests if self.requests else 0.0,
+            cooldown=max(0.0, self.cooldown_until - now),
+        )
+
+
+class ProxyPool:
+    """
+    Requests spread over proxies, each w/ its own keep-alive session.
+
+    Proxy is picked by `strategy` (`round_robin` or `least_loaded`, i.e. fewest
+    requests in flight) among ones not cooling down. Throttled proxy (429) is
+    taken out of rotation for `Retry-After` or `cooldown` seconds, failing one
+    after `max_failures` errors in a row. If every proxy cools down, caller
+    waits for the first one to be back. Every proxy is limited to `rate`
+    requests per second if set.
+    """
+
+    def __init__(
+        self,
+        proxy_urls: ty.Sequence[str],
+        strategy: ty.Union[ProxyStrategy, str] = ProxyStrategy.ROUND_ROBIN,
+        cooldown: float = DEFAULT_PROXY_COOLDOWN,
+        max_failures: int = DEFAULT_PROXY_MAX_FAILURES,
+        rate: ty.Optional[float] = None,
+        **session_kwargs: ty.Any,
+    ) -> None:
+        """Initialization, `session_kwargs` are passed to `get_session` of every proxy"""
+
+        from .sessions import get_session
+
+        if not proxy_urls:
+            raise TypeError("arg proxy_urls should have at least one proxy url.")
+
+        if str(strategy) not in ProxyStrategy:
+            raise TypeError(
+                f"arg strategy={strategy} is not allowed, please select "
+                f"some another, if required: {', '.join(ProxyStrategy.values())}."
+            )
+
+        self.strategy: ProxyStrategy = ProxyStrategy(str(strategy))
+        self.cooldown = cooldown
+        self.max_failures = max(1, max_failures)
+        self.proxies: ty.List[Proxy] = [
+            Proxy(
+                url=url,
+                session=get_session(proxy_url=url, **session_kwargs),
+                rate_limiter=(
+                    RateLimiter(rate=rate, burst=max(1, int(rate))) if rate else None
+                ),
+            )
+            for url in dict.fromkeys(proxy_urls)
+        ]
+
+        self._counter: ty.Iterator[int] = itertools.count()
+        self._lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.proxies)
+
+    def __repr__(self) -> str:
+        """String representation of class"""
+
+        return (
+            f"<{self.__class__.__name__} "
+            f"proxies={len(self)}, strategy={self.strategy}>"
+        )
+
+    def acquire(self) -> Proxy:
+        """Pick proxy and take its slot, blocking while every proxy cools down"""
+
+        while True:
+            with self._lock:
+                now: float = time.monotonic()
+                proxy: ty.Optional[Proxy] = self._choose(now=now)
+                if proxy is not None:
+                    proxy.in_flight += 1
+                    break
+
+                delay: float = min(x.cooldown_until for x in self.proxies) - now
+
+            time.sleep(max(0.0, delay))
+
+        if proxy.rate_limiter is not None:
+            try:
+                proxy.rate_limiter.acquire()
+            except BaseException:
+                self.cancel(proxy=proxy)
+                raise
+
+        return proxy
+
+    def cancel(self, proxy: Proxy) -> None:
+        """Free slot of request that was not sent, nothing is accounted"""
+
+        with self._lock:
+            proxy.in_flight -= 1
+
+    def release(
+        self,
+        proxy: Proxy,
+        latency: float,
+        status_code: ty.Optional[int] = None,
+        retry_after: ty.Optional[str] = None,
+    ) -> None:
+        """Free slot and account result, `status_code=None` is connection error"""
+
+        with self._lock:
+            proxy.in_flight -= 1
+            proxy.requests += 1
+            proxy.latency_sum += latency
+
+            now: float = time.monotonic()
+            if status_code == 429:
+                proxy.throttled += 1
+                proxy.cooldown_until = now + (
+                    get_retry_after(value=retry_after) or self.cooldown
+                )
+            elif status_code is None or status_code >= 500:
+                proxy.errors += 1
+                proxy.failures += 1
+                if proxy.failures >= self.max_failures:
+                    proxy.failures = 0
+                    proxy.cooldown_until = now + (
+                        get_retry_after(value=retry_after) or self.cooldown
+                    )
+            else:
+                proxy.failures = 0
+
+    def stats(self) -> ty.Dict[str, ProxyStats]:
+        """Report by proxy name"""
+
+        now: float = time.monotonic()
+        with self._lock:
+            return {proxy.name: proxy.get_stats(now=now) for proxy in self.proxies}
+
+    def close(self) -> None:
+        """Release pooled connections of every proxy"""
+
+        for proxy in self.proxies:
+            proxy.session.close()
+
+    def _choose(self, now: float) -> ty.Optional[Proxy]:
+        """Proxy by strategy among available ones, called under lock"""
+
+        available: ty.List[Proxy] = [x for x in self.proxies if x.cooldown_until <= now]
+        if not available:
+            return None
+
+        if self.strategy == ProxyStrategy.LEAST_LOADED:
+            least: int = min(x.in_flight for x in available)
+            available = [x for x in available if x.in_flight == least]
+
+        return available[next(self._counter) % len(available)]
+
+
+def get_proxy_name(url: str) -> str:
+    """Proxy URL w/o credentials"""
+
+    parsed = urlparse(url)
+    if parsed.username is None and parsed.password is None:
+        return url
+
+    host: str = parsed.netloc.rsplit("@", 1)[-1]
+    return parsed._replace(netloc=host).geturl()
@@ -1,5 +1,8 @@
+import codecs
 import json
 import logging
+import threading
+import time
 import typing as ty
 from urllib.parse import urljoin
 
@@ -7,23 +10,43 @@ from lxml import html
 from lxml.etree import ParserError
 from requests import Response, Session
 from requests.adapters import HTTPAdapter
-from requests.exceptions import ConnectionError, HTTPError
+from requests.exceptions import ConnectionError, HTTPError, RequestException
 from urllib3 import Retry
 from user_agent import generate_user_agent  # type: ignore[import-untyped]
 
 from finavis.exceptions import (
     RequestDocumentIsEmptyException,
     RequestMaxRetryException,
+    RequestNotRecordedException,
     RequestUnhandledException,
     TickerNotFoundException,
 )
 
+from .flights import SingleFlight
+from .limits import (
+    DEFAULT_CONCURRENCY_LIMIT,
+    DEFAULT_MAX_CONCURRENCY_LIMIT,
+    ConcurrencyController,
+    RateLimiter,
+    get_controller,
+    get_rate_limiter,
+)
+from .metrics import MetricsRegistry, get_kind, get_metrics
+from .proxies import Proxy, ProxyPool
+from .storages import PageCache, PageEntry
+from .transports import Transport
+
 logger = logging.getLogger(__name__)
 
+DEFAULT_BASE_URL: str = "https://finviz.com/"
 DEFAULT_RETRY_TOTAL: int = 0
 DEFAULT_RETRY_BACKOFF_FACTOR: int = 1800
 DEFAULT_RETRY_ALLOWED_METHODS: ty.Sequence[str] = ("POST", "GET")
 DEFAULT_REQUEST_TIMEOUT: int = 2
+DEFAULT_CLIENT_TIMEOUT: float = 3
+DEFAULT_POOL_CONNECTIONS: int = 10
+DEFAULT_POOL_MAXSIZE: int = 10
+DEFAULT_CHUNK_SIZE: int = 16 * 1024
 
 
 def get_session(
@@ -32,6 +55,8 @@ def get_session(
     retry_allowed_methods: ty.Sequence[str] = DEFAULT_RETRY_ALLOWED_METHODS,
     headers: ty.Optional[ty.Mapping] = None,
     proxy_url: ty.Optional[str] = None,
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
 ) -> Session:
     """Custom session object w/ some settings"""
 
@@ -45,55 +70,413 @@ def get_session(
     if proxy_url is not None:
         session.proxies = {"https": proxy_url, "http": proxy_url}
 
+    retries: ty.Optional[Retry] = None
     if retry_total is not None:
-        retries: Retry = Retry(
+        retries = Retry(
             total=retry_total,
             backoff_factor=retry_backoff_factor / 1000,
             allowed_methods=list(retry_allowed_methods),
         )
-        session.mount("https://", HTTPAdapter(max_retries=retries))
+
+    adapter: HTTPAdapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retries if retries is not None else 0,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
 
     return session
 
 
-def make_request(
-    path: str,
-    query_params: ty.Optional[ty.Dict[str, str]] = None,
-) -> html.HtmlElement:
-    """Make request to some URL"""
+class Client:
+    """Reusable client w/ keep-alive connection pool"""
 
-    params: ty.Dict[str, ty.Any] = dict(
-        method="GET",
-        url=urljoin("https://finviz.com/", path),
-        params=query_params or {},
-        allow_redirects=False,
-        timeout=3,
-    )
+    def __init__(
+        self,
+        retry_total: int = DEFAULT_RETRY_TOTAL,
+        retry_backoff_factor: int = DEFAULT_RETRY_BACKOFF_FACTOR,
+        retry_allowed_methods: ty.Sequence[str] = DEFAULT_RETRY_ALLOWED_METHODS,
+        headers: ty.Optional[ty.Mapping] = None,
+        proxy_url: ty.Optional[str] = None,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        timeout: ty.Optional[float] = DEFAULT_CLIENT_TIMEOUT,
+        base_url: str = DEFAULT_BASE_URL,
+        rate_limiter: ty.Optional[RateLimiter] = None,
+        controller: ty.Optional[ConcurrencyController] = None,
+        page_cache: ty.Optional[PageCache] = None,
+        transport: ty.Optional[Transport] = None,
+        metrics: ty.Optional[MetricsRegistry] = None,
+        proxy_pool: ty.Optional[ProxyPool] = None,
+        coalesce: bool = True,
+    ) -> None:
+        """
+        Initialization, session is built once and shared by all requests.
 
-    logger.debug(
-        f"make_request = {params['method']} {params['url']} "
-        f"query_params={json.dumps(params['params'])}"
-    )
+        If `proxy_pool` is set, requests are spread over its proxies, each w/
+        own session, and `proxy_url` is ignored. Client w/ own `rate_limiter`
+        or `proxy_pool` gets own controller (sized by number of proxies)
+        unless `controller` is set, throttled proxy cools down on its own
+        and does not cut limits of controller. If `coalesce`, concurrent
+        requests of the same page share one request and its document.
 
-    session: Session = get_session()
+        If `transport` is set, it is put in front of session connection pool
+        to record responses or to replay them w/o network. Request, parse
+        and page cache metrics are recorded by `metrics` (shared by default).
+        """
 
-    try:
-        response: Response = session.request(**params)
-        response.raise_for_status()
-    except (HTTPError, ConnectionError) as e:
-        if isinstance(e, ConnectionError) and "Max retries exceeded" in str(e):
-            raise RequestMaxRetryException(e)
-        elif isinstance(e, HTTPError) and "404" in str(e) and "/quote.ashx" in str(e):
-            raise TickerNotFoundException(e)
-        else:
+        self.timeout = timeout
+        self.base_url = base_url
+        self.page_cache = page_cache
+        self.transport = transport
+        self.proxy_pool = proxy_pool
+        self.coalesce = coalesce
+        self.flights: SingleFlight = SingleFlight()
+        self.rate_limiter: RateLimiter = rate_limiter or get_rate_limiter()
+        if controller is None and (rate_limiter is not None or proxy_pool is not None):
+            # own limiter and proxies are not throttled w/ process-wide controller
+            size: int = len(proxy_pool) if proxy_pool is not None else 1
+            controller = ConcurrencyController(
+                limiter=self.rate_limiter,
+                limit=DEFAULT_CONCURRENCY_LIMIT * size,
+                max_limit=DEFAULT_MAX_CONCURRENCY_LIMIT * size,
+            )
+        self.controller: ConcurrencyController = controller or get_controller()
+        self.metrics: MetricsRegistry = metrics or get_metrics()
+        self.session: Session = get_session(
+            retry_total=retry_total,
+            retry_backoff_factor=retry_backoff_factor,
+            retry_allowed_methods=retry_allowed_methods,
+            headers=headers,
+            proxy_url=proxy_url,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+        )
+
+        if self.transport is not None:
+            self.transport.mount(session=self.session)
+            for proxy in self.proxy_pool.proxies if self.proxy_pool else ():
+                self.transport.mount(session=proxy.session)
+
+    def __repr__(self) -> str:
+        """String representation of class"""
+
+        return (
+            f"<{self.__class__.__name__} "
+            f"base_url={self.base_url}, timeout={self.timeout}>"
+        )
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *args: ty.Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release pooled connections"""
+
+        self.session.close()
+        if self.proxy_pool is not None:
+            self.proxy_pool.close()
+
+    def request(
+        self,
+        path: str,
+        query_params: ty.Optional[ty.Dict[str, ty.Any]] = None,
+    ) -> html.HtmlElement:
+        """Make request to some URL, identical concurrent requests are coalesced"""
+
+        if not self.coalesce:
+            return self._request(path=path, query_params=query_params)
+
+        document, is_shared = self.flights.do(
+            key=PageCache.get_key(path=path, query_params=query_params),
+            func=lambda: self._request(path=path, query_params=query_params),
+        )
+        if is_shared and self.metrics.enabled:
+            self.metrics.coalesced.inc(kind=get_kind(path=path))
+
+        return document
+
+    def _request(
+        self,
+        path: str,
+        query_params: ty.Optional[ty.Dict[str, ty.Any]] = None,
+    ) -> html.HtmlElement:
+        """Fetch and parse page"""
+
+        text: str = self.fetch(path=path, query_params=query_params)
+        if not self.metrics.enabled:
+            return parse_document(text=text)
+
+        started_at: float = time.perf_counter()
+        document: html.HtmlElement = parse_document(text=text)
+        self.metrics.parse.observe(
+            time.perf_counter() - started_at, kind=get_kind(path=path)
+        )
+        return document
+
+    def fetch(
+        self,
+        path: str,
+        query_params: ty.Optional[ty.Dict[str, ty.Any]] = None,
+    ) -> str:
+        """Make request to some URL and return body, w/ page cache if any"""
+
+        if self.page_cache is None:
+            return self._send(path=path, query_params=query_params).text
+
+        entry: ty.Optional[PageEntry] = self.page_cache.get(
+            path=path, query_params=query_params
+        )
+        if entry is not None and entry.is_fresh(ttl=self.page_cache.ttl):
+            logger.debug(f"make_request = FRESH {path} query_params={query_params}")
+            self._observe_page_cache(path=path, result="fresh")
+            return entry.body
+
+        response: Response = self._send(
+            path=path,
+            query_params=query_params,
+            headers=entry.get_conditional_headers() if entry is not None else None,
+        )
+
+        if entry is not None and response.status_code == 304:
+            self.page_cache.touch(path=path, query_params=query_params)
+            self._observe_page_cache(path=path, result="revalidated")
+            return entry.body
+
+        self._observe_page_cache(path=path, result="miss")
+
+        if response.status_code == 200:
+            self.page_cache.set(
+                path=path,
+                query_params=query_params,
+                body=response.text,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+
+        return response.text
+
+    def stream(
+        self,
+        path: str,
+        query_params: ty.Optional[ty.Dict[str, ty.Any]] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> ty.Iterator[str]:
+        """Make request to some URL and yield decoded body chunks as they arrive"""
+
+        if self.page_cache is not None:
+            yield self.fetch(path=path, query_params=query_params)
+            return None
+
+        response: Response = self._send(
+            path=path, query_params=query_params, stream=True
+        )
+        decoder: codecs.IncrementalDecoder = codecs.getincrementaldecoder(
+            response.encoding or "utf-8"
+        )(errors="replace")
+
+        size: int = 0
+        try:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                size += len(chunk)
+                text: str = decoder.decode(chunk)
+                if text:
+                    yield text
+            tail: str = decoder.decode(b"", final=True)
+            if tail:
+                yield tail
+        except RequestException as e:
             raise RequestUnhandledException(e)
-    else:
-        logger.debug(f"make_request = DONE status_code={response.status_code}")
+        finally:
+            response.close()
+            if self.metrics.enabled:
+                kind: str = get_kind(path=path)
+                self.metrics.size.observe(size, kind=kind)
+                self.metrics.response_bytes.inc(size, kind=kind)
+
+    def _send(
+        self,
+        path: str,
+        query_params: ty.Optional[ty.Dict[str, ty.Any]] = None,
+        headers: ty.Optional[ty.Dict[str, str]] = None,
+        stream: bool = False,
+    ) -> Response:
+        """Send request through shared limiter and controller, body is not read if `stream`"""
+
+        params: ty.Dict[str, ty.Any] = dict(
+            method="GET",
+            url=urljoin(self.base_url, path),
+            params=query_params or {},
+            headers=headers,
+            allow_redirects=False,
+            timeout=self.timeout,
+            stream=stream,
+        )
+
+        logger.debug(
+            f"make_request = {params['method']} {params['url']} "
+            f"query_params={json.dumps(params['params'])}"
+        )
+
+        proxy: ty.Optional[Proxy] = None
+        session: Session = self.session
+        if self.proxy_pool is not None:
+            # proxy cooldown is waited out before a slot of controller is taken
+            proxy = self.proxy_pool.acquire()
+            session = proxy.session
+
+        is_acquired: bool = False
+        try:
+            self.controller.acquire()
+            is_acquired = True
+            self.rate_limiter.acquire()
+        except BaseException:
+            if is_acquired:
+                self.controller.cancel()
+            if proxy is not None:
+                ty.cast(ProxyPool, self.proxy_pool).cancel(proxy=proxy)
+            raise
+
+        started_at: float = time.monotonic()
+        status_code: ty.Optional[int] = None
+        retry_after: ty.Optional[str] = None
+        response: ty.Optional[Response] = None
+        is_sent: bool = True
+        try:
+            response = session.request(**params)
+            status_code = response.status_code
+            retry_after = response.headers.get("Retry-After")
+            response.raise_for_status()
+        except RequestNotRecordedException:
+            is_sent = False
+            raise
+        except (HTTPError, ConnectionError) as e:
+            if isinstance(e, ConnectionError) and "Max retries exceeded" in str(e):
+                raise RequestMaxRetryException(e)
+            elif (
+                isinstance(e, HTTPError) and "404" in str(e) and "/quote.ashx" in str(e)
+            ):
+                raise TickerNotFoundException(e)
+            else:
+                raise RequestUnhandledException(e)
+        else:
+            logger.debug(f"make_request = DONE status_code={response.status_code}")
+        finally:
+            latency: float = time.monotonic() - started_at
+            if not is_sent:
+                self.controller.cancel()
+                if proxy is not None:
+                    ty.cast(ProxyPool, self.proxy_pool).cancel(proxy=proxy)
+            else:
+                self.controller.release(
+                    latency=latency,
+                    status_code=status_code,
+                    retry_after=retry_after,
+                    throttle=proxy is None,
+                )
+                if proxy is not None:
+                    ty.cast(ProxyPool, self.proxy_pool).release(
+                        proxy=proxy,
+                        latency=latency,
+                        status_code=status_code,
+                        retry_after=retry_after,
+                    )
+            if self.metrics.enabled:
+                self._observe(
+                    path=path, latency=latency, response=response, stream=stream
+                )
+
+        return ty.cast(Response, response)
+
+    def _observe(
+        self,
+        path: str,
+        latency: float,
+        response: ty.Optional[Response] = None,
+        stream: bool = False,
+    ) -> None:
+        """Record request metrics, DNS and connect time are not exposed by requests"""
+
+        kind: str = get_kind(path=path)
+        self.metrics.latency.observe(latency, kind=kind)
+
+        if response is None:
+            self.metrics.requests.inc(kind=kind, status="error")
+            return None
+
+        self.metrics.requests.inc(kind=kind, status=str(response.status_code))
+        self.metrics.ttfb.observe(response.elapsed.total_seconds(), kind=kind)
+
+        if not stream:
+            size: int = len(response.content)
+            self.metrics.size.observe(size, kind=kind)
+            self.metrics.response_bytes.inc(size, kind=kind)
+
+        retries: ty.Any = getattr(response.raw, "retries", None)
+        if retries is not None and retries.history:
+            self.metrics.retries.inc(len(retries.history), kind=kind)
+
+    def _observe_page_cache(self, path: str, result: str) -> None:
+        if self.metrics.enabled:
+            self.metrics.page_cache.inc(kind=get_kind(path=path), result=result)
+
+
+def parse_document(text: str) -> html.HtmlElement:
+    """Build DOM from response body"""
 
     try:
-        return html.fromstring(html=response.text)
+        return html.fromstring(html=text)
     except ParserError as e:
         if "document is empty" in str(e).lower():
             raise RequestDocumentIsEmptyException(e)
         else:
             raise RequestUnhandledException(e)
+
+
+_client: ty.Optional[Client] = None
+_client_lock: threading.Lock = threading.Lock()
+
+
+def get_client() -> Client:
+    """Default client shared by module-level functions"""
+
+    global _client
+
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = Client()
+
+    return _client
+
+
+def set_client(client: ty.Optional[Client]) -> None:
+    """Replace default shared client (`None` to reset it)"""
+
+    global _client
+
+    with _client_lock:
+        _client = client
+
+
+def stream_request(
+    path: str,
+    query_params: ty.Optional[ty.Dict[str, ty.Any]] = None,
+    client: ty.Optional[Client] = None,
+) -> ty.Iterator[str]:
+    """Make request to some URL, body is yielded by chunks"""
+
+    return (client or get_client()).stream(path=path, query_params=query_params)
+
+
+def make_request(
+    path: str,
+    query_params: ty.Optional[ty.Dict[str, ty.Any]] = None,
+    client: ty.Optional[Client] = None,
+) -> html.HtmlElement:
+    """Make request to some URL"""
+
+    return (client or get_client()).request(path=path, query_params=query_params)
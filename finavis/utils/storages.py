@@ -0,0 +1,205 @@
+import os
+import sqlite3
+import threading
+import time
+import typing as ty
+import zlib
+from urllib.parse import urlencode
+
+import attr
+
+from .caches import DEFAULT_CACHE_TTL
+
+DEFAULT_PAGE_CACHE_PATH: str = os.path.join(
+    os.path.expanduser("~"), ".cache", "finavis", "pages.sqlite3"
+)
+DEFAULT_PAGE_CACHE_TIMEOUT: float = 30
+
+
+@attr.s(auto_attribs=True, slots=True, frozen=True)
+class PageEntry:
+    """
+    Stored response body.
+
+    :param str body: Response body
+    :param float fetched_at: Unix time of last fetch or revalidation
+    :param str etag: `ETag` header
+    :param str last_modified: `Last-Modified` header
+    """
+
+    body: str
+    fetched_at: float
+    etag: ty.Optional[str] = None
+    last_modified: ty.Optional[str] = None
+
+    def is_fresh(self, ttl: float) -> bool:
+        return time.time() - self.fetched_at < ttl
+
+    def get_conditional_headers(self) -> ty.Dict[str, str]:
+        """Headers of conditional GET"""
+
+        headers: ty.Dict[str, str] = dict()
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class PageCache:
+    """SQLite page cache, safe to share between threads and processes"""
+
+    _schema: str = (
+        "CREATE TABLE IF NOT EXISTS pages ("
+        "key TEXT PRIMARY KEY, body BLOB NOT NULL, fetched_at REAL NOT NULL, "
+        "etag TEXT, last_modified TEXT)"
+    )
+
+    def __init__(
+        self,
+        path: str = DEFAULT_PAGE_CACHE_PATH,
+        ttl: float = DEFAULT_CACHE_TTL,
+        timeout: float = DEFAULT_PAGE_CACHE_TIMEOUT,
+    ) -> None:
+        """Initialization, database is created if not exists"""
+
+        self.path = path
+        self.ttl = ttl
+        self.timeout = timeout
+        self._local: threading.local = threading.local()
+        self._connections: ty.List[sqlite3.Connection] = list()
+        self._generation: int = 0
+        self._lock: threading.Lock = threading.Lock()
+
+        directory: str = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        with self._get_connection() as connection:
+            connection.execute(self._schema)
+
+    def __repr__(self) -> str:
+        """String representation of class"""
+
+        return f"<{self.__class__.__name__} path={self.path}, ttl={self.ttl}>"
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Connection per thread, ones closed by `close` are reopened"""
+
+        connection: ty.Optional[sqlite3.Connection] = getattr(
+            self._local, "connection", None
+        )
+        if connection is None or self._local.generation != self._generation:
+            connection = sqlite3.connect(
+                self.path, timeout=self.timeout, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            with self._lock:
+                self._connections.append(connection)
+                self._local.connection = connection
+                self._local.generation = self._generation
+
+        return connection
+
+    @staticmethod
+    def get_key(path: str, query_params: ty.Optional[ty.Dict[str, ty.Any]]) -> str:
+        """Key of page by path and query params"""
+
+        return f"{path}?{urlencode(sorted((query_params or {}).items()))}"
+
+    def get(
+        self,
+        path: str,
+        query_params: ty.Optional[ty.Dict[str, ty.Any]] = None,
+    ) -> ty.Optional[PageEntry]:
+        """Stored page, fresh or not"""
+
+        row: ty.Optional[ty.Tuple[bytes, float, str, str]] = (
+            self._get_connection()
+            .execute(
+                "SELECT body, fetched_at, etag, last_modified FROM pages WHERE key = ?",
+                (self.get_key(path=path, query_params=query_params),),
+            )
+            .fetchone()
+        )
+        if row is None:
+            return None
+
+        body, fetched_at, etag, last_modified = row
+        return PageEntry(
+            body=zlib.decompress(body).decode("utf-8"),
+            fetched_at=fetched_at,
+            etag=etag,
+            last_modified=last_modified,
+        )
+
+    def set(
+        self,
+        path: str,
+        query_params: ty.Optional[ty.Dict[str, ty.Any]],
+        body: str,
+        etag: ty.Optional[str] = None,
+        last_modified: ty.Optional[str] = None,
+    ) -> None:
+        """Store page compressed"""
+
+        with self._get_connection() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO pages "
+                "(key, body, fetched_at, etag, last_modified) VALUES (?, ?, ?, ?, ?)",
+                (
+                    self.get_key(path=path, query_params=query_params),
+                    zlib.compress(body.encode("utf-8")),
+                    time.time(),
+                    etag,
+                    last_modified,
+                ),
+            )
+
+    def touch(
+        self,
+        path: str,
+        query_params: ty.Optional[ty.Dict[str, ty.Any]] = None,
+    ) -> None:
+        """Mark page as revalidated"""
+
+        with self._get_connection() as connection:
+            connection.execute(
+                "UPDATE pages SET fetched_at = ? WHERE key = ?",
+                (time.time(), self.get_key(path=path, query_params=query_params)),
+            )
+
+    def invalidate(
+        self,
+        path: str,
+        query_params: ty.Optional[ty.Dict[str, ty.Any]] = None,
+    ) -> bool:
+        """Drop page"""
+
+        with self._get_connection() as connection:
+            cursor: sqlite3.Cursor = connection.execute(
+                "DELETE FROM pages WHERE key = ?",
+                (self.get_key(path=path, query_params=query_params),),
+            )
+            return cursor.rowcount > 0
+
+    def prune(self, older_than: float) -> int:
+        """Drop pages not fetched for `older_than` seconds"""
+
+        with self._get_connection() as connection:
+            cursor: sqlite3.Cursor = connection.execute(
+                "DELETE FROM pages WHERE fetched_at < ?",
+                (time.time() - older_than,),
+            )
+            return cursor.rowcount
+
+    def close(self) -> None:
+        """Close connections of every thread, incl. finished pool threads"""
+
+        with self._lock:
+            connections: ty.List[sqlite3.Connection] = self._connections
+            self._connections = list()
+            self._generation += 1
+
+        for connection in connections:
+            connection.close()
@@ -0,0 +1,259 @@
+import datetime as dt
+import gzip
+import http
+import json
+import os
+import threading
+import time
+import typing as ty
+from urllib.parse import parse_qsl, urlparse
+
+import attr
+from requests import PreparedRequest, Response, Session
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from finavis.exceptions import RequestNotRecordedException
+from finavis.library.enums import TransportMode
+
+from .storages import PageCache
+
+RECORDED_HEADERS: ty.Tuple[str, ...] = (
+    "Content-Type",
+    "ETag",
+    "Last-Modified",
+    "Retry-After",
+)
+
+
+@attr.s(auto_attribs=True, slots=True, frozen=True)
+class Recording:
+    """
+    Recorded response.
+
+    :param str path: Request path
+    :param ty.Dict[str, str] query_params: Request query params
+    :param int status_code: Response status code
+    :param str body: Response body
+    :param ty.Dict[str, str] headers: Response headers kept for replay
+    :param float elapsed: Seconds till response headers were received
+    """
+
+    path: str
+    query_params: ty.Dict[str, str]
+    status_code: int
+    body: str
+    headers: ty.Dict[str, str] = attr.Factory(dict)
+    elapsed: float = 0.0
+
+    @property
+    def key(self) -> str:
+        return PageCache.get_key(path=self.path, query_params=self.query_params)
+
+
+class Transport(BaseAdapter):
+    """
+    HTTP layer of client.
+
+    In `passthrough` mode requests go to network as usual, `record` mode also
+    appends every response to gzipped JSON lines archive at `path`, `replay`
+    mode serves responses from archive w/o sockets, optionally after fixed
+    `latency` seconds or after recorded time if `recorded_latency`.
+
+    Every recorded response is a complete gzip member flushed at once, so
+    archive is readable even if transport is never closed. Transport may be
+    mounted on several sessions (e.g. of proxies), each keeps its adapter.
+    """
+
+    def __init__(
+        self,
+        mode: ty.Union[TransportMode, str] = TransportMode.PASSTHROUGH,
+        path: ty.Optional[str] = None,
+        latency: ty.Optional[float] = None,
+        recorded_latency: bool = False,
+    ) -> None:
+        super().__init__()
+
+        if str(mode) not in TransportMode:
+            raise TypeError(
+                f"arg mode={mode} is not allowed, please select "
+                f"some another, if required: {', '.join(TransportMode.values())}."
+            )
+
+        self.mode: TransportMode = TransportMode(str(mode))
+        if self.mode != TransportMode.PASSTHROUGH and path is None:
+            raise TypeError(f"arg path is required in {self.mode} mode.")
+
+        self.path = path
+        self.latency = latency
+        self.recorded_latency = recorded_latency
+        self.adapter: ty.Optional[BaseAdapter] = None
+        self.adapters: ty.Dict[int, BaseAdapter] = dict()
+
+        self._recordings: ty.Optional[ty.Dict[str, Recording]] = None
+        self._file: ty.Optional[ty.BinaryIO] = None
+        self._lock: threading.Lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """String representation of class"""
+
+        return f"<{self.__class__.__name__} mode={self.mode}, path={self.path}>"
+
+    def mount(self, session: Session) -> None:
+        """Put transport in front of session adapter, adapter is kept by session"""
+
+        adapter: BaseAdapter = session.get_adapter("https://")
+        if isinstance(adapter, MountedTransport) and adapter.transport is self:
+            return None
+
+        self.adapters[id(session)] = adapter
+        mounted: MountedTransport = MountedTransport(transport=self, adapter=adapter)
+        session.mount("https://", mounted)
+        session.mount("http://", mounted)
+
+    def send(  # type: ignore[override]
+        self,
+        request: PreparedRequest,
+        adapter: ty.Optional[BaseAdapter] = None,
+        **kwargs: ty.Any,
+    ) -> Response:
+        """Send by `adapter` of session, own one is used if transport is not mounted"""
+
+        if self.mode == TransportMode.REPLAY:
+            return self._replay(request=request)
+
+        if adapter is None:
+            if self.adapter is None:
+                self.adapter = HTTPAdapter()
+            adapter = self.adapter
+
+        response: Response = adapter.send(request, **kwargs)
+        if self.mode == TransportMode.RECORD:
+            self._record(request=request, response=response)
+
+        return response
+
+    def close(self) -> None:
+        """Close archive and release upstream adapters of every session"""
+
+        self._close_file()
+
+        for adapter in self.adapters.values():
+            adapter.close()
+        if self.adapter is not None:
+            self.adapter.close()
+
+    def _close_file(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    @property
+    def recordings(self) -> ty.Dict[str, Recording]:
+        """Recordings of archive by key, the last one wins"""
+
+        if self._recordings is None:
+            with self._lock:
+                if self._recordings is None:
+                    self._recordings = {
+                        recording.key: recording
+                        for recording in load_recordings(path=ty.cast(str, self.path))
+                    }
+
+        return self._recordings
+
+    def _record(self, request: PreparedRequest, response: Response) -> None:
+        """Append response to archive"""
+
+        path, query_params = get_path_and_query_params(url=str(request.url))
+        recording: Recording = Recording(
+            path=path,
+            query_params=query_params,
+            status_code=response.status_code,
+            body=response.text,
+            headers={
+                name: response.headers[name]
+                for name in RECORDED_HEADERS
+                if name in response.headers
+            },
+            elapsed=response.elapsed.total_seconds(),
+        )
+
+        line: str = json.dumps(attr.asdict(recording), separators=(",", ":"))
+        member: bytes = gzip.compress((line + "\n").encode("utf-8"))
+        with self._lock:
+            if self._file is None:
+                directory: str = os.path.dirname(ty.cast(str, self.path))
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                self._file = open(ty.cast(str, self.path), "ab")
+            self._file.write(member)
+            self._file.flush()
+
+    def _replay(self, request: PreparedRequest) -> Response:
+        """Response from archive"""
+
+        path, query_params = get_path_and_query_params(url=str(request.url))
+        key: str = PageCache.get_key(path=path, query_params=query_params)
+
+        recording: ty.Optional[Recording] = self.recordings.get(key)
+        if recording is None:
+            raise RequestNotRecordedException(f"{key} is not found in {self.path}")
+
+        delay: ty.Optional[float] = (
+            recording.elapsed if self.recorded_latency else self.latency
+        )
+        if delay:
+            time.sleep(delay)
+
+        response: Response = Response()
+        response.status_code = recording.status_code
+        response.reason = http.HTTPStatus(recording.status_code).phrase
+        response.headers = CaseInsensitiveDict(recording.headers)
+        response._content = recording.body.encode("utf-8")
+        response._content_consumed = True  # type: ignore[attr-defined]
+        response.encoding = "utf-8"
+        response.url = str(request.url)
+        response.request = request
+        response.elapsed = dt.timedelta(seconds=recording.elapsed)
+        return response
+
+
+class MountedTransport(BaseAdapter):
+    """Transport mounted on one session, w/ upstream adapter of that session"""
+
+    def __init__(self, transport: Transport, adapter: BaseAdapter) -> None:
+        super().__init__()
+        self.transport = transport
+        self.adapter = adapter
+
+    def __repr__(self) -> str:
+        """String representation of class"""
+
+        return f"<{self.__class__.__name__} transport={self.transport}>"
+
+    def send(self, request: PreparedRequest, **kwargs: ty.Any) -> Response:  # type: ignore[override]
+        return self.transport.send(request, adapter=self.adapter, **kwargs)
+
+    def close(self) -> None:
+        """Close archive and release upstream adapter of session"""
+
+        self.transport._close_file()
+        self.adapter.close()
+
+
+def get_path_and_query_params(url: str) -> ty.Tuple[str, ty.Dict[str, str]]:
+    """Path and query params of URL"""
+
+    parsed = urlparse(url)
+    return parsed.path, dict(parse_qsl(parsed.query, keep_blank_values=True))
+
+
+def load_recordings(path: str) -> ty.Iterator[Recording]:
+    """Recordings of archive in order"""
+
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        for line in file:
+            if line.strip():
+                yield Recording(**json.loads(line))
@@ -0,0 +1,20 @@
+import pathlib
+import typing as ty
+
+from benchmarks.fakes import FakeAdapter, Handler, make_client
+
+FIXTURES: pathlib.Path = pathlib.Path(__file__).parent / "fixtures"
+QUOTE_PAGE: str = (FIXTURES / "quote.html").read_text()
+
+__all__ = ("FIXTURES", "QUOTE_PAGE", "FakeAdapter", "Handler", "make_client")
+
+
+def quote_handler(
+    path: str, query_params: ty.Dict[str, str], **kwargs: ty.Any
+) -> ty.Tuple[int, str]:
+    """Quote page for every ticker except `NOPE`"""
+
+    if query_params.get("t") == "NOPE":
+        return 404, ""
+
+    return 200, QUOTE_PAGE
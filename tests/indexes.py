@@ -79,3 +79,69 @@ EXAMPLE_QUOTE_RAW = {
     "volume": "27,070,101",
     "change": "-0.20%",
 }
+
+EXAMPLE_OVERVIEW_ROW = (
+    "AAPL",
+    "Apple Inc",
+    "Technology",
+    "Consumer Electronics",
+    "USA",
+    "2823.46B",
+    "29.62",
+    "181.54",
+    "-0.20%",
+    "27,070,101",
+)
+
+
+def render_screener_page(
+    rows: "list[tuple[str, ...]]",
+    total: int,
+    start: int = 1,
+    total_after_table: bool = False,
+) -> str:
+    """Fake screener page w/ overview table, total line is before it by default"""
+
+    lines = list()
+    for number, row in enumerate(rows, start=start):
+        cells = [f'<td align="right"><a class="tab-link">{number}</a></td>']
+        cells.extend(f'<td><a class="screener-link">{value}</a></td>' for value in row)
+        lines.append(f'<tr class="styled-row is-bordered">{"".join(cells)}</tr>')
+
+    total_line = f'<div id="screener-total">#{start} / {total} Total</div>'
+    return (
+        "<html><body>"
+        f"{total_line if not total_after_table else ''}"
+        '<table id="screener-table">'
+        "<tr><td>filters</td></tr>"
+        "<tr><td><table>"
+        "<tr><th>No.</th><th>Ticker</th><th>Company</th></tr>"
+        f"{''.join(lines)}"
+        "</table></td></tr>"
+        "</table>"
+        f"{total_line if total_after_table else ''}"
+        "</body></html>"
+    )
+
+
+def make_overview_rows(total: int) -> "list[tuple[str, ...]]":
+    """Fake overview rows w/ unique tickers"""
+
+    return [(f"T{index:04d}",) + EXAMPLE_OVERVIEW_ROW[1:] for index in range(total)]
+
+
+def make_screener_quote_row(ticker: str) -> "tuple[str, ...]":
+    """Fake row of custom screener view w/ quote columns"""
+
+    from finavis.core.parsers import SCREENER_QUOTE_COLUMNS
+
+    values = dict(
+        EXAMPLE_QUOTE_RAW,
+        ticker=ticker,
+        float_short="0.77%",
+        short_ratio="2.23",
+        volatility_w="1.44%",
+        volatility_m="1.31%",
+        earnings="Nov 02/a",
+    )
+    return tuple(values[name] for _, name in SCREENER_QUOTE_COLUMNS)
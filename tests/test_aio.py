@@ -0,0 +1,171 @@
+import asyncio
+import typing as ty
+
+from finavis.aio import (
+    AsyncClient,
+    AsyncScreener,
+    get_async_client,
+    get_quote,
+    get_quotes,
+    set_async_client,
+)
+from finavis.library import Overview, Quote
+from finavis.utils import ConcurrencyController, RateLimiter, TTLCache
+
+from .fakes import QUOTE_PAGE
+from .indexes import make_overview_rows, render_screener_page
+
+
+class FakeAsyncClient(AsyncClient):
+    def __init__(self, pages: ty.Dict[int, str]) -> None:
+        super().__init__(concurrency=4)
+        self.pages = pages
+        self.calls: ty.List[ty.Dict[str, ty.Any]] = list()
+
+    async def fetch(
+        self,
+        path: str,
+        query_params: ty.Optional[ty.Dict[str, ty.Any]] = None,
+    ) -> str:
+        self.calls.append(dict(query_params or {}))
+        await asyncio.sleep(0)
+
+        if path == "/quote.ashx":
+            return QUOTE_PAGE
+
+        return self.pages[int((query_params or {})["r"])]
+
+
+def test_aio_get_quotes() -> None:
+    client = FakeAsyncClient(pages={})
+    cache = TTLCache()
+
+    quote = asyncio.run(get_quote(ticker="AAPL", client=client, cache=cache))
+    assert isinstance(quote, Quote)
+    assert quote.ticker == "AAPL"
+
+    quotes = asyncio.run(
+        get_quotes(tickers=("AAPL", "INTC", "QCOM", "TSLA"), client=client, cache=cache)
+    )
+    assert len(quotes) == 4
+    assert all(isinstance(x, Quote) for x in quotes)
+    assert len(client.calls) == 4
+
+
+def test_aio_screener_keeps_page_order() -> None:
+    rows = make_overview_rows(total=45)
+    pages = {
+        start: render_screener_page(rows[start - 1 : start + 19], total=45, start=start)
+        for start in (1, 21, 41)
+    }
+    client = FakeAsyncClient(pages=pages)
+
+    async def collect() -> ty.List[Overview]:
+        return [item async for item in AsyncScreener(client=client)]
+
+    items = asyncio.run(collect())
+
+    assert len(items) == 45
+    assert [x.ticker for x in items] == [x[0] for x in rows]
+    assert len(client.calls) == 3
+
+
+def test_aio_screener_bounds_read_ahead() -> None:
+    rows = make_overview_rows(total=120)
+    pages = {
+        start: render_screener_page(
+            rows[start - 1 : start + 19], total=120, start=start
+        )
+        for start in range(1, 121, 20)
+    }
+    in_flight: ty.List[int] = [0, 0]
+
+    class SlowClient(FakeAsyncClient):
+        async def fetch(
+            self,
+            path: str,
+            query_params: ty.Optional[ty.Dict[str, ty.Any]] = None,
+        ) -> str:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight)
+            try:
+                await asyncio.sleep(0.01)
+                return await super().fetch(path, query_params=query_params)
+            finally:
+                in_flight[0] -= 1
+
+    async def collect() -> ty.List[Overview]:
+        screener = AsyncScreener(client=SlowClient(pages=pages), read_ahead=2)
+        return [item async for item in screener]
+
+    items = asyncio.run(collect())
+
+    assert [x.ticker for x in items] == [x[0] for x in rows]
+    assert in_flight == [0, 2]
+
+
+def test_aio_default_client_is_shared_per_loop() -> None:
+    async def run() -> ty.Tuple[AsyncClient, AsyncClient]:
+        first, second = get_async_client(), get_async_client()
+        await first.close()
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first is second
+    assert first.controller.limit == first.concurrency
+    assert asyncio.run(run())[0] is not first
+
+    async def replace() -> None:
+        client = FakeAsyncClient(pages={})
+        set_async_client(client)
+        quote = await get_quote(ticker="AIOD", cache=TTLCache())
+        assert quote.ticker == "AAPL"
+        assert len(client.calls) == 1
+        set_async_client(None)
+        assert get_async_client() is not client
+        await get_async_client().close()
+
+    asyncio.run(replace())
+
+
+def test_aio_screener_awaits_cancelled_pages() -> None:
+    rows = make_overview_rows(total=120)
+    pages = {
+        start: render_screener_page(
+            rows[start - 1 : start + 19], total=120, start=start
+        )
+        for start in range(1, 121, 20)
+    }
+    client = FakeAsyncClient(pages=pages)
+
+    async def run() -> ty.List[asyncio.Task]:
+        screener = AsyncScreener(client=client, read_ahead=3)
+        iterator = screener.__aiter__()
+        for _ in range(21):
+            await iterator.__anext__()
+        await iterator.aclose()
+        return [x for x in asyncio.all_tasks() if x is not asyncio.current_task()]
+
+    assert asyncio.run(run()) == []
+
+
+def test_aio_cancelled_request_frees_controller_slot() -> None:
+    limiter = RateLimiter(rate=1, burst=1)
+    limiter.pause(seconds=10)
+    controller = ConcurrencyController(limit=1, max_limit=1)
+    client = AsyncClient(rate_limiter=limiter, controller=controller)
+
+    async def run() -> None:
+        task = asyncio.ensure_future(client.fetch("/quote.ashx", {"t": "AAPL"}))
+        await asyncio.sleep(0.01)
+        assert controller.in_flight == 1
+
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        await client.close()
+
+    asyncio.run(run())
+
+    assert controller.in_flight == 0
+    assert controller.limit == 1
+    assert controller.try_acquire() is True
@@ -0,0 +1,128 @@
+import pytest
+
+from finavis import get_quotes
+from finavis.exceptions import TickerNotFoundException
+from finavis.library import Decimal, Quote, Table
+from finavis.utils import TTLCache
+
+from .fakes import make_client, quote_handler
+from .indexes import make_screener_quote_row, render_screener_page
+
+UNLISTED = ("FUND", "NOPE")
+SCREENER_FIELDS = ("price", "short_float_ratio", "earnings_at", "volatility_w")
+
+
+def handler(path, query_params, **kwargs):
+    if path == "/screener.ashx":
+        assert query_params["v"] == Table.CUSTOM
+        assert query_params["c"].startswith("0,1,2,")
+
+        tickers = [x for x in query_params["t"].split(",") if x not in UNLISTED]
+        rows = [make_screener_quote_row(ticker=ticker) for ticker in tickers]
+        return 200, render_screener_page(rows=rows, total=len(rows))
+    return quote_handler(path, query_params, **kwargs)
+
+
+def test_get_quotes_batch() -> None:
+    client, adapter = make_client(handler=handler)
+    tickers = tuple(f"T{index:03d}" for index in range(45))
+
+    quotes = get_quotes(
+        tickers=tickers,
+        client=client,
+        cache=TTLCache(),
+        batch=True,
+        fields=SCREENER_FIELDS,
+    )
+
+    assert [quote.ticker for quote in quotes] == list(tickers)
+    assert len(adapter.calls) == 3
+
+    quote = quotes[0]
+    assert quote.price == Decimal("181.54")
+    assert quote.short_float_ratio == "0.77% / 2.23"
+    assert quote.earnings_market == "AMC"
+    assert quote.earnings_at is not None
+    assert quote.volatility_w is not None
+    assert quote.website is None
+
+
+def test_get_quotes_batch_fallback() -> None:
+    client, adapter = make_client(handler=handler)
+
+    quotes = get_quotes(
+        tickers=("AAPL", "fund", "NOPE"),
+        client=client,
+        cache=TTLCache(),
+        batch=True,
+        on_error="return",
+        fields=SCREENER_FIELDS,
+    )
+
+    assert quotes[0].ticker == "AAPL" and quotes[0].website is None
+    assert quotes[1].website == "http://www.apple.com"
+    assert isinstance(quotes[2], TickerNotFoundException)
+    assert len(adapter.calls) == 3
+
+    with pytest.raises(TickerNotFoundException):
+        get_quotes(tickers=("NOPE",), client=client, cache=TTLCache(), batch=True)
+
+
+def test_get_quotes_batch_fields() -> None:
+    client, adapter = make_client(handler=handler)
+    cache = TTLCache()
+
+    for _ in range(2):
+        get_quotes(
+            tickers=("AAPL",),
+            client=client,
+            cache=cache,
+            batch=True,
+            fields=SCREENER_FIELDS,
+        )
+    assert len(adapter.calls) == 1
+
+    quotes = get_quotes(
+        tickers=("AAPL",), client=client, cache=cache, batch=True, fields=("website",)
+    )
+    assert quotes[0].website == "http://www.apple.com"
+    assert quotes[0].short_float_ratio == "0.77% / 2.23"
+    assert "/quote.ashx" in adapter.calls[-1]
+    assert len(adapter.calls) == 2
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_get_quotes_batch_merges_quote_page(lazy: bool) -> None:
+    client, adapter = make_client(handler=handler)
+    model = Quote.lazy() if lazy else Quote
+
+    quote = get_quotes(
+        tickers=("AAPL",), client=client, cache=TTLCache(), batch=True, model=model
+    )[0]
+
+    assert quote.website == "http://www.apple.com"
+    assert quote.employees is not None
+    assert quote.short_float_ratio == "0.77% / 2.23"
+    assert quote.volatility_w == Decimal("1.44")
+    assert quote.to_dict()["website"] == "http://www.apple.com"
+    assert len(adapter.calls) == 2
+
+
+def test_get_quotes_batch_failed_page_falls_back() -> None:
+    def failing(path, query_params, **kwargs):
+        if path == "/screener.ashx":
+            return 503, ""
+        return quote_handler(path, query_params, **kwargs)
+
+    client, adapter = make_client(handler=failing)
+
+    quotes = get_quotes(
+        tickers=("AAPL", "MSFT"),
+        client=client,
+        cache=TTLCache(),
+        batch=True,
+        fields=SCREENER_FIELDS,
+    )
+
+    assert all(quote.website is not None for quote in quotes)
+    assert len([x for x in adapter.calls if "/quote.ashx" in x]) == 2
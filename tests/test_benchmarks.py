@@ -0,0 +1,26 @@
+from benchmarks.suite import compare, get_cases, measure
+
+
+def test_cases_run() -> None:
+    for case in get_cases():
+        assert case.func() is not None
+
+    result = measure(case=get_cases()[-1], min_time=0.0, repeat=1)
+    assert result["items_per_sec"] > 0
+    assert result["peak_kib"] > 0
+
+
+def test_compare() -> None:
+    baseline = {
+        "a": {"usec_per_call": 10.0, "peak_kib": 1.0},
+        "b": {"usec_per_call": 10.0, "peak_kib": 1.0},
+    }
+    results = {
+        "a": {"usec_per_call": 11.0, "peak_kib": 1.0},
+        "b": {"usec_per_call": 20.0, "peak_kib": 2.0},
+        "c": {"usec_per_call": 99.0, "peak_kib": 9.0},
+    }
+
+    assert compare(results=results, baseline=baseline, threshold=0.25) == {
+        "b": {"usec_per_call": 2.0, "peak_kib": 2.0}
+    }
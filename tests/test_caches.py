@@ -0,0 +1,81 @@
+import typing as ty
+
+import pytest
+
+from finavis import get_quote
+from finavis.core.screener import Screener
+from finavis.exceptions import TickerNotFoundException
+from finavis.utils import TTLCache
+
+from .fakes import make_client, quote_handler
+from .indexes import make_overview_rows, render_screener_page
+
+
+class FakeTimer:
+    def __init__(self) -> None:
+        self.now: float = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ttl_cache_expiration_and_eviction() -> None:
+    timer = FakeTimer()
+    cache = TTLCache(maxsize=2, ttl=10, timer=timer)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    cache.set("c", 3)
+    assert "b" not in cache
+    assert cache.evictions == 1
+
+    timer.now = 11
+    assert cache.get("a") is None
+    assert cache.expirations == 1
+    assert cache.stats["hits"] == 1
+    assert cache.stats["misses"] == 1
+
+    cache.set("d", 4)
+    assert cache.invalidate("d") is True
+    assert cache.invalidate("d") is False
+
+
+def test_get_quote_cache_and_negative_cache() -> None:
+    client, adapter = make_client(handler=quote_handler)
+    cache = TTLCache()
+
+    assert get_quote(ticker="AAPL", client=client, cache=cache).ticker == "AAPL"
+    assert get_quote(ticker="aapl", client=client, cache=cache).ticker == "AAPL"
+    assert len(adapter.calls) == 1
+
+    for _ in range(2):
+        with pytest.raises(TickerNotFoundException):
+            get_quote(ticker="NOPE", client=client, cache=cache)
+    assert len(adapter.calls) == 2
+    assert cache.hits == 2
+
+    cache.invalidate("quote:AAPL")
+    get_quote(ticker="AAPL", client=client, cache=cache)
+    assert len(adapter.calls) == 3
+
+
+def test_screener_pages_shared_cache() -> None:
+    rows = make_overview_rows(total=25)
+
+    def handler(path: str, query_params: dict, **kwargs: ty.Any) -> tuple:
+        start = int(query_params["r"])
+        return 200, render_screener_page(rows[start - 1 : start + 19], 25, start)
+
+    client, adapter = make_client(handler=handler)
+    cache = TTLCache()
+
+    assert len(Screener(client=client, cache=cache)()) == 25
+    assert len(adapter.calls) == 2
+
+    screener = Screener(client=client, cache=cache)
+    assert len(list(screener.iter())) == 25
+    assert screener.total == 25
+    assert screener.pages == 2
+    assert len(adapter.calls) == 2
@@ -0,0 +1,70 @@
+import csv
+import io
+import json
+
+import pytest
+
+from finavis.cli import get_client, get_parser, get_tickers, main
+from finavis.utils import Client, MetricsRegistry
+
+from .fakes import make_client, quote_handler
+from .indexes import make_overview_rows, render_screener_page
+
+
+def test_get_tickers() -> None:
+    file = io.StringIO("aapl, msft\n# comment\nNOPE  AAPL # dup\n")
+
+    assert get_tickers(values=["intc"], file=file) == ("INTC", "AAPL", "MSFT", "NOPE")
+
+
+def test_cli_defaults_match_client() -> None:
+    args = get_parser().parse_args(["quote", "AAPL"])
+    client = get_client(args=args)
+
+    assert client.timeout == Client().timeout
+
+
+@pytest.mark.parametrize("value", ["0", "-1", "nan", "fast"])
+def test_cli_rejects_rate(value: str, capsys) -> None:
+    with pytest.raises(SystemExit):
+        get_parser().parse_args(["quote", "AAPL", "--rate", value])
+
+    assert "--rate" in capsys.readouterr().err
+
+
+def test_cli_quote(monkeypatch, capsys) -> None:
+    client, adapter = make_client(handler=quote_handler, metrics=MetricsRegistry())
+    monkeypatch.setattr("sys.stdin", io.StringIO("AAPL\nMSFT NOPE\n"))
+
+    code = main(["quote", "--fields", "ticker,price", "--concurrency", "2"], client)
+
+    out, err = capsys.readouterr()
+    lines = [json.loads(line) for line in out.splitlines()]
+    assert code == 1
+    assert len(lines) == 2
+    assert set(lines[0]) == {"ticker", "price"}
+    assert isinstance(lines[0]["price"], float)
+    assert "NOPE: " in err
+    assert "finavis quote: 2 written, 1 failed" in err
+    assert "3 requests" in err
+    assert len(adapter.calls) == 3
+
+
+def test_cli_screen(tmp_path, capsys) -> None:
+    rows = make_overview_rows(total=30)
+
+    def handler(path: str, query_params: dict, **kwargs) -> tuple:
+        start = int(query_params["r"])
+        return 200, render_screener_page(rows[start - 1 : start + 19], len(rows), start)
+
+    client, _ = make_client(handler=handler)
+    code = main(["screen", "--format", "csv", "-q"], client)
+
+    out, err = capsys.readouterr()
+    assert code == 0
+    assert err == ""
+    assert [row[0] for row in csv.reader(io.StringIO(out))][1:] == [x[0] for x in rows]
+
+    path = tmp_path / "screen.ndjson"
+    assert main(["screen", "-o", str(path), "-q"], client) == 0
+    assert len(path.read_text().splitlines()) == 30
@@ -0,0 +1,80 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from finavis.core import get_quote
+from finavis.exceptions import TickerNotFoundException
+from finavis.utils import MetricsRegistry, SingleFlight, TTLCache, make_request
+
+from .fakes import make_client, quote_handler
+
+
+def slow_quote_handler(path: str, query_params: dict, **kwargs) -> tuple:
+    time.sleep(0.05)
+    return quote_handler(path, query_params, **kwargs)
+
+
+def test_single_flight() -> None:
+    flights = SingleFlight()
+    calls = list()
+    barrier = threading.Barrier(4)
+
+    def func() -> int:
+        calls.append(1)
+        time.sleep(0.05)
+        return len(calls)
+
+    def call(_: int) -> tuple:
+        barrier.wait()
+        return flights.do(key="key", func=func)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(call, range(4)))
+
+    assert len(calls) == 1
+    assert [result for result, _ in results] == [1] * 4
+    assert sorted(is_shared for _, is_shared in results) == [False, True, True, True]
+    assert len(flights) == 0
+    assert flights.do(key="key", func=func) == (2, False)
+
+
+def test_get_quote_coalesced() -> None:
+    metrics = MetricsRegistry()
+    client, adapter = make_client(handler=slow_quote_handler, metrics=metrics)
+
+    def call(ticker: str) -> object:
+        return get_quote(ticker=ticker, client=client, cache=TTLCache())
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        quotes = list(executor.map(call, ["AAPL"] * 8))
+
+    assert len(adapter.calls) == 1
+    assert all(quote is quotes[0] for quote in quotes)
+    assert metrics.coalesced.get(kind="quote") == 7
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(call, "NOPE") for _ in range(4)]
+
+    for future in futures:
+        with pytest.raises(TickerNotFoundException):
+            future.result()
+    assert len(adapter.calls) == 2
+
+
+def test_make_request_coalesced() -> None:
+    client, adapter = make_client(handler=slow_quote_handler)
+
+    def call(_: int) -> object:
+        return make_request(path="/quote.ashx", query_params={"t": "A"}, client=client)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        documents = list(executor.map(call, range(4)))
+    assert len(adapter.calls) == 1
+    assert all(document is documents[0] for document in documents)
+
+    client.coalesce = False
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(call, range(4)))
+    assert len(adapter.calls) == 5
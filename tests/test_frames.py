@@ -0,0 +1,68 @@
+import pytest
+
+from finavis.core.screener import Screener
+from finavis.library import Frame, Overview
+
+from .fakes import make_client
+from .indexes import EXAMPLE_OVERVIEW_ROW, make_overview_rows, render_screener_page
+
+ROWS = [
+    EXAMPLE_OVERVIEW_ROW,
+    ("INTC", "Intel Corp", "Technology", "Semiconductors", "USA")
+    + (None, None, "45.10", "1.50%", "1,000"),
+    ("XYZ", "Foo", None, None, "Canada", "500.00M", "-1.5", "2", "0%", "25"),
+]
+
+
+def test_frame_from_rows() -> None:
+    frame = Frame.from_rows(model=Overview, rows=ROWS)
+
+    assert len(frame) == 3
+    assert frame["price"].kind == "float64"
+    assert frame["volume"].kind == "int64"
+    assert frame["sector"].kind == "category"
+    assert frame["ticker"].kind == "string"
+    assert frame["market_cap"].to_list() == [2823.46e9, None, 500e6]
+    assert frame["market_cap"].null_count == 1
+    assert frame["volume"].to_list() == [27070101, 1000, 25]
+    assert frame["sector"].categories == ["Technology"]
+    assert frame["sector"].to_list() == ["Technology", "Technology", None]
+    assert frame.to_dict()["change"] == [-0.2, 1.5, 0.0]
+
+
+def test_frame_exports() -> None:
+    pytest.importorskip("numpy")
+    pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+
+    frame = Frame.from_rows(model=Overview, rows=ROWS)
+
+    arrays = frame.to_numpy()
+    assert arrays["p_e"].mask.tolist() == [False, True, False]
+    assert arrays["volume"].dtype.name == "int64"
+
+    table = frame.to_arrow()
+    assert table.num_rows == 3
+    assert table.column("market_cap").null_count == 1
+    assert str(table.schema.field("industry").type).startswith("dictionary")
+
+    df = frame.to_pandas()
+    assert str(df["volume"].dtype) == "Int64"
+    assert str(df["price"].dtype) == "Float64"
+    assert str(df["country"].dtype) == "category"
+    assert df["p_e"].isna().tolist() == [False, True, False]
+
+
+def test_screener_to_frame() -> None:
+    rows = make_overview_rows(total=30)
+
+    def handler(path: str, query_params: dict, **kwargs: object) -> tuple:
+        start = int(query_params["r"])
+        return 200, render_screener_page(rows[start - 1 : start + 19], 30, start)
+
+    client, adapter = make_client(handler=handler)
+    frame = Screener(client=client).to_frame()
+
+    assert len(frame) == 30
+    assert frame["ticker"].to_list() == [x[0] for x in rows]
+    assert len(adapter.calls) == 2
@@ -0,0 +1,65 @@
+import asyncio
+
+import pytest
+
+from finavis.utils import ConcurrencyController, RateLimiter
+from finavis.utils.limits import get_retry_after
+
+
+def test_rate_limiter_burst_and_rate() -> None:
+    limiter = RateLimiter(rate=10, burst=2)
+
+    assert limiter.reserve() == 0
+    assert limiter.reserve() == 0
+    assert limiter.reserve() == pytest.approx(0.1, abs=0.01)
+    assert limiter.reserve() == pytest.approx(0.2, abs=0.01)
+
+
+def test_rate_limiter_pause() -> None:
+    limiter = RateLimiter(rate=10, burst=5)
+    limiter.pause(seconds=2)
+
+    assert limiter.reserve() == pytest.approx(2.1, abs=0.01)
+
+
+def test_rate_limiter_async_queue_depth() -> None:
+    limiter = RateLimiter(rate=100, burst=1)
+
+    async def run() -> int:
+        tasks = [asyncio.ensure_future(limiter.acquire_async()) for _ in range(5)]
+        await asyncio.sleep(0)
+        depth = limiter.queue_depth
+        await asyncio.gather(*tasks)
+        return depth
+
+    assert asyncio.run(run()) == 4
+    assert limiter.queue_depth == 0
+
+
+def test_controller_aimd() -> None:
+    limiter = RateLimiter(rate=10, burst=1)
+    controller = ConcurrencyController(limiter=limiter, limit=4, max_limit=8)
+
+    for _ in range(20):
+        controller.acquire()
+        controller.release(latency=0.1, status_code=200)
+    assert controller.limit > 4
+    assert controller.in_flight == 0
+
+    limit = controller.limit
+    controller.acquire()
+    controller.release(latency=0.1, status_code=429, retry_after="3")
+    assert controller.limit == limit // 2
+    assert limiter.rate == 5
+    assert limiter.reserve() > 3
+
+    assert controller.try_acquire() is True
+    controller.release(latency=0.1, status_code=None)
+    assert controller.limit == max(1, limit // 4)
+
+
+def test_get_retry_after() -> None:
+    assert get_retry_after(value=None) is None
+    assert get_retry_after(value="120") == 120
+    assert get_retry_after(value="Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert get_retry_after(value="foo") is None
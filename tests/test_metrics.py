@@ -0,0 +1,76 @@
+from finavis import Screener, get_quote
+from finavis.utils import MetricsRegistry, TTLCache, get_kind
+
+from .fakes import make_client, quote_handler
+from .indexes import make_overview_rows, render_screener_page
+
+
+def handler(path, query_params, **kwargs):
+    if path == "/screener.ashx":
+        return 200, render_screener_page(rows=make_overview_rows(total=5), total=5)
+    return quote_handler(path, query_params, **kwargs)
+
+
+def test_counter_and_histogram() -> None:
+    metrics = MetricsRegistry()
+    events = list()
+    metrics.add_hook(lambda name, value, labels: events.append((name, value)))
+
+    counter = metrics.counter("hits_total", labels=("kind", "status"))
+    counter.inc(kind="quote", status="200")
+    counter.inc(2, kind="quote", status="200")
+    assert counter.get(kind="quote", status="200") == 3
+    assert counter.get(kind="quote", status="404") == 0
+    assert metrics.counter("hits_total", labels=("kind", "status")) is counter
+
+    histogram = metrics.histogram("took_seconds", buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 5.0):
+        histogram.observe(value, kind="quote")
+    assert histogram.get(kind="quote") == dict(
+        buckets={"0.1": 1, "1.0": 2, "inf": 3}, sum=5.55, count=3
+    )
+
+    assert events[0] == ("hits_total", 1)
+    assert len(events) == 5
+    assert 'took_seconds_bucket{kind="quote",le="+Inf"} 3' in metrics.to_text()
+    assert metrics.snapshot()["hits_total"]["values"] == {"kind=quote,status=200": 3}
+
+    metrics.reset()
+    assert histogram.get(kind="quote")["count"] == 0
+
+
+def test_client_metrics() -> None:
+    metrics = MetricsRegistry()
+    client, _ = make_client(handler=handler, metrics=metrics)
+
+    get_quote(ticker="AAPL", client=client, cache=TTLCache())
+    assert len(Screener(client=client)()) == 5
+
+    for kind in ("quote", "screener"):
+        assert metrics.requests.get(kind=kind, status="200") == 1
+        assert metrics.latency.get(kind=kind)["count"] == 1
+        assert metrics.ttfb.get(kind=kind)["count"] == 1
+        assert metrics.parse.get(kind=kind)["count"] == 1
+        assert metrics.extract.get(kind=kind)["count"] == 1
+        assert metrics.build.get(kind=kind)["count"] == 1
+        assert metrics.response_bytes.get(kind=kind) > 0
+
+    assert get_kind(path="/quote.ashx") == "quote"
+
+
+def test_stream_screener_metrics() -> None:
+    metrics = MetricsRegistry()
+    client, _ = make_client(handler=handler, metrics=metrics)
+
+    assert len(Screener(client=client, stream=True)()) == 5
+    assert metrics.extract.get(kind="screener")["count"] == 1
+    assert metrics.build.get(kind="screener")["count"] >= 1
+    assert metrics.requests.get(kind="screener", status="200") == 1
+
+
+def test_client_metrics_disabled() -> None:
+    metrics = MetricsRegistry(enabled=False)
+    client, _ = make_client(handler=handler, metrics=metrics)
+
+    get_quote(ticker="AAPL", client=client, cache=TTLCache())
+    assert metrics.snapshot()["finavis_requests_total"]["values"] == {}
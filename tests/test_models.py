@@ -1,7 +1,18 @@
 import datetime as dt
 
-from finavis.library.models import Quote
+import attr
+import pytest
+
+from finavis.library import Numeric
+from finavis.library.models import (
+    Overview,
+    Quote,
+    get_converters,
+    get_earnings,
+    to_decimal,
+)
 from finavis.library.types import Decimal
+from finavis.utils import text_to_decimal
 
 from .indexes import EXAMPLE_QUOTE_RAW
 
@@ -28,3 +39,120 @@ def test_quote_building_from_raw_data() -> None:
     assert "52w_high" in quote.to_dict()
     assert quote.to_dict()["52w_high"] == quote.ttm_high
     assert quote.is_filled is True
+
+
+def test_quote_compact_and_frozen() -> None:
+    compact = Quote.compact()
+    frozen = Quote.compact(frozen=True)
+
+    assert compact is Quote.compact()
+    assert compact.__name__ == "CompactQuote"
+
+    quote = compact.from_response(raw=dict(EXAMPLE_QUOTE_RAW))
+    assert not hasattr(quote, "__dict__")
+    assert quote.p_e == Decimal("29.62")
+    assert quote.index == ("DJIA", "NDX", "S&P 500")
+    assert quote.to_dict()["52w_high"] == quote.ttm_high
+    assert quote.is_filled is True
+
+    quote = frozen.from_response(raw=dict(EXAMPLE_QUOTE_RAW))
+    with pytest.raises(attr.exceptions.FrozenInstanceError):
+        quote.price = Decimal("1")
+
+
+def test_quote_lazy() -> None:
+    lazy = Quote.lazy()
+    assert lazy is Quote.lazy()
+    assert lazy.__name__ == "LazyQuote"
+    assert lazy.__annotations__ == Quote.__annotations__
+
+    quote = lazy.from_response(raw=dict(EXAMPLE_QUOTE_RAW))
+    assert isinstance(quote, Quote)
+    assert quote.__dict__ == {}
+
+    today = dt.date.today()
+    assert quote.price == Decimal("181.54")
+    assert (quote.earnings_at.month, quote.earnings_at.day) == (11, 2)
+    assert quote.earnings_at >= today
+    assert quote.earnings_at.year in (today.year, today.year + 1)
+    assert set(quote.__dict__) == {"price", "earnings_market", "earnings_at"}
+
+    eager = Quote.from_response(raw=dict(EXAMPLE_QUOTE_RAW))
+    assert quote.to_dict() == eager.to_dict()
+    assert list(quote.to_dict()) == list(eager.to_dict())
+    assert attr.asdict(quote) == attr.asdict(eager)
+
+    quote = lazy.from_response(raw=dict(EXAMPLE_QUOTE_RAW), numeric="float")
+    assert quote.volume == 27070101
+    assert quote.volatility_m == 1.31
+
+    quote = Overview.lazy().from_response(raw=dict(ticker="A", price="1.5"))
+    assert quote.price == Decimal("1.5")
+    assert quote.sector is None
+
+    with pytest.raises(AttributeError):
+        quote.unknown
+
+    with pytest.raises(TypeError):
+        Quote.compact().lazy()
+
+
+def test_quote_numeric_float() -> None:
+    quote = Quote.from_response(raw=dict(EXAMPLE_QUOTE_RAW), numeric=Numeric.FLOAT)
+
+    assert isinstance(quote.p_e, float)
+    assert quote.p_e == 29.62
+    assert quote.market_cap == 2823.46e9
+    assert quote.volume == 27070101
+    assert isinstance(quote.volume, int)
+    assert quote.volatility_w == 1.44
+
+    overview = Overview.compact().from_response(
+        raw=dict(ticker="AAPL", price="1.5", volume="1,000"), numeric="float"
+    )
+    assert overview.price == 1.5
+    assert overview.volume == 1000
+
+
+def test_from_responses() -> None:
+    quotes = Quote.from_responses(rows=[EXAMPLE_QUOTE_RAW] * 3)
+
+    assert len(quotes) == 3
+    assert quotes[0] == quotes[2] == Quote.from_response(raw=EXAMPLE_QUOTE_RAW)
+    assert quotes[0].earnings_at is quotes[1].earnings_at
+
+    overviews = Overview.compact().from_responses(
+        rows=[dict(ticker="A", market_cap="1.5B", volume="1,234")],
+        numeric=Numeric.FLOAT,
+    )
+    assert overviews[0].market_cap == 1.5e9
+    assert overviews[0].volume == 1234
+
+
+def test_get_converters() -> None:
+    converters = dict(get_converters(Overview, Numeric.DECIMAL))
+
+    assert get_converters(Overview, Numeric.DECIMAL) is get_converters(
+        Overview, "decimal"
+    )
+    assert converters["ticker"] is None
+    assert converters["price"] is to_decimal
+    assert "is_optionable" not in dict(get_converters(Quote, Numeric.DECIMAL))
+
+
+@pytest.mark.parametrize("value", ("2.5B", "1.234M", "-1.5M", "3.3333M", "0.5B"))
+def test_to_decimal_suffix(value: str) -> None:
+    assert to_decimal(value=value) == text_to_decimal(value=value)
+
+
+def test_get_earnings() -> None:
+    today = dt.date(2026, 10, 18)
+
+    assert get_earnings(value="Nov 02 AMC", today=today) == (
+        "AMC",
+        dt.date(2026, 11, 2),
+    )
+    assert get_earnings(value="Jan 28 BMO", today=today) == (
+        "BMO",
+        dt.date(2027, 1, 28),
+    )
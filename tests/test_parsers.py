@@ -0,0 +1,46 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from finavis.core.parsers import SNAPSHOT_LABELS, QuoteParser, ScreenerRowParser
+from finavis.core.screener import Screener
+from finavis.utils import parse_document
+
+from .fakes import FIXTURES, QUOTE_PAGE
+
+
+def test_quote_parser() -> None:
+    data = QuoteParser().parse(raw=parse_document(text=QUOTE_PAGE))
+
+    assert data["ticker"] == "AAPL"
+    assert data["company"] == "Apple Inc"
+    assert data["website"] == "http://www.apple.com"
+    assert data["exchange"] == "NASD"
+    assert data["index"] == "DJIA, NDX, S&P 500"
+    assert data["eps_next_y"] == "7.12"
+    assert data["eps_growth_next_y"] == "8.61%"
+    assert len(data) == len(SNAPSHOT_LABELS) + 8
+
+
+def test_quote_parser_threads() -> None:
+    parser = QuoteParser()
+    documents = [parse_document(text=QUOTE_PAGE) for _ in range(8)]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(parser.parse, documents))
+
+    assert all(result == results[0] for result in results)
+
+
+def test_screener_row_parser() -> None:
+    text = (FIXTURES / "screener.html").read_text()
+    parser = ScreenerRowParser()
+
+    rows = list()
+    for index in range(0, len(text), 64):
+        rows.extend(parser.feed(text[index : index + 64]))
+        if parser.is_done:
+            break
+
+    assert parser.total_text == "#1 / 200 Total"
+    assert rows == list(Screener()._get_rows(raw=parse_document(text=text)))
+    assert rows[0][0] == "T0000"
+    assert parser.close() == []
@@ -0,0 +1,43 @@
+import pytest
+
+from finavis import get_quotes, iter_quotes
+from finavis.exceptions import TickerNotFoundException
+from finavis.library import Quote
+
+from .fakes import make_client, quote_handler
+
+TICKERS = ("AAPL", "NOPE", "INTC", "QCOM")
+
+
+def test_get_quotes_raise() -> None:
+    client, _ = make_client(handler=quote_handler)
+
+    with pytest.raises(TickerNotFoundException):
+        get_quotes(tickers=TICKERS, client=client, max_workers=4)
+
+
+def test_get_quotes_skip_and_return() -> None:
+    client, adapter = make_client(handler=quote_handler)
+
+    result = get_quotes(tickers=TICKERS, client=client, on_error="skip")
+    assert len(result) == 3
+    assert all(isinstance(x, Quote) for x in result)
+
+    result = get_quotes(tickers=TICKERS, client=client, on_error="return")
+    assert len(result) == 4
+    assert isinstance(result[0], Quote)
+    assert isinstance(result[1], TickerNotFoundException)
+
+
+def test_get_quotes_wrong_on_error() -> None:
+    with pytest.raises(TypeError):
+        get_quotes(tickers=TICKERS, on_error="ignore")
+
+
+def test_iter_quotes() -> None:
+    client, _ = make_client(handler=quote_handler)
+
+    result = dict(iter_quotes(tickers=TICKERS, client=client, on_error="return"))
+    assert set(result.keys()) == set(TICKERS)
+    assert isinstance(result["NOPE"], TickerNotFoundException)
+    assert isinstance(result["QCOM"], Quote)
@@ -0,0 +1,159 @@
+import time
+import typing as ty
+
+import pytest
+
+from finavis.core.screener import Screener
+from finavis.library import Column, Decimal, Frame, Overview, Table
+from finavis.utils import TTLCache
+
+from .fakes import make_client
+from .indexes import make_overview_rows, render_screener_page
+
+ROWS = make_overview_rows(total=105)
+
+
+def screener_handler(path: str, query_params: dict, **kwargs: ty.Any) -> tuple:
+    start = int(query_params["r"])
+    time.sleep(0.001 * (105 - start) / 20)
+    return 200, render_screener_page(ROWS[start - 1 : start + 19], len(ROWS), start)
+
+
+def test_screener_parallel_pages_keep_order() -> None:
+    client, adapter = make_client(handler=screener_handler)
+    screener = Screener(client=client, max_workers=4, read_ahead=2)
+
+    items = list(screener.iter())
+
+    assert [x.ticker for x in items] == [x[0] for x in ROWS]
+    assert screener.total == 105
+    assert screener.pages == 6
+    assert len(adapter.calls) == 6
+
+
+def test_screener_serial_pages() -> None:
+    client, adapter = make_client(handler=screener_handler)
+    screener = Screener(client=client, max_workers=1)
+
+    assert [x.ticker for x in screener.iter()] == [x[0] for x in ROWS]
+    assert len(adapter.calls) == 6
+
+
+def test_screener_items_are_per_instance() -> None:
+    client, adapter = make_client(handler=screener_handler)
+
+    first = Screener(client=client)
+    assert len(first()) == 105
+    assert len(first) == 105
+    assert len(Screener(client=client)) == 0
+
+    assert first() is first()
+    assert len(adapter.calls) == 6
+
+
+def test_screener_iter_streaming() -> None:
+    client, adapter = make_client(handler=screener_handler)
+
+    screener = Screener(client=client, max_workers=1)
+    iterator = screener.iter()
+    assert next(iterator).ticker == "T0000"
+    assert len(adapter.calls) == 1
+
+    assert len(list(iterator)) == 104
+    assert len(screener) == 0
+
+    screener = Screener(client=client, keep_items=True)
+    assert len(list(screener.iter())) == 105
+    assert len(screener) == 105
+    assert len(list(screener.iter())) == 105
+    assert len(adapter.calls) == 12
+
+
+def test_screener_stream() -> None:
+    client, adapter = make_client(handler=screener_handler)
+    cache = TTLCache()
+    screener = Screener(client=client, cache=cache, stream=True, read_ahead=2)
+
+    assert [x.ticker for x in screener.iter()] == [x[0] for x in ROWS]
+    assert screener.total == 105
+    assert len(adapter.calls) == 6
+
+    frame = Screener(client=client, cache=cache, stream=True).to_frame()
+    assert frame.to_dict()["ticker"] == [x[0] for x in ROWS]
+    assert len(adapter.calls) == 6
+
+
+def test_screener_lazy_model() -> None:
+    client, _ = make_client(handler=screener_handler)
+    eager = Screener(client=client)()
+
+    for stream in (False, True):
+        screener = Screener(client=client, model=Overview.lazy(), stream=stream)
+        items = list(screener.iter())
+        assert [x.to_dict() for x in items] == [x.to_dict() for x in eager]
+        assert items[-1].ticker == ROWS[-1][0]
+
+    frame = Frame.from_rows(model=Overview.lazy(), rows=ROWS)
+    assert frame.to_dict() == Frame.from_rows(model=Overview, rows=ROWS).to_dict()
+
+
+def test_screener_stream_total_after_table() -> None:
+    def handler(path: str, query_params: dict, **kwargs: ty.Any) -> tuple:
+        start = int(query_params["r"])
+        page = render_screener_page(
+            ROWS[start - 1 : start + 19], len(ROWS), start, total_after_table=True
+        )
+        return 200, page
+
+    client, adapter = make_client(handler=handler)
+    screener = Screener(client=client, stream=True, max_workers=2)
+
+    assert [x.ticker for x in screener.iter()] == [x[0] for x in ROWS]
+    assert screener.total == 105
+    assert len(adapter.calls) == 6
+
+
+def test_screener_stream_wo_total() -> None:
+    client, _ = make_client(handler=lambda *args, **kwargs: (200, "<p>ok</p>"))
+
+    assert Screener(client=client, stream=True)() == []
+
+
+def test_screener_custom_columns() -> None:
+    rows = [(f"T{index:04d}", "12.5", "-3.10%", "1.2B") for index in range(25)]
+
+    def handler(path: str, query_params: dict, **kwargs: ty.Any) -> tuple:
+        assert query_params["v"] == "152"
+        assert query_params["c"] == "0,1,7,53,6"
+        start = int(query_params["r"])
+        return 200, render_screener_page(rows[start - 1 : start + 19], len(rows), start)
+
+    client, adapter = make_client(handler=handler)
+    screener = Screener(client=client, columns=["p_e", "sma50", Column.MARKET_CAP])
+
+    items = list(screener.iter())
+    assert len(items) == 25
+    assert len(adapter.calls) == 2
+    assert items[0].to_dict() == dict(
+        ticker="T0000",
+        p_e=Decimal("12.5"),
+        sma50=Decimal("-3.10"),
+        market_cap=Decimal("1200000000"),
+    )
+    assert not hasattr(items[0], "__dict__")
+
+    frame = Screener(client=client, columns=["p_e", "sma50", "market_cap"]).to_frame()
+    assert list(frame.to_dict()) == ["ticker", "p_e", "sma50", "market_cap"]
+    assert frame.to_dict()["p_e"] == [12.5] * 25
+
+
+def test_screener_custom_columns_validation() -> None:
+    with pytest.raises(TypeError):
+        Screener(columns=["unknown"])
+
+    with pytest.raises(TypeError):
+        Screener(table=Table.CUSTOM)
+
+    screener = Screener(columns=["ticker", "price", "price"])
+    assert screener.columns == (Column.TICKER, Column.PRICE)
+    assert screener._get_query_params()["c"] == "0,1,65"
@@ -0,0 +1,65 @@
+import pytest
+from requests.adapters import HTTPAdapter
+
+from finavis.utils import (
+    Client,
+    ConcurrencyController,
+    RateLimiter,
+    get_client,
+    make_request,
+    set_client,
+)
+
+from .fakes import FakeAdapter, make_client
+
+
+def test_client_pool_settings() -> None:
+    client = Client(pool_connections=4, pool_maxsize=32, headers={"X-Foo": "bar"})
+    adapter = client.session.get_adapter("https://finviz.com/")
+
+    assert isinstance(adapter, HTTPAdapter)
+    assert adapter._pool_maxsize == 32  # type: ignore[attr-defined]
+    assert adapter._pool_connections == 4  # type: ignore[attr-defined]
+    assert client.session.headers["X-Foo"] == "bar"
+
+
+def test_client_reuses_session() -> None:
+    client, adapter = make_client()
+    user_agent = client.session.headers["User-Agent"]
+
+    for _ in range(3):
+        raw = make_request(path="/quote.ashx", query_params={"t": "A"}, client=client)
+        assert raw.text_content() == "ok"
+
+    assert len(adapter.calls) == 3
+    assert client.session.headers["User-Agent"] == user_agent
+
+
+def test_default_client_is_shared() -> None:
+    assert get_client() is get_client()
+
+    client = Client()
+    set_client(client)
+    try:
+        assert get_client() is client
+    finally:
+        set_client(None)
+
+    assert get_client() is not client
+
+
+def test_client_frees_controller_slot_if_not_sent() -> None:
+    class FailingLimiter(RateLimiter):
+        def acquire(self) -> None:
+            raise KeyboardInterrupt
+
+    controller = ConcurrencyController(limit=1, max_limit=1)
+    client = Client(rate_limiter=FailingLimiter(rate=1), controller=controller)
+    adapter = FakeAdapter()
+    client.session.mount("https://", adapter)
+
+    with pytest.raises(KeyboardInterrupt):
+        make_request(path="/quote.ashx", query_params={"t": "A"}, client=client)
+
+    assert adapter.calls == []
+    assert controller.in_flight == 0
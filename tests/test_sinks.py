@@ -0,0 +1,111 @@
+import csv
+import io
+import json
+import typing as ty
+
+import pytest
+
+from finavis.core.screener import Screener
+from finavis.library import CsvSink, NdjsonSink, Overview, ParquetSink, Quote, get_sink
+from finavis.library.sinks import get_column_type
+
+from .fakes import make_client
+from .indexes import EXAMPLE_OVERVIEW_ROW, EXAMPLE_QUOTE_RAW, render_screener_page
+
+OVERVIEWS = [
+    Overview.from_response(raw=dict(zip(Overview.__annotations__, row)))
+    for row in [EXAMPLE_OVERVIEW_ROW, ("XYZ", "Foo") + (None,) * 8]
+]
+
+
+def test_csv_sink() -> None:
+    file = io.StringIO()
+    with CsvSink(file, batch_size=1) as sink:
+        assert sink.write_all(OVERVIEWS + [ValueError("XYZ")]) == 2
+
+    assert sink.skipped == 1
+    rows = list(csv.reader(io.StringIO(file.getvalue())))
+    assert rows[0] == list(Overview.__annotations__)
+    assert rows[1][0] == "AAPL"
+    assert rows[1][5] == "2823460000000"
+    assert rows[2] == ["XYZ", "Foo"] + [""] * 8
+
+
+def test_ndjson_sink() -> None:
+    quote = Quote.from_response(raw=dict(EXAMPLE_QUOTE_RAW))
+    file = io.StringIO()
+    with NdjsonSink(
+        file, fields=("ticker", "market_cap", "index", "earnings_at")
+    ) as sink:
+        sink.write_all([quote])
+
+    line = json.loads(file.getvalue())
+    assert line["ticker"] == quote.ticker
+    assert line["market_cap"] == "2823460000000"
+    assert line["index"] == list(quote.index)
+    assert line["earnings_at"] == quote.earnings_at.isoformat()
+
+
+def test_ndjson_sink_floats() -> None:
+    quote = Quote.from_response(raw=dict(EXAMPLE_QUOTE_RAW), numeric="float")
+    file = io.StringIO()
+    with NdjsonSink(file, fields=("price",)) as sink:
+        sink.write_all([quote])
+
+    assert json.loads(file.getvalue())["price"] == quote.price
+
+
+def test_column_type() -> None:
+    assert get_column_type(name="price", annotation="Decimal") == "float64"
+    assert get_column_type(name="volume", annotation="Decimal") == "int64"
+    assert get_column_type(name="ipo", annotation="ty.Optional[dt.date]") == "date32"
+    assert (
+        get_column_type(name="index", annotation=ty.Optional[ty.Tuple[str, ...]])
+        == "list"
+    )
+    assert get_column_type(name="points", annotation=int) == "int64"
+    assert get_column_type(name="interval", annotation="Hint") == "string"
+    assert get_column_type(name="vote", annotation="ty.Optional[Candidate]") == "string"
+
+
+def test_parquet_sink(tmp_path) -> None:
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    path = tmp_path / "overviews.parquet"
+    with get_sink(str(path), batch_size=1) as sink:
+        sink.write_all(OVERVIEWS)
+
+    table = pq.read_table(path)
+    assert pq.ParquetFile(path).num_row_groups == 2
+    assert str(table.schema.field("volume").type) == "int64"
+    assert str(table.schema.field("price").type) == "double"
+    assert table.column("market_cap").to_pylist() == [2823.46e9, None]
+    assert table.column("volume").to_pylist() == [27070101, None]
+
+
+def test_get_sink(tmp_path) -> None:
+    assert isinstance(get_sink(str(tmp_path / "a.jsonl")), NdjsonSink)
+    assert isinstance(get_sink(tmp_path / "a.csv"), CsvSink)
+    assert isinstance(get_sink(io.BytesIO(), format="parquet"), ParquetSink)
+
+    with pytest.raises(TypeError):
+        get_sink(str(tmp_path / "a.xlsx"))
+
+    sink = get_sink(str(tmp_path / "empty.csv"))
+    sink.close()
+    assert not (tmp_path / "empty.csv").exists()
+
+
+def test_screener_to_sink(tmp_path) -> None:
+    rows = [(f"T{index:04d}",) + EXAMPLE_OVERVIEW_ROW[1:] for index in range(45)]
+
+    def handler(path: str, query_params: dict, **kwargs) -> tuple:
+        start = int(query_params["r"])
+        return 200, render_screener_page(rows[start - 1 : start + 19], len(rows), start)
+
+    client, _ = make_client(handler=handler)
+    with get_sink(str(tmp_path / "screen.ndjson"), batch_size=10) as sink:
+        assert sink.write_all(Screener(client=client).iter()) == 45
+
+    lines = (tmp_path / "screen.ndjson").read_text().splitlines()
+    assert [json.loads(line)["ticker"] for line in lines] == [x[0] for x in rows]
@@ -0,0 +1,59 @@
+import pytest
+
+from finavis.core.screener import Screener
+from finavis.library import Overview, Snapshot
+
+from .fakes import make_client
+from .indexes import make_overview_rows, render_screener_page
+
+FIELDS = ("ticker", "price", "change")
+
+
+def test_snapshot_diff() -> None:
+    previous = Snapshot.from_rows(
+        fields=FIELDS, rows=[("A", "1.00", "1%"), ("B", "2.00", "2%"), ("C", "3", "-")]
+    )
+    current = Snapshot.from_rows(
+        fields=FIELDS, rows=[("A", "1.00", "1%"), ("B", "2.10", "2%"), ("D", "4", "4%")]
+    )
+
+    delta = current.diff(previous=previous)
+    assert delta.added == dict(D=dict(ticker="D", price="4", change="4%"))
+    assert delta.removed == ("C",)
+    assert delta.changed == dict(B=dict(price=("2.00", "2.10")))
+    assert len(delta) == 3
+
+    assert not current.diff(previous=current)
+    assert len(current.diff(previous=None).added) == 3
+
+    with pytest.raises(TypeError):
+        current.diff(previous=Snapshot(fields=("ticker",)))
+
+
+@pytest.mark.parametrize("name", ["snapshot.json", "snapshot.json.gz"])
+def test_snapshot_save_and_load(tmp_path, name: str) -> None:
+    snapshot = Snapshot.from_rows(fields=FIELDS, rows=[("A", "1.00", None)])
+    snapshot.save(path=str(tmp_path / name))
+
+    loaded = Snapshot.load(path=str(tmp_path / name))
+    assert loaded.fields == FIELDS
+    assert loaded.rows == snapshot.rows
+    assert loaded.created_at == snapshot.created_at
+    assert loaded.get("A") == dict(ticker="A", price="1.00", change=None)
+    assert not loaded.diff(previous=snapshot)
+
+
+def test_screener_to_snapshot() -> None:
+    rows = make_overview_rows(total=25)
+
+    def handler(path: str, query_params: dict, **kwargs) -> tuple:
+        start = int(query_params["r"])
+        return 200, render_screener_page(rows[start - 1 : start + 19], len(rows), start)
+
+    client, adapter = make_client(handler=handler)
+    snapshot = Screener(client=client).to_snapshot()
+
+    assert len(snapshot) == 25
+    assert snapshot.fields == tuple(Overview.__annotations__.keys())
+    assert "T0024" in snapshot
+    assert Overview.from_response(raw=snapshot.get("T0000")).ticker == "T0000"
@@ -0,0 +1,95 @@
+import sqlite3
+import time
+import typing as ty
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from finavis import get_quote
+from finavis.utils import PageCache, TTLCache
+
+from .fakes import QUOTE_PAGE, make_client
+
+
+def test_page_cache_roundtrip(tmp_path) -> None:
+    cache = PageCache(path=str(tmp_path / "pages.sqlite3"), ttl=60)
+
+    assert cache.get(path="/quote.ashx", query_params={"t": "AAPL"}) is None
+
+    cache.set("/quote.ashx", {"t": "AAPL"}, body=QUOTE_PAGE, etag='"v1"')
+    entry = cache.get(path="/quote.ashx", query_params={"t": "AAPL"})
+    assert entry is not None
+    assert entry.body == QUOTE_PAGE
+    assert entry.is_fresh(ttl=60)
+    assert entry.get_conditional_headers() == {"If-None-Match": '"v1"'}
+
+    reopened = PageCache(path=str(tmp_path / "pages.sqlite3"))
+    assert reopened.get(path="/quote.ashx", query_params={"t": "AAPL"}) is not None
+
+    assert cache.prune(older_than=-1) == 1
+    assert cache.invalidate(path="/quote.ashx", query_params={"t": "AAPL"}) is False
+
+
+def test_client_revalidates_stale_pages(tmp_path) -> None:
+    statuses: ty.List[int] = list()
+
+    def handler(path: str, query_params: dict, headers: dict) -> tuple:
+        if headers.get("If-None-Match") == '"v1"':
+            statuses.append(304)
+            return 304, "", {"ETag": '"v1"'}
+
+        statuses.append(200)
+        return 200, QUOTE_PAGE, {"ETag": '"v1"'}
+
+    page_cache = PageCache(path=str(tmp_path / "pages.sqlite3"), ttl=60)
+    client, adapter = make_client(handler=handler)
+    client.page_cache = page_cache
+
+    get_quote(ticker="AAPL", client=client, cache=TTLCache())
+    get_quote(ticker="AAPL", client=client, cache=TTLCache())
+    assert statuses == [200]
+
+    page_cache.ttl = 0
+    quote = get_quote(ticker="AAPL", client=client, cache=TTLCache())
+    assert quote.ticker == "AAPL"
+    assert statuses == [200, 304]
+
+    entry = page_cache.get(path="/quote.ashx", query_params={"t": "AAPL"})
+    assert entry is not None
+    assert entry.fetched_at > time.time() - 5
+
+
+def test_page_cache_closes_connections_of_every_thread(tmp_path) -> None:
+    cache = PageCache(path=str(tmp_path / "pages.sqlite3"))
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        list(executor.map(lambda _: cache.get(path="/quote.ashx"), range(6)))
+
+    connections = list(cache._connections)
+    assert len(connections) >= 2
+
+    cache.close()
+    for connection in connections:
+        with pytest.raises(sqlite3.ProgrammingError):
+            connection.execute("SELECT 1")
+
+    cache.set("/quote.ashx", None, body=QUOTE_PAGE)
+    assert cache.get(path="/quote.ashx") is not None
+    cache.close()
+
+
+def test_client_caches_only_ok_pages(tmp_path) -> None:
+    def handler(path: str, query_params: dict, **kwargs: ty.Any) -> tuple:
+        if query_params.get("t") == "MOVED":
+            return 302, "", {"Location": "/quote.ashx?t=AAPL"}
+        return 200, QUOTE_PAGE
+
+    page_cache = PageCache(path=str(tmp_path / "pages.sqlite3"), ttl=60)
+    client, _ = make_client(handler=handler)
+    client.page_cache = page_cache
+
+    client.fetch(path="/quote.ashx", query_params={"t": "MOVED"})
+    client.fetch(path="/quote.ashx", query_params={"t": "AAPL"})
+
+    assert page_cache.get(path="/quote.ashx", query_params={"t": "MOVED"}) is None
+    assert page_cache.get(path="/quote.ashx", query_params={"t": "AAPL"}) is not None
@@ -0,0 +1,130 @@
+import time
+import typing as ty
+
+import pytest
+from requests import Session
+
+from finavis import Screener, get_quote, get_quotes
+from finavis.exceptions import RequestNotRecordedException, TickerNotFoundException
+from finavis.utils import (
+    Client,
+    ConcurrencyController,
+    RateLimiter,
+    Transport,
+    TTLCache,
+    load_recordings,
+)
+
+from .fakes import FakeAdapter, make_client, quote_handler
+from .indexes import make_overview_rows, render_screener_page
+
+
+def handler(path, query_params, **kwargs):
+    if path == "/screener.ashx":
+        start = int(query_params["r"])
+        rows = make_overview_rows(total=45)[start - 1 : start + 19]
+        return 200, render_screener_page(rows=rows, total=45, start=start)
+    return quote_handler(path, query_params, **kwargs)
+
+
+def make_replay_client(path, **kwargs):
+    return Client(
+        rate_limiter=RateLimiter(rate=10_000, burst=10_000),
+        controller=ConcurrencyController(limit=32),
+        transport=Transport(mode="replay", path=path, **kwargs),
+    )
+
+
+def test_transport_record_and_replay(tmp_path) -> None:
+    path = str(tmp_path / "records" / "finviz.jsonl.gz")
+
+    client, adapter = make_client(handler=handler)
+    Transport(mode="record", path=path).mount(session=client.session)
+    with client:
+        recorded = get_quotes(tickers=("AAPL", "INTC"), client=client, cache=TTLCache())
+        with pytest.raises(TickerNotFoundException):
+            get_quote(ticker="NOPE", client=client, cache=TTLCache())
+        assert len(Screener(client=client)()) == 45
+
+    assert len(adapter.calls) == 6
+    assert len(list(load_recordings(path=path))) == 6
+
+    with make_replay_client(path=path) as client:
+        quotes = get_quotes(tickers=("INTC", "AAPL"), client=client, cache=TTLCache())
+        assert quotes[1] == recorded[0]
+        with pytest.raises(TickerNotFoundException):
+            get_quote(ticker="NOPE", client=client, cache=TTLCache())
+        assert [x.ticker for x in Screener(client=client, max_workers=2).iter()] == [
+            row[0] for row in make_overview_rows(total=45)
+        ]
+
+        with pytest.raises(RequestNotRecordedException):
+            get_quote(ticker="MSFT", client=client, cache=TTLCache())
+
+
+def test_transport_replay_latency(tmp_path) -> None:
+    path = str(tmp_path / "finviz.jsonl.gz")
+
+    client, _ = make_client(handler=handler)
+    Transport(mode="record", path=path).mount(session=client.session)
+    with client:
+        get_quote(ticker="AAPL", client=client, cache=TTLCache())
+
+    with make_replay_client(path=path, latency=0.05) as client:
+        started_at = time.monotonic()
+        get_quote(ticker="AAPL", client=client, cache=TTLCache())
+        assert time.monotonic() - started_at >= 0.05
+
+
+def test_transport_wrong_args() -> None:
+    with pytest.raises(TypeError):
+        Transport(mode="rewind")
+
+    with pytest.raises(TypeError):
+        Transport(mode="replay")
+
+
+def test_transport_keeps_adapter_per_session(tmp_path) -> None:
+    path = str(tmp_path / "finviz.jsonl.gz")
+    closed: ty.List[str] = list()
+
+    class ClosingAdapter(FakeAdapter):
+        def close(self) -> None:
+            closed.append(self.name)
+
+    transport = Transport(mode="record", path=path)
+    adapters = dict()
+    for name in ("main", "proxy"):
+        session = Session()
+        adapters[name] = ClosingAdapter(handler=quote_handler)
+        adapters[name].name = name
+        session.mount("https://", adapters[name])
+        transport.mount(session=session)
+        transport.mount(session=session)
+        session.get("https://finviz.com/quote.ashx", params={"t": name.upper()})
+
+    assert [len(x.calls) for x in adapters.values()] == [1, 1]
+    assert [x.query_params["t"] for x in load_recordings(path=path)] == [
+        "MAIN",
+        "PROXY",
+    ]
+
+    transport.close()
+    assert closed == ["main", "proxy"]
+
+
+def test_transport_replay_miss_is_not_throttling(tmp_path) -> None:
+    path = str(tmp_path / "finviz.jsonl.gz")
+
+    client, _ = make_client(handler=handler)
+    Transport(mode="record", path=path).mount(session=client.session)
+    get_quote(ticker="AAPL", client=client, cache=TTLCache())
+
+    client = make_replay_client(path=path)
+    limit = client.controller.limit
+    for _ in range(3):
+        with pytest.raises(RequestNotRecordedException):
+            get_quote(ticker="MSFT", client=client, cache=TTLCache())
+
+    assert client.controller.limit == limit
+    assert client.controller.in_flight == 0
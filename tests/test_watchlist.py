@@ -0,0 +1,128 @@
+import queue
+import threading
+import time
+
+import pytest
+
+from finavis.core import Watchlist
+from finavis.library import Decimal
+from finavis.utils import TTLCache
+
+from .fakes import QUOTE_PAGE, make_client
+
+
+def make_handler(prices: dict) -> tuple:
+    calls = list()
+
+    def handler(path: str, query_params: dict, **kwargs) -> tuple:
+        calls.append(query_params["t"])
+        price = prices.get(query_params["t"], "181.54")
+        return 200, QUOTE_PAGE.replace(">181.54<", f">{price}<")
+
+    return handler, calls
+
+
+def test_watchlist_changes() -> None:
+    now = [100.0]
+    prices = dict()
+    handler, calls = make_handler(prices=prices)
+    client, _ = make_client(handler=handler)
+    changes = queue.Queue()
+    cache = TTLCache()
+
+    watchlist = Watchlist(
+        ["aapl", "msft", "intc", "amd"],
+        interval=60,
+        client=client,
+        cache=cache,
+        queue=changes,
+        timer=lambda: now[0],
+    )
+    received = list()
+    watchlist.subscribe(received.append)
+
+    assert watchlist.run_pending() == 1
+    now[0] += 15
+    assert watchlist.run_pending() == 1
+    now[0] += 30
+    assert watchlist.run_pending() == 2
+    assert calls == ["AAPL", "MSFT", "INTC", "AMD"]
+
+    first = changes.get_nowait()
+    assert first.is_new
+    assert first.ticker == "AAPL"
+    assert first.changes["price"] == (None, Decimal("181.54"))
+    assert cache.get("quote:AAPL") is first.quote
+
+    prices["AAPL"] = "182.00"
+    now[0] += 15
+    assert watchlist.run_pending() == 1
+    now[0] += 15
+    assert watchlist.run_pending() == 1
+    assert calls[4:] == ["AAPL", "MSFT"]
+
+    change = received[-1]
+    assert change.ticker == "AAPL"
+    assert change.changes == dict(price=(Decimal("181.54"), Decimal("182.00")))
+    assert watchlist.get("AAPL").price == Decimal("182.00")
+    assert watchlist.refreshes == 6
+    assert watchlist.changes == 5
+    assert len(received) == changes.qsize() + 1
+
+
+def test_watchlist_staggers_from_start() -> None:
+    now = [0.0]
+    handler, calls = make_handler(prices=dict())
+    client, _ = make_client(handler=handler)
+    watchlist = Watchlist(
+        ["aapl", "msft", "intc"], interval=60, client=client, timer=lambda: now[0]
+    )
+
+    now[0] += 600
+    assert watchlist.run_pending() == 1
+    now[0] += 20
+    assert watchlist.run_pending() == 1
+    assert calls == ["AAPL", "MSFT"]
+
+
+def test_watchlist_priority_and_remove() -> None:
+    now = [0.0]
+    handler, calls = make_handler(prices=dict())
+    client, _ = make_client(handler=handler)
+    watchlist = Watchlist(interval=60, client=client, timer=lambda: now[0])
+
+    watchlist.add("AAPL", priority=4)
+    watchlist.add("MSFT")
+    assert watchlist.run_pending() == 2
+    assert calls == ["AAPL", "MSFT"]
+
+    now[0] += 15
+    assert watchlist.run_pending() == 1
+    watchlist.remove("AAPL")
+    now[0] += 45
+    assert watchlist.run_pending() == 1
+    assert calls == ["AAPL", "MSFT", "AAPL", "MSFT"]
+
+    with pytest.raises(TypeError):
+        watchlist.add("INTC", priority=0)
+
+
+def test_watchlist_background() -> None:
+    handler, calls = make_handler(prices=dict())
+    client, _ = make_client(handler=handler)
+    done = threading.Event()
+
+    def on_change(change) -> None:
+        if len(calls) == 10:
+            done.set()
+
+    watchlist = Watchlist(
+        [f"T{index}" for index in range(10)], interval=0.2, budget=100, client=client
+    )
+    watchlist.subscribe(on_change)
+    with watchlist:
+        assert done.wait(timeout=5)
+        time.sleep(0.05)
+
+    assert sorted(calls[:10]) == sorted(f"T{index}" for index in range(10))
+    assert watchlist.errors == 0